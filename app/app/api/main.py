@@ -4,29 +4,273 @@ Main FastAPI application module for the Employee Search RAG system.
 This module provides the FastAPI application and endpoints for the employee search
 system. It integrates the retriever and LLM chain components to provide a REST API
 for querying employee information.
+
+Importing this module is cheap: the ML stack (LangChain, FAISS, the embedding
+model) is imported and loaded by the lifespan handler in the background, so
+the server binds its port immediately and reports readiness on ``/readyz``.
+
+The employee data and everything built from it form one ServingState. A
+change to the data file (or ``POST /admin/reload``) builds a new state in the
+background and swaps it in; each request uses the state it started with.
 """
 
+import asyncio
+import functools
+import json
 import logging
-from fastapi import FastAPI, HTTPException, Query
+import math
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from langchain_core.documents import Document
+from starlette.background import BackgroundTask
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable
 from app.core.config import settings
-from app.core.schemas import ChatRequest, ChatResponse, SearchRequest, SearchResponse
-from app.services.llm_service import get_qa_chain
-from app.services.data_service import load_employee_docs
-from app.core.prompts import prompt_hr_queries
+from app.core.schemas import (
+    ChatBatchRequest, ChatBatchResponse, ChatBatchResult, ChatRequest, ChatResponse, Employee, EmployeeWrite,
+    SearchBatchRequest, SearchBatchResponse, SearchRequest, SearchResponse
+)
+from app.api.middleware import MetricsMiddleware
+from app.services.data_service import load_employee_docs, save_employee_docs
+from app.services.journal_service import (
+    append_journal, clear_journal, journal_length, journal_path, journal_size, read_journal
+)
+from app.services.cache_service import SemanticCache
+from app.services.scheduler_service import LLMScheduler, SchedulerBusyError
+from app.services.metrics_service import Gauge, registry, timed_stage
+from app.services.reload_service import IndexReloader, ServingState
+from app.services.ollama_service import (
+    OllamaUnavailableError, check_ollama_available, close_ollama_pool, ollama_status
+)
+from app.services.router_service import answer_structured, route_query
+from app.services.search_service import EMPLOYEE_FIELDS, EmployeeSearchIndex, decode_cursor, parse_sort, resolve_sort
+from app.services.session_service import ChatSession, SessionStore
+from app.services.warmup_service import Readiness, warm_up_embeddings, warm_up_llm
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Set by the lifespan handler once loaded; endpoints answer 503 until then
+qa_chain = None
+
+readiness = Readiness()
+
+# Bounds concurrent Ollama generations and queues the excess
+llm_scheduler = LLMScheduler()
+
+# Multi-turn chat sessions keyed by the client's session_id
+sessions = SessionStore()
+
+# Serializes employee writes so the data file and both indexes stay in step
+write_lock = threading.Lock()
+
+# Held while the write journal is folded into the data file and indexes
+compaction_lock = threading.Lock()
+
+registry.register(Gauge(
+    "rag_llm_queue_waiting", "Requests waiting for an LLM generation slot.",
+    function=lambda: llm_scheduler.waiting
+))
+registry.register(Gauge(
+    "rag_llm_running", "LLM generations in progress.",
+    function=lambda: llm_scheduler.running
+))
+registry.register(Gauge(
+    "rag_chat_sessions", "Live chat sessions.",
+    function=lambda: len(sessions)
+))
+
+def build_state(version: int, fingerprint: Any, previous: Optional[ServingState]) -> ServingState:
+    """
+    Load the employee data and load or build the vector store.
+
+    With SHARED_SNAPSHOT the employee table is not parsed: employees are
+    searched in the memory-mapped snapshot persisted with the vector store,
+    which all workers share. Writes recorded in the journal since the last
+    compaction are then replayed. On reloads the embedding model and the
+    query batcher of the previous state are reused.
+
+    Args:
+        version (int): Version number of the new state.
+        fingerprint (Any): Fingerprint of the data the state is built from.
+        previous (ServingState, optional): State being replaced, None on startup.
+
+    Returns:
+        ServingState: The employee data and indexes.
+    """
+    from app.services.retriever_service import get_retriever, get_vector_store
+
+    embeddings = previous.vector_store.embedding_function if previous is not None else None
+    employees = None
+    if settings.SHARED_SNAPSHOT:
+        from app.services.snapshot_service import SnapshotSearchIndex
+
+        vector_store = get_vector_store(embeddings=embeddings)
+        search_index = SnapshotSearchIndex(vector_store.snapshot)
+        # Describe the files actually loaded, which a rebuild has just rewritten
+        fingerprint = vector_store.manifest["data_hash"], vector_store.manifest, fingerprint[2]
+    else:
+        employees = load_employee_docs()
+        search_index = EmployeeSearchIndex(employees)
+
+        # Load or build the vector store
+        vector_store = get_vector_store(employees, embeddings)
+
+    entries, journaled = read_journal()
+    if entries:
+        logger.info(f"Replaying {len(entries)} journaled employee writes")
+        apply_writes(entries, search_index, vector_store)
+    fingerprint = (*fingerprint[:2], journaled)
+
+    retriever = get_retriever(
+        vector_store,
+        batcher=previous.retriever.batcher if previous is not None else None,
+        search_index=search_index
+    )
+    if previous is not None:
+        retriever.context_token_budget = previous.retriever.context_token_budget
+    if settings.HYBRID_SEARCH_ENABLED:
+        # Mapped from the shared files with SHARED_SNAPSHOT, built here otherwise
+        vector_store.load_lexical_index()
+
+    # Serves near-identical questions without retrieval or generation
+    answer_cache = SemanticCache(version=answer_cache_version(vector_store, fingerprint))
+
+    skill_synonyms = None
+    if settings.SKILL_SYNONYMS_ENABLED:
+        from app.services.synonym_service import SkillSynonyms
+
+        # Embedded with the query model, bypassing the persistent embedding cache
+        skill_synonyms = SkillSynonyms(search_index.skill_vocabulary(), vector_store.embedding_function)
+
+    return ServingState(
+        version, fingerprint, search_index, vector_store, retriever, answer_cache, skill_synonyms, employees
+    )
+
+def data_fingerprint() -> Any:
+    """
+    Identify the data a state is built from: the data file, the shared index
+    files with SHARED_SNAPSHOT, and the size of the write journal.
+    """
+    from app.services.retriever_service import compute_data_hash, read_manifest
+
+    return compute_data_hash(), read_manifest() if settings.SHARED_SNAPSHOT else None, journal_size()
+
+def answer_cache_version(vector_store: Any, fingerprint: Any) -> str:
+    """Version of the data answers are cached for: the persisted index and the writes journaled since."""
+    return f"{vector_store.version}+{fingerprint[2]}"
+
+def watched_paths() -> List[str]:
+    """Files whose changes trigger a reload."""
+    from app.services.data_service import resolve_data_path
+    from app.services.retriever_service import MANIFEST_FILENAME
+
+    # The journal changes when another worker writes an employee
+    paths = [resolve_data_path(settings.DATA_PATH), journal_path(settings.DATA_PATH)]
+    if settings.SHARED_SNAPSHOT:
+        # Another worker saved employee writes to the shared index
+        paths.append(os.path.join(settings.VECTOR_STORE_PATH, MANIFEST_FILENAME))
+    return paths
+
+def rebind_chain(state: ServingState) -> None:
+    """Point the QA chain at a newly swapped-in state's retriever."""
+    global qa_chain
+    if qa_chain is not None:
+        qa_chain = qa_chain.with_retriever(state.retriever)
+
+# Builds and swaps the serving state; writes made during a build are replayed onto it under write_lock
+reloader = IndexReloader(build_state, data_fingerprint, watched_paths, write_lock, on_swap=rebind_chain)
+
+registry.register(Gauge(
+    "rag_embedding_queue_depth", "Queries waiting for the embedding batcher.",
+    function=lambda: (
+        reloader.state.retriever.batcher.pending
+        if reloader.state is not None and reloader.state.retriever.batcher is not None else 0
+    )
+))
+
+def chain_for(state: ServingState) -> Any:
+    """Return the QA chain retrieving from a state, which may be older than the current one."""
+    chain = qa_chain
+    if chain.retriever is state.retriever:
+        return chain
+    return chain.with_retriever(state.retriever)
+
+def load_index() -> None:
+    """Load the employee data and indexes as the first serving state."""
+    reloader.load()
+
+def load_llm() -> None:
+    """Connect to Ollama, warm the model up and build the QA chain."""
+    global qa_chain
+    from app.services.llm_service import get_llm, get_qa_chain
+    from app.core.prompts import prompt_follow_up, prompt_hr_queries
+
+    llm = get_llm()
+    if settings.WARMUP_ENABLED:
+        warm_up_llm(llm)
+    qa_chain = get_qa_chain(
+        prompt=prompt_hr_queries, retriever=reloader.state.retriever, llm=llm, follow_up_prompt=prompt_follow_up
+    )
+
+async def start_services() -> None:
+    """
+    Load and warm up the application components in the background.
+
+    The index is loaded first, then the embedding model is warmed up, then
+    the LLM; Ollama is retried every WARMUP_RETRY_INTERVAL seconds until it
+    answers. Progress is recorded in ``readiness``. Once the index is loaded,
+    the data file is watched for changes.
+    """
+    try:
+        await asyncio.to_thread(load_index)
+        readiness.mark_ready("index")
+        reloader.start()
+
+        if settings.WARMUP_ENABLED:
+            await asyncio.to_thread(warm_up_embeddings, reloader.state.vector_store.embedding_function)
+        readiness.mark_ready("embeddings")
+    except Exception as e:
+        logger.error(f"Error loading the employee index: {str(e)}")
+        readiness.mark_failed("index", str(e))
+        return
+
+    while True:
+        try:
+            await asyncio.to_thread(load_llm)
+            readiness.mark_ready("llm")
+            return
+        except Exception as e:
+            logger.warning(f"LLM not ready, retrying in {settings.WARMUP_RETRY_INTERVAL}s: {str(e)}")
+            readiness.mark_failed("llm", str(e))
+            await asyncio.sleep(settings.WARMUP_RETRY_INTERVAL)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start loading the application in the background and stop it on shutdown."""
+    startup = asyncio.create_task(start_services())
+    yield
+    startup.cancel()
+    reloader.stop()
+    await close_ollama_pool()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Employee Search RAG API",
     description="API for searching employee information using RAG",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -36,17 +280,82 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load employee data at startup
-employees = load_employee_docs()
+def not_ready(component: str) -> HTTPException:
+    """Build the 503 returned while a component is still loading."""
+    return HTTPException(
+        status_code=503,
+        detail=f"Service is starting, {component} not ready",
+        headers={"Retry-After": str(settings.LLM_RETRY_AFTER)}
+    )
+
+def require_index() -> None:
+    """Dependency rejecting requests until the employee index is loaded."""
+    if not readiness.is_ready("index"):
+        raise not_ready("index")
+
+def require_chain(state: ServingState) -> Any:
+    """
+    Return the QA chain for a state, rejecting the request until it is available.
+
+    Called only for questions the chain answers: routed and cached answers
+    do not need the LLM.
+    """
+    if qa_chain is None:
+        raise not_ready("llm")
+    return chain_for(state)
+
+@app.get("/healthz")
+async def healthz():
+    """
+    Liveness probe; succeeds as long as the process serves requests.
+
+    Returns:
+        Dict[str, str]: Static status.
+    """
+    return {"status": "ok"}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Expose request, stage, retrieval and LLM metrics in the Prometheus text format.
+
+    Returns:
+        PlainTextResponse: Prometheus exposition text.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/readyz")
+async def readyz():
+    """
+    Readiness probe; succeeds once the index is loaded and the models are warm.
+
+    Returns:
+        JSONResponse: Component readiness, with status 200 when ready and 503 otherwise.
+    """
+    status = readiness.status()
+    status["ollama"] = ollama_status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+def chat_filters(request: ChatRequest) -> Dict[str, Any]:
+    """Collect the explicit retrieval pre-filters set on a chat request."""
+    return request.model_dump(include={"skills", "min_experience", "availability"}, exclude_none=True)
 
-# Initialize QA chain
-qa_chain = get_qa_chain(prompt=prompt_hr_queries)
+async def embed_query(state: ServingState, query: str) -> List[float]:
+    """Embed a query through the retriever's batcher without blocking the event loop."""
+    with timed_stage("embed"):
+        return await state.retriever.batcher.embed(query)
 
-@app.post("/chat", response_model=ChatResponse)
+@app.post("/chat", response_model=ChatResponse, dependencies=[Depends(require_index)])
 async def chat(request: ChatRequest):
     """
     Chat endpoint for employee information.
 
+    Filter-style questions ("list available people with React") are
+    answered from structured search with a templated response, without
+    retrieval or the LLM. With a ``session_id`` the request is one turn of a
+    conversation: follow-up questions are answered about the employees of
+    the previous answer, and the answer cache is bypassed.
+
     Args:
         request (ChatRequest): The chat request containing the query.
 
@@ -59,76 +368,852 @@ async def chat(request: ChatRequest):
     try:
         if not request.query:
             raise HTTPException(status_code=400, detail="Query is empty")
-            
-        response = qa_chain.invoke(request.query)
+
+        state = reloader.state
+        filters = chat_filters(request)
+        with timed_stage("route"):
+            route, extracted = route_query(request.query, state.search_index, filters)
+
+        if request.session_id:
+            session = sessions.get_or_create(request.session_id)
+            async with session.lock:
+                if route is not None:
+                    with timed_stage("structured_answer"):
+                        response, employee_ids = answer_structured(state.search_index, route)
+                    session.record_turn(request.query, response, employee_ids)
+                    return ChatResponse(response=response, session_id=session.session_id)
+                chain = require_chain(state)
+                check_ollama_available()
+                # Retrieval runs outside the slot, which only bounds generations
+                docs = await chain.aretrieve_in_session(session, request.query, filters)
+                async with llm_scheduler.slot():
+                    response, _ = await chain.ainvoke_in_session(session, request.query, filters, docs)
+            return ChatResponse(response=response, session_id=session.session_id)
+
+        if route is not None:
+            with timed_stage("structured_answer"):
+                response, _ = answer_structured(state.search_index, route)
+            return ChatResponse(response=response)
+
+        # Answers are cached per query only, so filtered requests bypass the cache
+        query_vector = None
+        if settings.ANSWER_CACHE_ENABLED and not filters:
+            query_vector = await embed_query(state, request.query)
+            with timed_stage("cache_lookup"):
+                cached = state.answer_cache.lookup(query_vector)
+            if cached is not None:
+                return ChatResponse(response=cached["response"])
+
+        chain = require_chain(state)
+        check_ollama_available()
+        # Retrieval runs outside the slot, which only bounds generations
+        docs = await chain.aretrieve(request.query, filters, extracted)
+        async with llm_scheduler.slot():
+            response = await chain.agenerate(request.query, docs)
+
+        if query_vector is not None:
+            from app.services.llm_service import get_employee_ids
+            state.answer_cache.store(query_vector, request.query, response, get_employee_ids(docs))
         return ChatResponse(response=response)
-        
+
+    except HTTPException:
+        raise
+    except SchedulerBusyError as e:
+        raise busy_exception(e)
+    except OllamaUnavailableError as e:
+        raise unavailable_exception(e)
     except Exception as e:
         logger.error(f"Error processing chat request: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-from fastapi import Query
+def busy_exception(error: SchedulerBusyError) -> HTTPException:
+    """Convert a scheduler rejection into an HTTP error with Retry-After."""
+    return HTTPException(
+        status_code=error.status_code,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+def unavailable_exception(error: OllamaUnavailableError) -> HTTPException:
+    """Convert an open Ollama circuit into a 503 with Retry-After."""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(math.ceil(error.retry_after))}
+    )
+
+def retrieval_exception(error: Exception) -> HTTPException:
+    """Convert a failed retrieval before a stream starts into a 500."""
+    logger.error(f"Error retrieving context for chat stream: {str(error)}")
+    return HTTPException(status_code=500, detail=str(error))
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def hold_session(session: ChatSession, release: Callable[[], None]) -> Callable[[], None]:
+    """
+    Extend a scheduler slot release to also release a held session lock, once.
+
+    The stream and its background task both call the release; releasing the
+    lock twice could free a later turn's hold on it.
+    """
+    released = False
+
+    def release_turn() -> None:
+        nonlocal released
+        if released:
+            return
+        released = True
+        try:
+            release()
+        finally:
+            session.lock.release()
+
+    return release_turn
+
+async def stream_chat_events(
+    state: ServingState,
+    query: str,
+    release: Callable[[], None],
+    query_vector: Optional[List[float]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    session: Optional[ChatSession] = None,
+    extracted: Optional[Dict[str, Any]] = None,
+    docs: Optional[List[Document]] = None
+) -> AsyncIterator[str]:
+    """
+    Translate QA chain stream events into Server-Sent Events.
+
+    The stream generates from ``docs`` when they were retrieved before the
+    response started, and otherwise retrieves from ``state`` even if a
+    reload replaces it meanwhile. ``release`` returns the LLM scheduler slot
+    held for this stream once it ends or the client disconnects. Completed
+    answers are added to the answer cache when ``query_vector`` is given,
+    or recorded in ``session``.
+    """
+    try:
+        employee_ids: List[int] = []
+        tokens: List[str] = []
+        chain = chain_for(state)
+        if session is not None:
+            events = chain.astream_in_session(session, query, filters, docs)
+        else:
+            events = chain.astream(query, filters, extracted, docs)
+        async for event in events:
+            if "employee_ids" in event:
+                employee_ids = event["employee_ids"]
+                yield format_sse("context", event)
+            else:
+                tokens.append(event["token"])
+                yield format_sse("token", event)
+        yield format_sse("done", {})
+
+        if query_vector is not None:
+            state.answer_cache.store(query_vector, query, "".join(tokens), employee_ids)
+
+    except Exception as e:
+        logger.error(f"Error streaming chat response: {str(e)}")
+        yield format_sse("error", {"detail": str(e)})
+    finally:
+        release()
+
+@app.post("/chat/stream", dependencies=[Depends(require_index)])
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming chat endpoint using Server-Sent Events.
+
+    Emits a ``context`` event with the retrieved employee ids, then one
+    ``token`` event per generated chunk, and finally ``done`` (or ``error``).
+    Filter-style questions are answered from structured search in a single
+    ``token`` event, as in ``/chat``. With a ``session_id`` the stream is one
+    turn of a conversation.
+
+    Args:
+        request (ChatRequest): The chat request containing the query.
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` response.
+
+    Raises:
+        HTTPException: If the query is empty or the LLM queue is saturated.
+    """
+    if not request.query:
+        raise HTTPException(status_code=400, detail="Query is empty")
 
-@app.get("/employees/search", response_model=SearchResponse)
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+    state = reloader.state
+    filters = chat_filters(request)
+    with timed_stage("route"):
+        route, extracted = route_query(request.query, state.search_index, filters)
+
+    if route is not None:
+        with timed_stage("structured_answer"):
+            response, employee_ids = answer_structured(state.search_index, route)
+        if request.session_id:
+            session = sessions.get_or_create(request.session_id)
+            async with session.lock:
+                session.record_turn(request.query, response, employee_ids)
+        events = [
+            format_sse("context", {"employee_ids": employee_ids}),
+            format_sse("token", {"token": response}),
+            format_sse("done", {})
+        ]
+        return StreamingResponse(iter(events), media_type="text/event-stream", headers=headers)
+
+    if request.session_id:
+        chain = require_chain(state)
+        session = sessions.get_or_create(request.session_id)
+        # Held until the stream ends so the next turn continues this one
+        await session.lock.acquire()
+        try:
+            check_ollama_available()
+            # Retrieval runs outside the slot, which only bounds generations
+            docs = await chain.aretrieve_in_session(session, request.query, filters)
+            release = hold_session(session, await llm_scheduler.acquire())
+        except SchedulerBusyError as e:
+            session.lock.release()
+            raise busy_exception(e)
+        except OllamaUnavailableError as e:
+            session.lock.release()
+            raise unavailable_exception(e)
+        except Exception as e:
+            session.lock.release()
+            raise retrieval_exception(e)
+        except BaseException:
+            # The client disconnected while waiting
+            session.lock.release()
+            raise
+
+        return StreamingResponse(
+            stream_chat_events(state, request.query, release, filters=filters, session=session, docs=docs),
+            media_type="text/event-stream",
+            headers=headers,
+            background=BackgroundTask(release)
+        )
+
+    query_vector = None
+    if settings.ANSWER_CACHE_ENABLED and not filters:
+        query_vector = await embed_query(state, request.query)
+        with timed_stage("cache_lookup"):
+            cached = state.answer_cache.lookup(query_vector)
+        if cached is not None:
+            events = [
+                format_sse("context", {"employee_ids": cached["employee_ids"]}),
+                format_sse("token", {"token": cached["response"]}),
+                format_sse("done", {})
+            ]
+            return StreamingResponse(iter(events), media_type="text/event-stream", headers=headers)
+
+    # Admit before the response starts so saturation and outages surface as 429/503
+    chain = require_chain(state)
+    try:
+        check_ollama_available()
+        # Retrieval runs outside the slot, which only bounds generations
+        docs = await chain.aretrieve(request.query, filters, extracted)
+        release = await llm_scheduler.acquire()
+    except SchedulerBusyError as e:
+        raise busy_exception(e)
+    except OllamaUnavailableError as e:
+        raise unavailable_exception(e)
+    except Exception as e:
+        raise retrieval_exception(e)
+
+    # The background task also releases the slot if the stream never starts
+    return StreamingResponse(
+        stream_chat_events(state, request.query, release, query_vector, filters, extracted=extracted, docs=docs),
+        media_type="text/event-stream",
+        headers=headers,
+        background=BackgroundTask(release)
+    )
+
+@app.post("/chat/batch", response_model=ChatBatchResponse, dependencies=[Depends(require_index)])
+async def chat_batch(request: ChatBatchRequest):
+    """
+    Answer many chat requests in one call.
+
+    Filter-style questions are answered from structured search, as in
+    ``/chat``. The other queries are embedded in one batched pass and
+    retrieved with one multi-query vector search. Answers come from the answer cache where
+    possible; the rest are generated with at most CHAT_BATCH_CONCURRENCY
+    generations of this batch in flight, each through the LLM scheduler.
+    Batch items are answered statelessly; their ``session_id`` is ignored.
+
+    Args:
+        request (ChatBatchRequest): Chat requests.
+
+    Returns:
+        ChatBatchResponse: One result per request, in input order, with per-request errors.
+
+    Raises:
+        HTTPException: If the batch is too large or the batch fails.
+    """
+    check_batch_size(len(request.requests))
+
+    try:
+        state = reloader.state
+        items = request.requests
+        results: List[Optional[ChatBatchResult]] = [None] * len(items)
+        for i, item in enumerate(items):
+            if not item.query:
+                results[i] = ChatBatchResult(status_code=400, error="Query is empty")
+
+        extracted_by_item: Dict[int, Dict[str, Any]] = {}
+        with timed_stage("route"):
+            for i, item in enumerate(items):
+                if results[i] is None:
+                    route, extracted_by_item[i] = route_query(item.query, state.search_index, chat_filters(item))
+                    if route is not None:
+                        results[i] = ChatBatchResult(response=answer_structured(state.search_index, route)[0])
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return ChatBatchResponse(results=results)
+
+        with timed_stage("embed"):
+            vectors = await state.retriever.batcher.embed_many([items[i].query for i in pending])
+        vector_by_item = dict(zip(pending, vectors))
+        filters_by_item = {i: chat_filters(items[i]) for i in pending}
+
+        # Answers are cached per query only, so filtered requests bypass the cache
+        if settings.ANSWER_CACHE_ENABLED:
+            with timed_stage("cache_lookup"):
+                for i in pending:
+                    if not filters_by_item[i]:
+                        cached = state.answer_cache.lookup(vector_by_item[i])
+                        if cached is not None:
+                            results[i] = ChatBatchResult(response=cached["response"])
+            pending = [i for i in pending if results[i] is None]
+        if not pending:
+            return ChatBatchResponse(results=results)
+
+        # Routed and cached answers are returned even while the LLM is unavailable
+        try:
+            chain = require_chain(state)
+            check_ollama_available()
+        except HTTPException as e:
+            for i in pending:
+                results[i] = ChatBatchResult(status_code=e.status_code, error=e.detail)
+            return ChatBatchResponse(results=results)
+        except OllamaUnavailableError as e:
+            for i in pending:
+                results[i] = ChatBatchResult(status_code=503, error=str(e))
+            return ChatBatchResponse(results=results)
+
+        docs_by_item = dict(zip(pending, await chain.aretrieve_batch(
+            [items[i].query for i in pending],
+            [vector_by_item[i] for i in pending],
+            [filters_by_item[i] or None for i in pending],
+            [extracted_by_item[i] for i in pending]
+        )))
+
+        concurrency = asyncio.Semaphore(settings.CHAT_BATCH_CONCURRENCY or settings.LLM_MAX_CONCURRENCY)
+
+        async def generate(i: int) -> None:
+            async with concurrency:
+                try:
+                    async with llm_scheduler.slot():
+                        response = await chain.agenerate(items[i].query, docs_by_item[i])
+                    results[i] = ChatBatchResult(response=response)
+                except SchedulerBusyError as e:
+                    results[i] = ChatBatchResult(status_code=e.status_code, error=str(e))
+                    return
+                except OllamaUnavailableError as e:
+                    results[i] = ChatBatchResult(status_code=503, error=str(e))
+                    return
+                except Exception as e:
+                    logger.error(f"Error answering batch item {i}: {str(e)}")
+                    results[i] = ChatBatchResult(status_code=500, error=str(e))
+                    return
+
+            if settings.ANSWER_CACHE_ENABLED and not filters_by_item[i]:
+                from app.services.llm_service import get_employee_ids
+                state.answer_cache.store(vector_by_item[i], items[i].query, response, get_employee_ids(docs_by_item[i]))
+
+        await asyncio.gather(*(generate(i) for i in pending))
+        return ChatBatchResponse(results=results)
+
+    except Exception as e:
+        logger.error(f"Error processing chat batch: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/chat/sessions/{session_id}")
+async def get_chat_session(session_id: str):
+    """
+    Describe a chat session.
+
+    Args:
+        session_id (str): Session identifier.
+
+    Returns:
+        Dict[str, Any]: Turns, employees of the last answer and reused context size.
+
+    Raises:
+        HTTPException: If the session does not exist or has expired.
+    """
+    session = sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return session.summary()
+
+@app.delete("/chat/sessions/{session_id}", status_code=204)
+async def delete_chat_session(session_id: str):
+    """
+    End a chat session.
+
+    Args:
+        session_id (str): Session identifier.
+
+    Raises:
+        HTTPException: If the session does not exist or has expired.
+    """
+    if not sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail="Session not found")
+    return Response(status_code=204)
+
+@app.get("/chat/cache", dependencies=[Depends(require_index)])
+async def chat_cache_stats():
+    """
+    Report answer cache counters.
+
+    Returns:
+        Dict[str, Any]: Hits, misses, hit rate, size and index version.
+    """
+    return reloader.state.answer_cache.stats()
+
+def projected_fields(fields: List[str]) -> List[str]:
+    """
+    Validate a field projection and put it in schema order.
+
+    Args:
+        fields (List[str]): Requested employee fields.
+
+    Returns:
+        List[str]: Fields to serialize, always including ``id``.
+
+    Raises:
+        ValueError: If a field is not an employee field.
+    """
+    requested = {field.strip() for field in fields if field.strip()}
+    unknown = requested - set(EMPLOYEE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [field for field in EMPLOYEE_FIELDS if field == "id" or field in requested]
+
+def search_result_json(
+    search_index: EmployeeSearchIndex,
+    total: int,
+    employee_ids: List[int],
+    next_cursor: Optional[str],
+    fields: Optional[List[str]]
+) -> bytes:
+    """Render the members of a search result object from pre-serialized employees."""
+    return b"".join([
+        b'"total":', str(total).encode("ascii"),
+        b',"employees":', search_index.serialize(employee_ids, fields),
+        b',"next_cursor":', json.dumps(next_cursor).encode("ascii")
+    ])
+
+async def expand_skill_lists(skill_synonyms: Any, skill_lists: List[List[str]]) -> List[List[List[str]]]:
+    """
+    Expand every requested skill into the list of its synonyms.
+
+    Vocabulary skills and override terms expand from the precomputed table;
+    other terms are embedded off the event loop.
+    """
+    flat = [skill for skills in skill_lists for skill in skills]
+    with timed_stage("skill_expansion"):
+        if skill_synonyms.is_known(flat):
+            expanded = skill_synonyms.expand_many(flat)
+        else:
+            expanded = await asyncio.to_thread(skill_synonyms.expand_many, flat)
+
+    groups: List[List[List[str]]] = []
+    start = 0
+    for skills in skill_lists:
+        groups.append(expanded[start:start + len(skills)])
+        start += len(skills)
+    return groups
+
+def check_batch_size(size: int) -> None:
+    """Reject batches larger than BATCH_MAX_SIZE."""
+    if size > settings.BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {size} exceeds the maximum of {settings.BATCH_MAX_SIZE}"
+        )
+
+@app.get("/employees/search", response_model=SearchResponse, dependencies=[Depends(require_index)])
 async def search_employees(
     name: Optional[str] = None,
     skills: Optional[str] = Query(default=None, description="Comma-separated list of skills"),
     min_experience: Optional[int] = None,
-    availability: Optional[str] = None
+    availability: Optional[str] = None,
+    project: Optional[str] = Query(default=None, description="Search by project name"),
+    fuzzy: bool = Query(default=False, description="Also match names and projects with typos"),
+    expand_skills: bool = Query(default=False, description="Also match synonyms of each skill, such as ML for Machine Learning"),
+    sort: Optional[str] = Query(
+        default=None, description="name, experience or relevance, prefixed with - for descending"
+    ),
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.SEARCH_MAX_PAGE_SIZE, description="Employees per page"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated employee fields to return")
 ):
     """
     Search endpoint for employee information.
 
+    The response is assembled from JSON serialized once per employee when it
+    was indexed, so employees are neither re-validated nor re-serialized.
+
     Args:
         name (str, optional): Search by employee name.
         skills (str, optional): Comma-separated list of skills.
         min_experience (int, optional): Minimum years of experience.
         availability (str, optional): Filter by availability status.
+        project (str, optional): Search by project name.
+        fuzzy (bool): Also match names and projects similar to ``name`` and ``project``.
+        expand_skills (bool): Also match employees with a synonym of each requested skill.
+        sort (str, optional): Sort order; relevance for fuzzy searches and load order otherwise if not given.
+        limit (int, optional): Page size, SEARCH_PAGE_SIZE if not given.
+        cursor (str, optional): Cursor returned with the previous page.
+        fields (str, optional): Fields to return; ``id`` is always included.
 
     Returns:
-        SearchResponse: Response containing matching employees.
+        Response: SearchResponse JSON with the page of matching employees.
 
     Raises:
-        HTTPException: If there's an error processing the search.
+        HTTPException: If a parameter is invalid or there's an error processing the search.
     """
     try:
-        filtered_employees = employees.copy()
+        state = reloader.state
+        skill_list = skills.split(",") if skills else None
+        if expand_skills and skill_list and state.skill_synonyms is not None:
+            skill_list = (await expand_skill_lists(state.skill_synonyms, [skill_list]))[0]
+        field_list = projected_fields(fields.split(",")) if fields else None
 
-        # Filter by name
-        if name:
-            filtered_employees = [
-                emp for emp in filtered_employees
-                if name.lower() in emp["name"].lower()
-            ]
+        with timed_stage("employee_search"):
+            total, employee_ids, next_cursor = state.search_index.search_page(
+                name=name,
+                skills=skill_list,
+                min_experience=min_experience,
+                availability=availability,
+                project=project,
+                fuzzy=fuzzy,
+                sort=sort,
+                limit=limit or settings.SEARCH_PAGE_SIZE,
+                cursor=cursor
+            )
 
-        # Filter by skills (comma-separated)
-        if skills:
-            skill_list = [s.strip().lower() for s in skills.split(",")]
-            filtered_employees = [
-                emp for emp in filtered_employees
-                if all(skill in [s.lower() for s in emp["skills"]] for skill in skill_list)
-            ]
+        with timed_stage("serialize"):
+            body = b"".join([
+                b"{", search_result_json(state.search_index, total, employee_ids, next_cursor, field_list),
+                b',"timestamp":', json.dumps(datetime.now().isoformat()).encode("ascii"), b"}"
+            ])
+        return Response(content=body, media_type="application/json")
 
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error processing search request: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Filter by experience
-        if min_experience is not None:
-            filtered_employees = [
-                emp for emp in filtered_employees
-                if emp["experience_years"] >= min_experience
-            ]
 
-        # Filter by availability
-        if availability:
-            filtered_employees = [
-                emp for emp in filtered_employees
-                if emp["availability"].lower() == availability.lower()
-            ]
+@app.post("/employees/search/batch", response_model=SearchBatchResponse, dependencies=[Depends(require_index)])
+async def search_employees_batch(request: SearchBatchRequest):
+    """
+    Evaluate many employee searches in one call.
 
-        return SearchResponse(
-            total=len(filtered_employees),
-            employees=filtered_employees
-        )
+    All valid searches are evaluated together in one pass over the search
+    index. Results are returned in input order; an invalid search gets an
+    error result instead of failing the batch.
+
+    Args:
+        request (SearchBatchRequest): Searches with the parameters of ``/employees/search``.
+
+    Returns:
+        Response: SearchBatchResponse JSON with one result per search.
+
+    Raises:
+        HTTPException: If the batch is too large or there's an error processing it.
+    """
+    check_batch_size(len(request.searches))
+    try:
+        state = reloader.state
+        results: List[bytes] = [b""] * len(request.searches)
+        valid: List[int] = []
+        searches: List[Dict[str, Any]] = []
+        projections: List[Optional[List[str]]] = []
+
+        for i, search in enumerate(request.searches):
+            try:
+                sort = resolve_sort(search.model_dump())
+                parse_sort(sort)
+                if search.cursor:
+                    decode_cursor(search.cursor, sort)
+                projections.append(projected_fields(search.fields) if search.fields else None)
+            except ValueError as e:
+                results[i] = json.dumps(
+                    {"total": 0, "employees": [], "next_cursor": None, "status_code": 400, "error": str(e)}
+                ).encode("utf-8")
+                continue
+            valid.append(i)
+            searches.append({
+                **search.model_dump(exclude={"fields", "limit", "expand_skills"}),
+                "limit": min(search.limit or settings.SEARCH_PAGE_SIZE, settings.SEARCH_MAX_PAGE_SIZE),
+            })
+
+        # Unknown terms of all searches are embedded together
+        expanded = [
+            search for i, search in zip(valid, searches)
+            if request.searches[i].expand_skills and search.get("skills")
+        ]
+        if expanded and state.skill_synonyms is not None:
+            skill_lists = [search["skills"] for search in expanded]
+            for search, skills in zip(expanded, await expand_skill_lists(state.skill_synonyms, skill_lists)):
+                search["skills"] = skills
+
+        with timed_stage("employee_search"):
+            pages = state.search_index.search_page_batch(searches)
+
+        with timed_stage("serialize"):
+            for i, fields, (total, employee_ids, next_cursor) in zip(valid, projections, pages):
+                results[i] = b"".join([
+                    b"{", search_result_json(state.search_index, total, employee_ids, next_cursor, fields),
+                    b',"status_code":200,"error":null}'
+                ])
+            body = b"".join([
+                b'{"results":[', b",".join(results),
+                b'],"timestamp":', json.dumps(datetime.now().isoformat()).encode("ascii"), b"}"
+            ])
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
-        logger.error(f"Error processing search request: {str(e)}")
+        logger.error(f"Error processing search batch: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+def apply_writes(
+    entries: List[Dict[str, Any]],
+    search_index: Any,
+    vector_store: Any,
+    skill_synonyms: Optional[Any] = None
+) -> None:
+    """
+    Apply journaled employee writes to the indexes, oldest first.
+
+    Args:
+        entries (List[Dict[str, Any]]): Writes as recorded by append_journal.
+        search_index (Any): Employee search index to update.
+        vector_store (Any): Vector store to update.
+        skill_synonyms (Any, optional): Skill synonyms to extend with new skills.
+    """
+    for entry in entries:
+        if entry["op"] == "delete":
+            vector_store.delete_employee(entry["id"])
+            search_index.delete(entry["id"])
+            continue
+
+        record = entry["employee"]
+        vector_store.upsert_employee(record)
+        search_index.upsert(record)
+        if skill_synonyms is not None:
+            skill_synonyms.extend(record["skills"])
+
+def advance_fingerprint(state: ServingState, previous: int, size: int) -> None:
+    """Account for a write journaled between sizes ``previous`` and ``size`` in a state's fingerprint and answer cache."""
+    # Writes journaled by other workers are left for the reloader to pick up
+    if previous == state.fingerprint[2]:
+        state.fingerprint = (*state.fingerprint[:2], size)
+    state.answer_cache.set_version(answer_cache_version(state.vector_store, (*state.fingerprint[:2], size)))
+
+def replay_write(state: ServingState, entry: Dict[str, Any], previous: int, size: int) -> None:
+    """Apply a write journaled during a reload to the state being built."""
+    # The build may have read the write from the journal already; applying it again is harmless
+    apply_writes([entry], state.search_index, state.vector_store, state.skill_synonyms)
+    advance_fingerprint(state, previous, size)
+
+def journal_write(entry: Dict[str, Any]) -> None:
+    """
+    Apply an employee write to the served state and record it in the write journal.
+
+    Only the journal line is written to disk. The write is also recorded with
+    the reloader, which replays it onto a state being built. Once
+    JOURNAL_COMPACT_WRITES writes are journaled, and no reload is running,
+    they are folded into the data file and the persisted indexes in the
+    background. Callers hold ``write_lock``.
+
+    Args:
+        entry (Dict[str, Any]): The write, see append_journal.
+    """
+    from app.services.retriever_service import index_lock
+
+    state = reloader.state
+    apply_writes([entry], state.search_index, state.vector_store, state.skill_synonyms)
+    with index_lock(exclusive=True):
+        previous, size = append_journal(entry)
+    advance_fingerprint(state, previous, size)
+    reloader.record(functools.partial(replay_write, entry=entry, previous=previous, size=size))
+
+    if (
+        journal_length() >= settings.JOURNAL_COMPACT_WRITES
+        and not reloader.building
+        and compaction_lock.acquire(blocking=False)
+    ):
+        threading.Thread(target=compact_journal, args=(state,), name="journal-compaction", daemon=True).start()
+
+def compact_journal(state: ServingState) -> None:
+    """
+    Fold the write journal into the data file and the persisted vector store.
+
+    Skipped while a reload is running or if the state is no longer served,
+    and if other workers journaled writes this process has not applied yet:
+    its reload picks them up and a later write compacts. Runs with
+    ``compaction_lock`` held, which it releases.
+
+    Args:
+        state (ServingState): State whose employees and indexes are saved.
+    """
+    from app.services.retriever_service import build_manifest, compute_data_hash, index_lock, save_vector_store
+
+    try:
+        with write_lock, index_lock(exclusive=True):
+            if reloader.building or reloader.state is not state or data_fingerprint() != state.fingerprint:
+                logger.info("Journal compaction skipped, the served data is being reloaded")
+                return
+
+            records = state.search_index.records()
+            save_employee_docs(records)
+            save_vector_store(state.vector_store, build_manifest(compute_data_hash()), records)
+            clear_journal()
+            state.fingerprint = data_fingerprint()
+            state.answer_cache.set_version(answer_cache_version(state.vector_store, state.fingerprint))
+            logger.info(f"Compacted the write journal into {len(records)} employee records")
+    except Exception as e:
+        logger.error(f"Error compacting the write journal: {str(e)}")
+    finally:
+        compaction_lock.release()
+
+@app.post("/employees/{employee_id}", response_model=Employee, status_code=201, dependencies=[Depends(require_index)])
+def create_employee(employee_id: int, employee: EmployeeWrite):
+    """
+    Create an employee and index its documents.
+
+    Args:
+        employee_id (int): Identifier of the new employee.
+        employee (EmployeeWrite): Employee fields.
+
+    Returns:
+        Employee: The created employee.
+
+    Raises:
+        HTTPException: If the employee already exists or the write fails.
+    """
+    try:
+        record = {"id": employee_id, **employee.model_dump()}
+        with write_lock:
+            state = reloader.state
+            if state.search_index.get(employee_id) is not None:
+                raise HTTPException(status_code=409, detail=f"Employee {employee_id} already exists")
+
+            journal_write({"op": "upsert", "employee": record})
+
+        return record
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating employee {employee_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.put("/employees/{employee_id}", response_model=Employee, dependencies=[Depends(require_index)])
+def update_employee(employee_id: int, employee: EmployeeWrite):
+    """
+    Replace an employee and re-index only its documents.
+
+    Args:
+        employee_id (int): Identifier of the employee to update.
+        employee (EmployeeWrite): New employee fields.
+
+    Returns:
+        Employee: The updated employee.
+
+    Raises:
+        HTTPException: If the employee does not exist or the write fails.
+    """
+    try:
+        record = {"id": employee_id, **employee.model_dump()}
+        with write_lock:
+            state = reloader.state
+            if state.search_index.get(employee_id) is None:
+                raise HTTPException(status_code=404, detail=f"Employee {employee_id} not found")
+
+            journal_write({"op": "upsert", "employee": record})
+
+        return record
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error updating employee {employee_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.delete("/employees/{employee_id}", status_code=204, dependencies=[Depends(require_index)])
+def delete_employee(employee_id: int):
+    """
+    Delete an employee and remove its documents from the index.
+
+    Args:
+        employee_id (int): Identifier of the employee to delete.
+
+    Raises:
+        HTTPException: If the employee does not exist or the write fails.
+    """
+    try:
+        with write_lock:
+            state = reloader.state
+            if state.search_index.get(employee_id) is None:
+                raise HTTPException(status_code=404, detail=f"Employee {employee_id} not found")
+
+            journal_write({"op": "delete", "id": employee_id})
+
+        return Response(status_code=204)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error deleting employee {employee_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/admin/reload", dependencies=[Depends(require_index)])
+async def reload_index(force: bool = Query(default=True, description="Rebuild even if the data file is unchanged")):
+    """
+    Reload the employee data without restarting.
+
+    The new indexes are built in a worker thread while requests keep being
+    served from the current ones, then swapped in. Requests in flight finish
+    on the version they started with.
+
+    Args:
+        force (bool): Rebuild even if the data file is unchanged.
+
+    Returns:
+        Dict[str, Any]: Whether a new version was swapped in, the version now
+        served, its employee and document counts and the reload duration.
+
+    Raises:
+        HTTPException: If the reload fails; the current version keeps being served.
+    """
+    try:
+        start = time.perf_counter()
+        reloaded = await asyncio.to_thread(reloader.reload, force)
+        return {
+            "reloaded": reloaded,
+            **reloader.state.describe(),
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+    except Exception as e:
+        logger.error(f"Error reloading employee data: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
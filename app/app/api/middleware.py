@@ -0,0 +1,55 @@
+"""
+Middleware module for the Employee Search RAG application.
+
+This module provides the ASGI middleware that records request metrics and
+adds the ``Server-Timing`` header to every response.
+"""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.metrics_service import HTTP_DURATION, HTTP_REQUESTS, start_request_timings
+
+class MetricsMiddleware:
+    """
+    Record request count and latency per route and report stage timings.
+
+    Stages timed while handling a request (embedding, search, LLM, ...) are
+    listed in the ``Server-Timing`` header. Headers are sent when the
+    response starts, so streamed responses only report the stages that ran
+    before their first byte.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request_timings()
+        started = False
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+                MutableHeaders(scope=message).append("Server-Timing", timings.header())
+                self._record(scope, message["status"], timings.started)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if not started:
+                self._record(scope, 500, timings.started)
+
+    @staticmethod
+    def _record(scope: Scope, status: int, started: float) -> None:
+        # Route templates keep label cardinality bounded
+        route = getattr(scope.get("route"), "path", "unmatched")
+        HTTP_REQUESTS.inc(method=scope["method"], route=route, status=status)
+        HTTP_DURATION.observe(time.perf_counter() - started, method=scope["method"], route=route)
@@ -17,20 +17,99 @@ class Settings(BaseSettings):
     # Vector Store Settings
     VECTOR_STORE_PATH: str = "employee_faiss_index"
     EMBEDDING_MODEL: str = "sentence-transformers/all-mpnet-base-v2"
+    EMBEDDING_BACKEND: str = "torch"  # "torch", "onnx" or "onnx-int8"
+    EMBEDDING_ONNX_PATH: str = "embedding_onnx"  # exported ONNX models
+    EMBEDDING_THREADS: int = 0  # ONNX Runtime intra-op threads; 0 lets ONNX Runtime decide
+    EMBEDDING_PARITY_TOLERANCE: float = 0.99  # min cosine similarity of an ONNX export to PyTorch
     SIMILARITY_THRESHOLD: float = 0.3
-    MAX_RESULTS: int = 5
+    MAX_RESULTS: int = 5  # distinct employees per retrieval when grouping
+    GROUP_RESULTS_BY_EMPLOYEE: bool = True
+    VECTOR_STORE_MODE: str = "load_or_build"  # "load_or_build" or "rebuild"
+    VECTOR_STORE_MMAP: bool = True
+    SHARED_SNAPSHOT: bool = False  # serve employees and documents from memory-mapped files, for multiple workers
+    HYBRID_SEARCH_ENABLED: bool = True  # fuse BM25 with vector scores
+    HYBRID_FETCH_K: int = 20  # candidates per ranking before fusion
+    RRF_K: int = 60  # reciprocal rank fusion constant
+    QUERY_FILTER_EXTRACTION: bool = True  # pre-filter on filters found in the query
+    STRUCTURED_ROUTING_ENABLED: bool = True  # answer filter-style chat questions from search, without the LLM
+    STRUCTURED_ROUTING_THRESHOLD: float = 0.9  # min share of the question explained by its filters
+    STRUCTURED_ROUTING_MAX_LISTED: int = 10  # employees listed in a templated answer
+    PREFILTER_MAX_LABELS: int = 100000  # larger allowed sets are post-filtered
+    QUERY_EMBED_BATCH_SIZE: int = 32  # max queries per batched embedding pass
+    QUERY_EMBED_MAX_WAIT_MS: float = 5.0  # how long a batch waits to fill up
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = "embedding_cache"
+    VECTOR_INDEX_TYPE: str = "flat"  # "flat", "hnsw", "ivf", "ivfpq" or "sq8"
+    HNSW_M: int = 32  # graph neighbours per node
+    HNSW_EF_CONSTRUCTION: int = 200
+    HNSW_EF_SEARCH: int = 64  # higher is more accurate and slower
+    HNSW_REBUILD_STALE_RATIO: float = 0.2  # rebuild the graph once this share of it is removed or replaced vectors
+    IVF_NLIST: int = 1024  # inverted lists, reduced automatically for small data
+    IVF_NPROBE: int = 16  # lists scanned per query
+    PQ_M: int = 48  # sub-quantizers, must divide the embedding dimension
+    PQ_NBITS: int = 8
     
     # LLM Settings
     OLLAMA_BASE_URL: str = "http://localhost:11434"
+    OLLAMA_BASE_URLS: str = ""  # comma-separated servers to balance over; OLLAMA_BASE_URL if empty
+    OLLAMA_KEEP_ALIVE: str = "30m"  # how long Ollama keeps the model loaded; "-1" keeps it forever
+    OLLAMA_POOL_SIZE: int = 16  # pooled keep-alive connections to Ollama
+    OLLAMA_TIMEOUT: float = 300.0  # seconds to wait for Ollama output
+    OLLAMA_CONNECT_TIMEOUT: float = 2.0  # seconds to connect, also the health check timeout
+    OLLAMA_HEALTH_INTERVAL: float = 5.0  # seconds between background health checks
+    OLLAMA_CIRCUIT_FAILURES: int = 3  # consecutive failures that open a server's circuit
+    OLLAMA_CIRCUIT_RESET: float = 30.0  # seconds an open circuit rejects requests
     LLM_MODEL: str = "mistral:7b"
     LLM_TEMPERATURE: float = 0.2
     LLM_CONTEXT_SIZE: int = 4096
+    LLM_RESPONSE_TOKENS: int = 1024  # reserved for the answer when packing context
+    CONTEXT_TOKEN_BUDGET: Optional[int] = None  # derived from LLM_CONTEXT_SIZE if unset
+    CONTEXT_CHARS_PER_TOKEN: float = 4.0
+    LLM_MAX_CONCURRENCY: int = 1  # concurrent Ollama generations
+    LLM_QUEUE_DEPTH: int = 8  # requests allowed to wait for a generation slot
+    LLM_QUEUE_TIMEOUT: float = 60.0  # seconds a queued request waits before 503
+    LLM_RETRY_AFTER: int = 5  # Retry-After seconds sent with 429/503
+    CHAT_BATCH_CONCURRENCY: Optional[int] = None  # generations of one /chat/batch in flight; LLM_MAX_CONCURRENCY if unset
+    WARMUP_ENABLED: bool = True  # dummy embedding and one-token generation at startup
+    WARMUP_RETRY_INTERVAL: float = 10.0  # seconds between attempts to reach Ollama
+    METRICS_ENABLED: bool = True  # request metrics and Server-Timing headers
+
+    # Answer Cache Settings
+    ANSWER_CACHE_ENABLED: bool = True
+    ANSWER_CACHE_THRESHOLD: float = 0.92  # minimum cosine similarity for a hit
+    ANSWER_CACHE_MAX_ENTRIES: int = 1024
+    ANSWER_CACHE_TTL: float = 3600.0  # seconds
+
+    # Chat Session Settings
+    SESSION_MAX_ENTRIES: int = 1000  # live sessions before the least recently used is dropped
+    SESSION_TTL: float = 1800.0  # seconds of inactivity before a session expires
+    SESSION_MAX_TURNS: int = 20  # turns kept per session
+    SESSION_CONTEXT_REUSE: bool = True  # continue follow-ups from Ollama's returned context
     
+    # Search Settings
+    SEARCH_PAGE_SIZE: int = 100  # employees per /employees/search page when no limit is given
+    SEARCH_MAX_PAGE_SIZE: int = 1000
+    NAME_FUZZY_THRESHOLD: float = 0.4  # minimum trigram similarity of a fuzzy name match
+    NAME_INDEX_PROJECTS: bool = True  # trigram-index project names for the project filter
+    SKILL_SYNONYMS_ENABLED: bool = True  # embed the skill vocabulary so searches can expand skills
+    SKILL_SYNONYM_THRESHOLD: float = 0.8  # min cosine similarity of two skills to count as synonyms
+    SKILL_SYNONYM_MAX: int = 5  # synonyms kept per skill
+    SKILL_SYNONYMS_PATH: str = "data/skill_synonyms.json"  # manual synonym groups and exclusions
+    BATCH_MAX_SIZE: int = 500  # requests per /chat/batch or /employees/search/batch call
+
     # Data Settings
-    DATA_PATH: str = "data/employees.json"
-    
+    DATA_PATH: str = "data/employees.json"  # JSON with an "employees" array, or .jsonl
+    JOURNAL_COMPACT_WRITES: int = 100  # journaled employee writes before the data file and indexes are rewritten
+    RELOAD_WATCH_INTERVAL: float = 5.0  # seconds between checks of the data file for changes; 0 disables
+    RELOAD_DRAIN_TIMEOUT: float = 300.0  # seconds to wait for requests on a replaced version before warning
+    INGEST_CHUNK_SIZE: int = 1000  # employees validated and embedded per chunk
+    INGEST_EMBED_WORKERS: int = 0  # embedding processes during index builds; 0 embeds in-process
+    INDEX_TRAIN_SIZE: int = 100000  # vectors buffered to train IVF/PQ/SQ8 indexes
+
     class Config:
         env_file = ".env"
         case_sensitive = True
+        # The .env file also holds the Streamlit client's UI_* settings
+        extra = "ignore"
 
 settings = Settings() 
\ No newline at end of file
@@ -15,14 +15,35 @@ class Employee(BaseModel):
     projects: List[str] = Field(..., description="List of projects worked on")
     availability: str = Field(..., description="Current availability status")
 
+class EmployeeProjection(BaseModel):
+    """Employee returned by a search; only the requested fields are present."""
+    id: int = Field(..., description="Unique employee identifier")
+    name: Optional[str] = Field(None, description="Employee's full name")
+    skills: Optional[List[str]] = Field(None, description="List of employee's skills")
+    experience_years: Optional[int] = Field(None, description="Years of experience")
+    projects: Optional[List[str]] = Field(None, description="List of projects worked on")
+    availability: Optional[str] = Field(None, description="Current availability status")
+
+class EmployeeWrite(BaseModel):
+    """Employee create/update model; the id is taken from the URL."""
+    name: str = Field(..., description="Employee's full name")
+    skills: List[str] = Field(..., description="List of employee's skills")
+    experience_years: int = Field(..., description="Years of experience")
+    projects: List[str] = Field(..., description="List of projects worked on")
+    availability: str = Field(..., description="Current availability status")
+
 class ChatRequest(BaseModel):
     """Chat request model."""
     query: str = Field(..., description="The query to process using RAG")
     session_id: Optional[str] = Field(None, description="Optional session identifier")
+    skills: Optional[List[str]] = Field(None, description="Only retrieve employees with all of these skills")
+    min_experience: Optional[int] = Field(None, description="Only retrieve employees with this much experience")
+    availability: Optional[str] = Field(None, description="Only retrieve employees with this availability")
 
 class ChatResponse(BaseModel):
     """Chat response model."""
     response: str = Field(..., description="The response from the RAG system")
+    session_id: Optional[str] = Field(None, description="Session the answer belongs to, if any")
     timestamp: datetime = Field(default_factory=datetime.now)
 
 class SearchRequest(BaseModel):
@@ -31,9 +52,52 @@ class SearchRequest(BaseModel):
     skills: Optional[List[str]] = Field(None, description="Filter by skills")
     min_experience: Optional[int] = Field(None, description="Minimum years of experience")
     availability: Optional[str] = Field(None, description="Filter by availability status")
+    project: Optional[str] = Field(None, description="Search by project name")
+    fuzzy: bool = Field(False, description="Also match names and projects with typos")
+    expand_skills: bool = Field(False, description="Also match synonyms of each skill, such as ML for Machine Learning")
+    sort: Optional[str] = Field(None, description="name, experience or relevance, prefixed with - for descending")
+    limit: Optional[int] = Field(None, ge=1, description="Employees per page")
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous page")
+    fields: Optional[List[str]] = Field(None, description="Employee fields to return; id is always included")
 
 class SearchResponse(BaseModel):
     """Search response model."""
     total: int = Field(..., description="Total number of matching employees")
-    employees: List[Employee] = Field(..., description="List of matching employees")
-    timestamp: datetime = Field(default_factory=datetime.now) 
\ No newline at end of file
+    employees: List[EmployeeProjection] = Field(..., description="Matching employees on this page, limited to the requested fields")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, or null on the last page")
+    timestamp: datetime = Field(default_factory=datetime.now)
+
+
+class ChatBatchRequest(BaseModel):
+    """Batch chat request model."""
+    requests: List[ChatRequest] = Field(..., min_length=1, description="Chat requests to answer")
+
+class ChatBatchResult(BaseModel):
+    """Result of one chat request in a batch."""
+    response: Optional[str] = Field(None, description="The response from the RAG system")
+    status_code: int = Field(200, description="HTTP status the request would have had on its own")
+    error: Optional[str] = Field(None, description="Error detail if the request failed")
+
+class ChatBatchResponse(BaseModel):
+    """Batch chat response model."""
+    results: List[ChatBatchResult] = Field(..., description="Results in request order")
+    timestamp: datetime = Field(default_factory=datetime.now)
+
+class SearchBatchRequest(BaseModel):
+    """Batch search request model."""
+    searches: List[SearchRequest] = Field(..., min_length=1, description="Searches to evaluate")
+
+class SearchBatchResult(BaseModel):
+    """Result of one search in a batch."""
+    total: int = Field(0, description="Total number of matching employees")
+    employees: List[EmployeeProjection] = Field(
+        default_factory=list, description="Matching employees on this page, limited to the requested fields"
+    )
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, or null on the last page")
+    status_code: int = Field(200, description="HTTP status the search would have had on its own")
+    error: Optional[str] = Field(None, description="Error detail if the search failed")
+
+class SearchBatchResponse(BaseModel):
+    """Batch search response model."""
+    results: List[SearchBatchResult] = Field(..., description="Results in search order")
+    timestamp: datetime = Field(default_factory=datetime.now)
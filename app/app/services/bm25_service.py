@@ -0,0 +1,328 @@
+"""
+BM25 service module for the Employee Search RAG application.
+
+This module handles the lexical side of hybrid retrieval: an incrementally
+updatable BM25 index over the same documents stored in the vector index, and
+a read-only variant persisted next to the vector store that worker processes
+memory-map instead of each building its own.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.services.snapshot_service import blob_offsets, map_blob
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+
+# Bump whenever the persisted layout changes
+BM25_VERSION = "1"
+BM25_PREFIX = "bm25"
+BM25_ARRAYS = ("doc_labels", "doc_employees", "doc_lengths", "term_offsets", "posting_offsets", "posting_docs", "posting_tfs")
+TERM_SEPARATOR = b"\n"
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase lexical tokens.
+
+    Keeps characters such as ``+``, ``#`` and ``.`` inside tokens so that
+    skills like "C++", "C#" and "Node.js" survive tokenization.
+
+    Args:
+        text (str): Text to tokenize.
+
+    Returns:
+        List[str]: Lowercase tokens.
+    """
+    return [token.rstrip(".-") for token in TOKEN_PATTERN.findall(text.lower())]
+
+class BM25Index:
+    """
+    Okapi BM25 inverted index supporting document adds and removes.
+
+    Each document is associated with an employee id, so searches can be
+    restricted to an allowed set of employees.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Counter] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._doc_employee: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, doc_id: str, text: str, employee_id: int) -> None:
+        """
+        Index a document, replacing any previous version with the same id.
+
+        Args:
+            doc_id (str): Document identifier.
+            text (str): Document text.
+            employee_id (int): Employee the document belongs to.
+        """
+        self.remove(doc_id)
+        terms = Counter(tokenize(text))
+        for term, count in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = count
+
+        length = sum(terms.values())
+        self._doc_terms[doc_id] = terms
+        self._doc_lengths[doc_id] = length
+        self._doc_employee[doc_id] = employee_id
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Remove a document from the index if present.
+
+        Args:
+            doc_id (str): Document identifier.
+        """
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            posting = self._postings[term]
+            del posting[doc_id]
+            if not posting:
+                del self._postings[term]
+
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        del self._doc_employee[doc_id]
+
+    def search(
+        self,
+        query: str,
+        k: int,
+        employee_ids: Optional[Set[int]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Return the best-scoring documents for a query.
+
+        Args:
+            query (str): Query text.
+            k (int): Maximum number of results.
+            employee_ids (Set[int], optional): Restrict results to these employees.
+
+        Returns:
+            List[Tuple[str, float]]: (document id, BM25 score) pairs, best first.
+        """
+        n_docs = len(self._doc_lengths)
+        if not n_docs:
+            return []
+
+        avg_length = self._total_length / n_docs
+        scores: Dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+
+            idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, tf in posting.items():
+                if employee_ids is not None and self._doc_employee[doc_id] not in employee_ids:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+
+def bm25_file(path: str, name: str) -> str:
+    """Return the path of one persisted BM25 array or blob."""
+    extension = "npy" if name in BM25_ARRAYS else "bin"
+    return os.path.join(path, f"{BM25_PREFIX}.{name}.{extension}")
+
+def write_bm25_index(documents: Iterable[Tuple[int, int, str]], path: str) -> int:
+    """
+    Write the BM25 postings of documents as arrays for ``MappedBM25Index``.
+
+    Files are written under temporary names and renamed into place, so
+    processes mapping the previous files keep reading them unchanged.
+
+    Args:
+        documents (Iterable[Tuple[int, int, str]]): ``(label, employee id, text)`` per document.
+        path (str): Directory of the persisted vector store.
+
+    Returns:
+        int: Number of documents written.
+    """
+    labels: List[int] = []
+    employees: List[int] = []
+    lengths: List[int] = []
+    postings: Dict[str, Tuple[List[int], List[int]]] = {}
+    for label, employee_id, text in documents:
+        doc = len(labels)
+        labels.append(label)
+        employees.append(employee_id)
+        terms = Counter(tokenize(text))
+        lengths.append(sum(terms.values()))
+        for term, count in terms.items():
+            docs, tfs = postings.setdefault(term, ([], []))
+            docs.append(doc)
+            tfs.append(count)
+
+    # Terms are sorted by their UTF-8 bytes so lookups can bisect the blob
+    encoded = sorted((term.encode("utf-8"), term) for term in postings)
+    columns = {
+        "doc_labels": np.asarray(labels, dtype=np.int64),
+        "doc_employees": np.asarray(employees, dtype=np.int64),
+        "doc_lengths": np.asarray(lengths, dtype=np.int32),
+        "term_offsets": blob_offsets([term for term, _ in encoded], len(TERM_SEPARATOR)),
+        "posting_offsets": blob_offsets([postings[term][0] for _, term in encoded]),
+        "posting_docs": np.asarray([doc for _, term in encoded for doc in postings[term][0]], dtype=np.int32),
+        "posting_tfs": np.asarray([tf for _, term in encoded for tf in postings[term][1]], dtype=np.int32),
+    }
+
+    os.makedirs(path, exist_ok=True)
+    for name, column in columns.items():
+        target = bm25_file(path, name)
+        with open(f"{target}.tmp", "wb") as f:
+            np.save(f, column)
+        os.replace(f"{target}.tmp", target)
+    target = bm25_file(path, "terms")
+    with open(f"{target}.tmp", "wb") as f:
+        f.write(b"".join(term + TERM_SEPARATOR for term, _ in encoded))
+    os.replace(f"{target}.tmp", target)
+
+    meta_path = os.path.join(path, f"{BM25_PREFIX}.meta.json")
+    with open(f"{meta_path}.tmp", "w") as f:
+        json.dump({"version": BM25_VERSION, "count": len(labels), "total_length": int(sum(lengths))}, f)
+    os.replace(f"{meta_path}.tmp", meta_path)
+    return len(labels)
+
+class MappedBM25Index:
+    """
+    Read-only BM25 index over memory-mapped postings.
+
+    Scores match ``BM25Index``; ties are broken by label instead of document
+    id. Nothing is copied into the process when the index is opened, so
+    workers share its pages through the OS page cache.
+    """
+
+    def __init__(
+        self,
+        meta: Dict[str, Any],
+        columns: Dict[str, np.ndarray],
+        terms: bytes,
+        doc_id: Callable[[int], str],
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        self.meta = meta
+        self.columns = columns
+        self.terms = terms
+        self.doc_id = doc_id
+        self.k1 = k1
+        self.b = b
+
+    @classmethod
+    def open(cls, path: str, doc_id: Callable[[int], str]) -> "MappedBM25Index":
+        """
+        Memory-map postings written by ``write_bm25_index``.
+
+        Args:
+            path (str): Directory of the persisted vector store.
+            doc_id (Callable[[int], str]): Maps a document label to its document id.
+
+        Returns:
+            MappedBM25Index: The mapped index.
+
+        Raises:
+            FileNotFoundError: If the postings are missing.
+            ValueError: If they were written with another layout.
+        """
+        with open(os.path.join(path, f"{BM25_PREFIX}.meta.json"), "r") as f:
+            meta = json.load(f)
+        if meta.get("version") != BM25_VERSION:
+            raise ValueError(f"BM25 index version {meta.get('version')} is not {BM25_VERSION}")
+        columns = {name: np.load(bm25_file(path, name), mmap_mode="r") for name in BM25_ARRAYS}
+        return cls(meta, columns, map_blob(bm25_file(path, "terms")), doc_id)
+
+    def __len__(self) -> int:
+        return self.meta["count"]
+
+    def _term_index(self, term: str) -> Optional[int]:
+        needle = term.encode("utf-8")
+        offsets = self.columns["term_offsets"]
+        low, high = 0, len(offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            value = self.terms[offsets[middle]:offsets[middle + 1] - len(TERM_SEPARATOR)]
+            if value < needle:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(offsets) - 1 and self.terms[offsets[low]:offsets[low + 1] - len(TERM_SEPARATOR)] == needle:
+            return low
+        return None
+
+    def search(
+        self,
+        query: str,
+        k: int,
+        employee_ids: Optional[Set[int]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Return the best-scoring documents for a query.
+
+        Args:
+            query (str): Query text.
+            k (int): Maximum number of results.
+            employee_ids (Set[int], optional): Restrict results to these employees.
+
+        Returns:
+            List[Tuple[str, float]]: (document id, BM25 score) pairs, best first.
+        """
+        n_docs = len(self)
+        if not n_docs or k <= 0:
+            return []
+
+        avg_length = self.meta["total_length"] / n_docs
+        allowed = np.fromiter(employee_ids, dtype=np.int64) if employee_ids is not None else None
+        offsets = self.columns["posting_offsets"]
+        docs_parts: List[np.ndarray] = []
+        score_parts: List[np.ndarray] = []
+
+        for term in set(tokenize(query)):
+            index = self._term_index(term)
+            if index is None:
+                continue
+            start, end = int(offsets[index]), int(offsets[index + 1])
+            docs = np.asarray(self.columns["posting_docs"][start:end])
+            tfs = np.asarray(self.columns["posting_tfs"][start:end], dtype=np.float64)
+            if allowed is not None:
+                keep = np.isin(self.columns["doc_employees"][docs], allowed)
+                docs, tfs = docs[keep], tfs[keep]
+                if not len(docs):
+                    continue
+
+            idf = math.log(1 + (n_docs - (end - start) + 0.5) / ((end - start) + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * self.columns["doc_lengths"][docs] / avg_length)
+            docs_parts.append(docs)
+            score_parts.append(idf * tfs * (self.k1 + 1) / (tfs + norm))
+
+        if not docs_parts:
+            return []
+        docs, inverse = np.unique(np.concatenate(docs_parts), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(score_parts))
+        labels = self.columns["doc_labels"][docs]
+        if len(docs) > k:
+            # Keep every document tied with the k-th score so ties resolve by label
+            threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+            best = scores >= threshold
+            scores, labels = scores[best], labels[best]
+        order = np.lexsort((labels, -scores))[:k]
+        return [(self.doc_id(int(labels[i])), float(scores[i])) for i in order]
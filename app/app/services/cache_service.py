@@ -0,0 +1,159 @@
+"""
+Cache service module for the Employee Search RAG application.
+
+This module handles the semantic answer cache placed in front of the QA chain,
+which serves near-identical questions without retrieval or generation.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """
+    In-memory answer cache keyed on query embeddings.
+
+    Query vectors live in a preallocated matrix, so a lookup is one matrix-vector
+    product. Entries are evicted least-recently-used once ``max_entries`` is
+    reached, expire after ``ttl`` seconds, and are all dropped when the index
+    version changes.
+    """
+
+    def __init__(
+        self,
+        threshold: float = settings.ANSWER_CACHE_THRESHOLD,
+        max_entries: int = settings.ANSWER_CACHE_MAX_ENTRIES,
+        ttl: float = settings.ANSWER_CACHE_TTL,
+        version: Optional[str] = None
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._valid = np.zeros(max_entries, dtype=bool)
+        # slot -> entry, ordered from least to most recently used
+        self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+    def lookup(self, query_vector: List[float]) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer for a semantically similar query.
+
+        Args:
+            query_vector (List[float]): Embedding of the incoming query.
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached entry with ``query``, ``response``
+            and ``employee_ids``, or None on a miss.
+        """
+        vector = self._normalize(query_vector)
+        with self._lock:
+            if self._vectors is None or not self._entries:
+                self.misses += 1
+                return None
+
+            scores = self._vectors @ vector
+            scores[~self._valid] = -np.inf
+            slot = int(np.argmax(scores))
+
+            if scores[slot] < self.threshold:
+                self.misses += 1
+                return None
+
+            entry = self._entries[slot]
+            if time.monotonic() - entry["created"] > self.ttl:
+                self._evict(slot)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(slot)
+            self.hits += 1
+            return entry
+
+    def store(
+        self,
+        query_vector: List[float],
+        query: str,
+        response: str,
+        employee_ids: Optional[List[int]] = None
+    ) -> None:
+        """
+        Cache the answer to a query.
+
+        Args:
+            query_vector (List[float]): Embedding of the query.
+            query (str): Query text.
+            response (str): Generated answer.
+            employee_ids (List[int], optional): Employees the answer was based on.
+        """
+        vector = self._normalize(query_vector)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+            if len(self._entries) >= self.max_entries:
+                slot = next(iter(self._entries))
+                self._evict(slot)
+            else:
+                slot = int(np.argmin(self._valid))
+
+            self._vectors[slot] = vector
+            self._valid[slot] = True
+            self._entries[slot] = {
+                "query": query,
+                "response": response,
+                "employee_ids": employee_ids or [],
+                "created": time.monotonic()
+            }
+
+    def set_version(self, version: str) -> None:
+        """
+        Record the current index version, clearing the cache if it changed.
+
+        Args:
+            version (str): Version of the employee data and vector index.
+        """
+        with self._lock:
+            if version != self.version:
+                logger.info("Index version changed, clearing answer cache")
+                self.version = version
+                self._entries.clear()
+                self._valid[:] = False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters.
+
+        Returns:
+            Dict[str, Any]: Hit and miss counts, hit rate and current size.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+                "version": self.version
+            }
+
+    def _evict(self, slot: int) -> None:
+        del self._entries[slot]
+        self._valid[slot] = False
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
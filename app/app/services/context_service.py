@@ -0,0 +1,132 @@
+"""
+Context service module for the Employee Search RAG application.
+
+This module turns retrieved documents into the context stuffed into the LLM
+prompt: hits are collapsed to one per employee and packed as compact,
+deduplicated employee summaries within a token budget.
+"""
+
+import logging
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.documents import Document
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text.
+
+    Args:
+        text (str): Text to measure.
+
+    Returns:
+        int: Approximate token count.
+    """
+    return math.ceil(len(text) / settings.CONTEXT_CHARS_PER_TOKEN)
+
+def default_context_budget(prompt_template: str) -> int:
+    """
+    Derive the context token budget from the LLM context size.
+
+    Args:
+        prompt_template (str): Prompt template the context is stuffed into.
+
+    Returns:
+        int: Tokens available for retrieved context.
+    """
+    if settings.CONTEXT_TOKEN_BUDGET is not None:
+        return settings.CONTEXT_TOKEN_BUDGET
+    return max(0, settings.LLM_CONTEXT_SIZE - settings.LLM_RESPONSE_TOKENS - estimate_tokens(prompt_template))
+
+def group_by_employee(docs: List[Document]) -> List[Document]:
+    """
+    Collapse ranked documents to the best-ranked document per employee.
+
+    Args:
+        docs (List[Document]): Retrieved documents, best first.
+
+    Returns:
+        List[Document]: One document per employee, in rank order.
+    """
+    best: Dict[int, Document] = {}
+    for doc in docs:
+        best.setdefault(doc.metadata["id"], doc)
+    return list(best.values())
+
+def describe_match(doc: Document) -> Optional[str]:
+    """Describe which skill or project a skill/project document matched on."""
+    if doc.metadata.get("type") == "skill_specific":
+        return f"skill {doc.metadata['skill']}"
+    if doc.metadata.get("type") == "project_specific":
+        return f"project {doc.metadata['project']}"
+    return None
+
+def format_employee_context(emp: Dict[str, Any], match: Optional[str] = None) -> str:
+    """
+    Format an employee as a compact context entry with each field stated once.
+
+    Args:
+        emp (Dict[str, Any]): Employee information dictionary.
+        match (str, optional): What the employee's best hit matched on.
+
+    Returns:
+        str: Compact employee summary.
+    """
+    lines = [
+        f"{emp['name']} (ID {emp['id']}): {emp['experience_years']} years, {emp['availability']}",
+        f"Skills: {', '.join(emp['skills'])}",
+        f"Projects: {', '.join(emp['projects'])}",
+    ]
+    if match:
+        lines.append(f"Matched on: {match}")
+    return "\n".join(lines)
+
+def pack_context(
+    docs: List[Document],
+    budget: int,
+    lookup: Optional[Callable[[int], Optional[Dict[str, Any]]]] = None
+) -> List[Document]:
+    """
+    Pack per-employee context entries into a token budget.
+
+    Employees are added in rank order until the next entry would exceed the
+    budget. The first entry is always kept, truncated if necessary, so the
+    LLM never receives an empty context when something was retrieved.
+
+    Args:
+        docs (List[Document]): One best document per employee, in rank order.
+        budget (int): Maximum context tokens.
+        lookup (Callable, optional): Returns the employee record for an id. When
+            missing or returning None, the document's own text is used.
+
+    Returns:
+        List[Document]: Packed context documents, one per employee.
+    """
+    packed: List[Document] = []
+    used = 0
+
+    for doc in docs:
+        emp = lookup(doc.metadata["id"]) if lookup else None
+        text = format_employee_context(emp, describe_match(doc)) if emp else doc.page_content
+        tokens = estimate_tokens(text)
+
+        if used + tokens > budget:
+            if packed:
+                break
+            text = text[:int(budget * settings.CONTEXT_CHARS_PER_TOKEN)]
+            tokens = estimate_tokens(text)
+
+        packed.append(Document(
+            id=doc.id,
+            page_content=text,
+            metadata={"id": doc.metadata["id"], "name": doc.metadata["name"], "type": "employee_context"}
+        ))
+        used += tokens
+
+    if len(packed) < len(docs):
+        logger.info(f"Context budget of {budget} tokens fits {len(packed)} of {len(docs)} employees")
+    return packed
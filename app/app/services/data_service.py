@@ -2,23 +2,214 @@
 Data service module for the Employee Search RAG application.
 
 This module handles data loading, validation, and management functionality.
+Employee files are either a JSON document with an ``employees`` array or JSON
+Lines with one employee per line; both are read as a stream and validated in
+chunks, so large exports never have to be parsed in one piece.
 """
 
 import json
 import os
 import logging
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, TextIO
+
+from pydantic import TypeAdapter, ValidationError
 
 from app.core.config import settings
+from app.core.schemas import Employee
 
 logger = logging.getLogger(__name__)
 
+READ_SIZE = 1 << 16
+ARRAY_START_PATTERN = re.compile(r'\A\s*\[|"employees"\s*:\s*\[')
+EMPLOYEE_LIST = TypeAdapter(List[Employee])
+
+def resolve_data_path(file_path: str = settings.DATA_PATH) -> str:
+    """
+    Resolve a data file path relative to the application root.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+
+    Returns:
+        str: Absolute path to the data file.
+    """
+    current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(current_dir, file_path)
+
+def is_jsonl(file_path: str) -> bool:
+    """Check whether a data file uses the JSON Lines format."""
+    return file_path.endswith((".jsonl", ".ndjson"))
+
+def iter_json_array(f: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the items of the employee array in a JSON document.
+
+    Accepts ``{"employees": [...]}`` as well as a bare top-level array. Only
+    one item and one read buffer are held in memory at a time.
+
+    Args:
+        f (TextIO): Open JSON file.
+
+    Yields:
+        Dict[str, Any]: Raw employee records.
+
+    Raises:
+        ValueError: If no employee array is found.
+        json.JSONDecodeError: If an item is not valid JSON.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    while True:
+        match = ARRAY_START_PATTERN.search(buffer)
+        if match:
+            buffer = buffer[match.end():]
+            break
+        chunk = f.read(READ_SIZE)
+        if not chunk:
+            raise ValueError("No employees array found in the file")
+        buffer += chunk
+
+    while True:
+        buffer = buffer.lstrip()
+        if buffer.startswith(","):
+            buffer = buffer[1:].lstrip()
+        if buffer.startswith("]"):
+            return
+
+        if buffer:
+            try:
+                record, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # Most likely the item continues in the next read
+                pass
+            else:
+                yield record
+                buffer = buffer[end:]
+                continue
+
+        chunk = f.read(READ_SIZE)
+        if not chunk:
+            if buffer:
+                decoder.raw_decode(buffer)
+            raise ValueError("Unterminated employees array")
+        buffer += chunk
+
+def iter_employee_records(file_path: str = settings.DATA_PATH) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw employee records from a JSON or JSON Lines file.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+
+    Yields:
+        Dict[str, Any]: Raw employee records, unvalidated.
+
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist.
+    """
+    full_path = resolve_data_path(file_path)
+    if not os.path.exists(full_path):
+        raise FileNotFoundError(f"Employee data file not found at: {full_path}")
+
+    with open(full_path, "r") as f:
+        if is_jsonl(file_path):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from iter_json_array(f)
+
+def validate_employee_chunk(
+    records: List[Dict[str, Any]],
+    seen_ids: Optional[Set[int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Validate a chunk of raw records against the Employee schema.
+
+    The chunk is validated in one call; only when that fails are records
+    validated one by one so the invalid ones can be reported and skipped.
+    Records repeating the id of an earlier record are reported and skipped
+    too, keeping the first.
+
+    Args:
+        records (List[Dict[str, Any]]): Raw employee records.
+        seen_ids (Set[int], optional): Ids of the records in earlier chunks;
+            updated with the ids of this chunk.
+
+    Returns:
+        List[Dict[str, Any]]: Valid, normalized employee records with unique ids.
+    """
+    try:
+        valid = [emp.model_dump() for emp in EMPLOYEE_LIST.validate_python(records)]
+    except ValidationError:
+        valid = []
+        for record in records:
+            try:
+                valid.append(Employee.model_validate(record).model_dump())
+            except ValidationError as e:
+                record_id = record.get("id") if isinstance(record, dict) else None
+                logger.warning(f"Skipping invalid employee record (id={record_id}): {e.errors()[0]['msg']}")
+
+    seen_ids = set() if seen_ids is None else seen_ids
+    unique = []
+    for emp in valid:
+        if emp["id"] in seen_ids:
+            logger.warning(f"Skipping employee record with duplicate id {emp['id']}")
+            continue
+        seen_ids.add(emp["id"])
+        unique.append(emp)
+    return unique
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    Args:
+        items (Iterable[Any]): Items to split.
+        size (int): Maximum chunk size.
+
+    Yields:
+        List[Any]: Consecutive chunks.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def iter_employee_chunks(
+    file_path: str = settings.DATA_PATH,
+    chunk_size: int = settings.INGEST_CHUNK_SIZE
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream validated employee records in chunks, skipping repeated ids.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+        chunk_size (int): Records per chunk.
+
+    Yields:
+        List[Dict[str, Any]]: Chunks of valid employee records.
+    """
+    seen_ids: Set[int] = set()
+    for records in chunked(iter_employee_records(file_path), chunk_size):
+        valid = validate_employee_chunk(records, seen_ids)
+        if valid:
+            yield valid
+
 def load_employee_docs(file_path: str = settings.DATA_PATH) -> List[Dict[str, Any]]:
     """
-    Load employee data from a JSON file.
+    Load employee data from a JSON or JSON Lines file.
+
+    Records failing validation against the Employee schema, and records
+    repeating the id of an earlier record, are skipped.
 
     Args:
-        file_path (str): Path to the JSON file containing employee data.
+        file_path (str): Path to the file containing employee data.
 
     Returns:
         List[Dict[str, Any]]: List of employee dictionaries.
@@ -31,17 +222,15 @@ def load_employee_docs(file_path: str = settings.DATA_PATH) -> List[Dict[str, An
     """
     try:
         # Get the absolute path to the file
-        current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        full_path = os.path.join(current_dir, file_path)
+        full_path = resolve_data_path(file_path)
         
         logger.info(f"Loading employee data from: {full_path}")
         
         if not os.path.exists(full_path):
             raise FileNotFoundError(f"Employee data file not found at: {full_path}")
             
-        with open(full_path, "r") as f:
-            data = json.load(f)["employees"]
-            
+        data = [emp for chunk in iter_employee_chunks(file_path) for emp in chunk]
+
         if not data:
             raise ValueError("No employee data found in the file")
         
@@ -53,4 +242,30 @@ def load_employee_docs(file_path: str = settings.DATA_PATH) -> List[Dict[str, An
         raise
     except Exception as e:
         logger.error(f"Error loading employee data: {str(e)}")
-        raise 
\ No newline at end of file
+        raise 
+
+def save_employee_docs(employees: List[Dict[str, Any]], file_path: str = settings.DATA_PATH) -> None:
+    """
+    Atomically write employee data back to a JSON or JSON Lines file.
+
+    Args:
+        employees (List[Dict[str, Any]]): Employee records to persist.
+        file_path (str): Path to the data file, relative to the application root.
+    """
+    try:
+        full_path = resolve_data_path(file_path)
+        tmp_path = f"{full_path}.tmp"
+
+        with open(tmp_path, "w") as f:
+            if is_jsonl(file_path):
+                for emp in employees:
+                    f.write(json.dumps(emp, ensure_ascii=False) + "\n")
+            else:
+                json.dump({"employees": employees}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, full_path)
+
+        logger.info(f"Saved {len(employees)} employee records to: {full_path}")
+
+    except Exception as e:
+        logger.error(f"Error saving employee data: {str(e)}")
+        raise
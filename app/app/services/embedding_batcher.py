@@ -0,0 +1,140 @@
+"""
+Embedding batcher module for the Employee Search RAG application.
+
+This module coalesces query embeddings from concurrent requests into batched
+forward passes of the embedding model.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+from app.services.embedding_cache import CachedEmbeddings
+
+logger = logging.getLogger(__name__)
+
+class QueryEmbeddingBatcher:
+    """
+    Async micro-batcher for query embeddings.
+
+    Requests are queued and collected for up to ``max_wait_ms`` milliseconds or
+    ``max_batch_size`` items, embedded with one ``embed_documents`` call in a
+    worker thread, and each vector is handed back to its caller. Recently
+    embedded queries are remembered so a query embedded for the answer cache is
+    not embedded again for retrieval.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        max_batch_size: int = settings.QUERY_EMBED_BATCH_SIZE,
+        max_wait_ms: float = settings.QUERY_EMBED_MAX_WAIT_MS,
+        recent_size: int = 256
+    ):
+        # Queries must not be written to the persistent document cache
+        if isinstance(embeddings, CachedEmbeddings):
+            embeddings = embeddings.embeddings
+        self.embeddings = embeddings
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.recent_size = recent_size
+        self._recent: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of queries waiting to be embedded."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed a query, batched with other concurrent queries.
+
+        Args:
+            text (str): Query text.
+
+        Returns:
+            List[float]: Query embedding.
+        """
+        vector = self._recent.get(text)
+        if vector is not None:
+            self._recent.move_to_end(text)
+            return vector
+
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of queries in one pass of the embedding model.
+
+        The texts already form a batch, so they skip the queue and its wait.
+
+        Args:
+            texts (List[str]): Query texts.
+
+        Returns:
+            List[List[float]]: Query embeddings in input order.
+        """
+        unique = list(dict.fromkeys(texts))
+        by_text = {text: self._recent[text] for text in unique if text in self._recent}
+        missing = [text for text in unique if text not in by_text]
+        if missing:
+            vectors = await asyncio.to_thread(self.embeddings.embed_documents, missing)
+            embedded = dict(zip(missing, vectors))
+            self._remember(embedded)
+            by_text.update(embedded)
+        return [by_text[text] for text in texts]
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await queue.get()]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = list(dict.fromkeys(text for text, _ in batch))
+            try:
+                vectors = await asyncio.to_thread(self.embeddings.embed_documents, texts)
+            except Exception as e:
+                logger.error(f"Error embedding query batch: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            by_text = dict(zip(texts, vectors))
+            for text, future in batch:
+                if not future.done():
+                    future.set_result(by_text[text])
+            self._remember(by_text)
+
+    def _remember(self, by_text: dict) -> None:
+        self._recent.update(by_text)
+        for text in by_text:
+            self._recent.move_to_end(text)
+        while len(self._recent) > self.recent_size:
+            self._recent.popitem(last=False)
@@ -0,0 +1,226 @@
+"""
+Embedding cache module for the Employee Search RAG application.
+
+This module handles a persistent, content-addressed cache of document
+embeddings so index rebuilds only embed texts that are new or changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+from app.services.embedding_service import embedding_model_id
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+def text_key(text: str) -> str:
+    """
+    Compute the cache key of a document text.
+
+    Args:
+        text (str): Document text.
+
+    Returns:
+        str: SHA-256 hex digest of the UTF-8 encoded text.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class EmbeddingCache:
+    """
+    Append-only on-disk store of embedding vectors keyed by text hash.
+
+    Each (model, backend, normalize) namespace is stored as three files: a raw float32
+    matrix that is memory-mapped for reads, a newline-separated key file with
+    one SHA-256 digest per row, and a small JSON file recording the dimension.
+    Vectors are appended before their keys, so a crash mid-append only leaves
+    unreferenced trailing rows.
+
+    Processes sharing a cache directory append under a file lock, and first
+    read the keys other processes appended, so every key maps to the row its
+    vector was written to.
+    """
+
+    def __init__(self, path: str, namespace: str):
+        self.path = path
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._vectors_path = os.path.join(path, f"{namespace}.f32")
+        self._keys_path = os.path.join(path, f"{namespace}.keys")
+        self._meta_path = os.path.join(path, f"{namespace}.json")
+        self._lock_path = os.path.join(path, f"{namespace}.lock")
+        self._rows: Dict[str, int] = {}
+        self._row_count = 0
+        self._keys_offset = 0
+        self._dim: Optional[int] = None
+        self._matrix: Optional[np.ndarray] = None
+        if os.path.exists(self._meta_path):
+            with self._file_lock():
+                self._sync()
+            logger.info(f"Loaded {len(self._rows)} cached embeddings from {self.path}")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up stored vectors.
+
+        Args:
+            keys (List[str]): Text keys to look up.
+
+        Returns:
+            Dict[str, np.ndarray]: Vectors for the keys that are cached.
+        """
+        with self._lock:
+            if self._matrix is None:
+                return {}
+            return {key: np.array(self._matrix[self._rows[key]]) for key in keys if key in self._rows}
+
+    def put_many(self, keys: List[str], vectors: np.ndarray) -> None:
+        """
+        Append new vectors to the store.
+
+        Args:
+            keys (List[str]): Text keys, one per row of ``vectors``.
+            vectors (np.ndarray): Embedding matrix of shape (len(keys), dim).
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock:
+            if all(key in self._rows for key in keys):
+                return
+
+            os.makedirs(self.path, exist_ok=True)
+            with self._file_lock():
+                # Rows other processes appended come first
+                self._sync()
+                new: Dict[str, int] = {}
+                for i, key in enumerate(keys):
+                    if key not in self._rows:
+                        new.setdefault(key, i)
+                if not new:
+                    return
+
+                if self._dim is None:
+                    self._dim = vectors.shape[1]
+                    with open(self._meta_path, "w") as f:
+                        json.dump({"dim": self._dim}, f)
+
+                with open(self._vectors_path, "ab") as f:
+                    f.write(vectors[list(new.values())].tobytes())
+                with open(self._keys_path, "a") as f:
+                    f.write("".join(f"{key}\n" for key in new))
+                self._keys_offset = os.path.getsize(self._keys_path)
+
+                for key in new:
+                    self._rows[key] = self._row_count
+                    self._row_count += 1
+                self._map()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        # Serializes appends across processes; a no-op where fcntl is unavailable
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _sync(self) -> None:
+        # Must hold the file lock: reads the keys appended since the last sync
+        if self._dim is None:
+            try:
+                with open(self._meta_path, "r") as f:
+                    self._dim = json.load(f)["dim"]
+            except (OSError, json.JSONDecodeError, KeyError):
+                return
+        try:
+            with open(self._keys_path, "rb") as f:
+                f.seek(self._keys_offset)
+                appended = f.read()
+        except OSError:
+            appended = b""
+        complete = appended[:appended.rfind(b"\n") + 1]
+        self._keys_offset += len(complete)
+        if len(complete) < len(appended):
+            # A torn final key is left by an interrupted append; no append is in progress under the lock
+            with open(self._keys_path, "r+b") as f:
+                f.truncate(self._keys_offset)
+        appended = complete
+
+        for key in appended.decode("ascii").split():
+            self._rows[key] = self._row_count
+            self._row_count += 1
+
+        row_bytes = self._dim * 4
+        if os.path.exists(self._vectors_path) and os.path.getsize(self._vectors_path) > self._row_count * row_bytes:
+            # Rows without keys are left by an interrupted append; drop them so new rows line up
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(self._row_count * row_bytes)
+        self._map()
+
+    def _map(self) -> None:
+        if self._row_count:
+            self._matrix = np.memmap(
+                self._vectors_path, dtype=np.float32, mode="r", shape=(self._row_count, self._dim)
+            )
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that reuses cached vectors for previously seen documents.
+
+    Only ``embed_documents`` is cached; queries are always embedded directly.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache):
+        self.embeddings = embeddings
+        self.cache = cache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [text_key(text) for text in texts]
+        found = self.cache.get_many(keys)
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+
+        if missing:
+            vectors = np.asarray(self.embeddings.embed_documents(list(missing.values())), dtype=np.float32)
+            self.cache.put_many(list(missing.keys()), vectors)
+            found.update(zip(missing.keys(), vectors))
+
+        logger.info(f"Embedded {len(missing)} new texts, reused {len(texts) - len(missing)} cached vectors")
+        return [found[key].tolist() for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+def get_embedding_cache(normalize: bool = True) -> EmbeddingCache:
+    """
+    Open the embedding cache namespace for the configured embedding model.
+
+    Args:
+        normalize (bool): Whether the cached vectors are L2-normalized.
+
+    Returns:
+        EmbeddingCache: Cache for (EMBEDDING_MODEL, EMBEDDING_BACKEND, normalize).
+    """
+    namespace = hashlib.sha256(f"{embedding_model_id()}|{normalize}".encode("utf-8")).hexdigest()[:16]
+    return EmbeddingCache(settings.EMBEDDING_CACHE_PATH, namespace)
@@ -0,0 +1,359 @@
+"""
+Embedding service module for the Employee Search RAG application.
+
+This module handles the embedding model backends: the PyTorch
+sentence-transformers model, and an ONNX Runtime export of the same model,
+optionally with weights dynamically quantized to int8. Exports are checked
+against the PyTorch vectors once, when they are created; serving an exported
+model needs only onnxruntime and tokenizers, not torch.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+ONNX_MODEL_FILENAME = "model.onnx"
+ONNX_META_FILENAME = "embedding.json"
+ONNX_EXPORT_VERSION = "1"
+
+# Texts shaped like the indexed documents and user queries, used to compare backends
+PARITY_TEXTS = [
+    "Alice Johnson has 5 years of experience and is available. Skills: Python, AWS, Docker.",
+    "Dr. Sarah Chen worked on the project Medical Diagnosis Platform (computer vision, healthcare).",
+    "Michael Rodriguez has skill Machine Learning.",
+    "Who has Python and AWS experience?",
+    "Find available React developers",
+    "Machine learning engineers who worked on healthcare projects",
+    "Senior Java developers with at least 8 years of experience",
+    "Someone for a banking payment gateway",
+]
+
+def embedding_model_id(backend: str = settings.EMBEDDING_BACKEND) -> str:
+    """
+    Identify the vectors a backend produces, for the embedding cache and the index manifest.
+
+    The PyTorch backend keeps the plain model name, so existing caches and
+    indexes stay valid; other backends produce slightly different vectors and
+    get their own identifier.
+
+    Args:
+        backend (str): Embedding backend.
+
+    Returns:
+        str: Model name, suffixed with the backend unless it is ``torch``.
+    """
+    if backend == "torch":
+        return settings.EMBEDDING_MODEL
+    return f"{settings.EMBEDDING_MODEL}@{backend}"
+
+def onnx_model_dir(quantize: bool, model_name: str = settings.EMBEDDING_MODEL) -> str:
+    """
+    Return the directory an ONNX export of a model is stored in.
+
+    Args:
+        quantize (bool): Whether the export has int8 weights.
+        model_name (str): HuggingFace model name.
+
+    Returns:
+        str: Directory under ``EMBEDDING_ONNX_PATH``.
+    """
+    safe_name = re.sub(r"[^\w.-]+", "_", model_name)
+    return os.path.join(settings.EMBEDDING_ONNX_PATH, safe_name, "int8" if quantize else "fp32")
+
+def read_onnx_meta(model_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the metadata of an ONNX export.
+
+    Args:
+        model_dir (str): Export directory.
+
+    Returns:
+        Optional[Dict[str, Any]]: Metadata, or None if the export is missing or unreadable.
+    """
+    try:
+        with open(os.path.join(model_dir, ONNX_META_FILENAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def create_torch_embeddings(model_name: str = settings.EMBEDDING_MODEL) -> Embeddings:
+    """
+    Create the PyTorch sentence-transformers embedding model.
+
+    Args:
+        model_name (str): HuggingFace model name.
+
+    Returns:
+        Embeddings: HuggingFace embedding model producing normalized vectors.
+    """
+    # Imported here so that torch and transformers load only when needed
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs={'device': 'cpu'},
+        encode_kwargs={'normalize_embeddings': True}
+    )
+
+def cosine_parity(embeddings: Embeddings, reference: Embeddings, texts: List[str] = PARITY_TEXTS) -> float:
+    """
+    Return the lowest cosine similarity between two models' vectors for the same texts.
+
+    Args:
+        embeddings (Embeddings): Model under test.
+        reference (Embeddings): Reference model, normally the PyTorch backend.
+        texts (List[str]): Texts to embed with both models.
+
+    Returns:
+        float: Minimum cosine similarity over ``texts``.
+    """
+    actual = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+    expected = np.asarray(reference.embed_documents(texts), dtype=np.float32)
+    dots = (actual * expected).sum(axis=1)
+    norms = np.linalg.norm(actual, axis=1) * np.linalg.norm(expected, axis=1)
+    return float((dots / np.maximum(norms, 1e-12)).min())
+
+class OnnxEmbeddings(Embeddings):
+    """
+    Sentence embeddings computed with ONNX Runtime.
+
+    Runs the exported transformer, then applies the pooling of the original
+    sentence-transformers model and L2 normalization in NumPy. Texts are
+    embedded in batches sorted by length, so each batch pads to similar
+    lengths.
+    """
+
+    def __init__(self, model_dir: str, threads: int = settings.EMBEDDING_THREADS, batch_size: int = 32):
+        # Imported here so that the torch backend does not require onnxruntime
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        meta = read_onnx_meta(model_dir)
+        if meta is None:
+            raise FileNotFoundError(f"No ONNX embedding export found in {model_dir}")
+
+        self.model_dir = model_dir
+        self.batch_size = batch_size
+        self.pooling = meta["pooling"]
+        self.dimension = meta["dimension"]
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads > 0:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, ONNX_MODEL_FILENAME), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=meta["max_length"])
+        self.tokenizer.enable_padding(pad_id=meta["pad_token_id"], pad_token=meta["pad_token"])
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+        feeds = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": attention_mask,
+        }
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+
+        hidden = self.session.run(None, feeds)[0]
+        if self.pooling == "cls":
+            pooled = hidden[:, 0]
+        elif self.pooling == "max":
+            pooled = np.where(attention_mask[:, :, None] > 0, hidden, -np.inf).max(axis=1)
+        else:
+            mask = attention_mask[:, :, None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.maximum(norms, 1e-12)).astype(np.float32)
+
+    def embed_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts into a float32 matrix.
+
+        Args:
+            texts (List[str]): Texts to embed.
+
+        Returns:
+            np.ndarray: One normalized row per text, in input order.
+        """
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        for start in range(0, len(order), self.batch_size):
+            rows = order[start:start + self.batch_size]
+            vectors[rows] = self._embed_batch([texts[i] for i in rows])
+        return vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_array(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_batch([text])[0].tolist()
+
+def export_onnx_model(
+    output_dir: str,
+    quantize: bool,
+    model_name: str = settings.EMBEDDING_MODEL,
+    tolerance: float = settings.EMBEDDING_PARITY_TOLERANCE
+) -> Dict[str, Any]:
+    """
+    Export a sentence-transformers model to ONNX, optionally with int8 weights.
+
+    The export is written to a temporary directory, compared with the PyTorch
+    model on ``PARITY_TEXTS`` and only then renamed to ``output_dir``, so a
+    failed or inaccurate export is never used.
+
+    Args:
+        output_dir (str): Directory to write the export to.
+        quantize (bool): Whether to dynamically quantize the weights to int8.
+        model_name (str): HuggingFace model name.
+        tolerance (float): Minimum cosine similarity to the PyTorch vectors.
+
+    Returns:
+        Dict[str, Any]: Metadata of the export.
+
+    Raises:
+        ValueError: If the exported model's vectors differ from PyTorch's beyond ``tolerance``.
+    """
+    # Exporting needs torch, serving the export does not
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    logger.info(f"Exporting embedding model {model_name} to ONNX (int8: {quantize})")
+    model = SentenceTransformer(model_name, device="cpu")
+    transformer = model[0].auto_model.eval()
+    tokenizer = model.tokenizer
+    pooling = model[1].get_pooling_mode_str() if len(model) > 1 else "mean"
+    input_names = [name for name in tokenizer.model_input_names if name in ("input_ids", "attention_mask", "token_type_ids")]
+
+    parent = os.path.dirname(os.path.abspath(output_dir))
+    os.makedirs(parent, exist_ok=True)
+    work_dir = tempfile.mkdtemp(dir=parent, prefix=".export-")
+    try:
+        sample = tokenizer(["employee search"], return_tensors="pt")
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+        fp32_path = os.path.join(work_dir, "model_fp32.onnx")
+        with torch.no_grad():
+            torch.onnx.export(
+                transformer,
+                (dict((name, sample[name]) for name in input_names),),
+                fp32_path,
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=17,
+                do_constant_folding=True
+            )
+
+        model_path = os.path.join(work_dir, ONNX_MODEL_FILENAME)
+        if quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantize_dynamic(fp32_path, model_path, weight_type=QuantType.QInt8)
+            os.remove(fp32_path)
+        else:
+            os.replace(fp32_path, model_path)
+
+        tokenizer.backend_tokenizer.save(os.path.join(work_dir, "tokenizer.json"))
+        meta = {
+            "export_version": ONNX_EXPORT_VERSION,
+            "model": model_name,
+            "quantized": quantize,
+            "pooling": pooling,
+            "dimension": model.get_sentence_embedding_dimension(),
+            "max_length": model.max_seq_length,
+            "pad_token": tokenizer.pad_token,
+            "pad_token_id": tokenizer.pad_token_id,
+        }
+        with open(os.path.join(work_dir, ONNX_META_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        parity = cosine_parity(OnnxEmbeddings(work_dir), create_torch_embeddings(model_name))
+        if parity < tolerance:
+            raise ValueError(
+                f"ONNX export of {model_name} (int8: {quantize}) has cosine similarity {parity:.4f} "
+                f"to the PyTorch vectors, below EMBEDDING_PARITY_TOLERANCE {tolerance}"
+            )
+        meta["parity_min_cosine"] = round(parity, 6)
+        with open(os.path.join(work_dir, ONNX_META_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        if os.path.isdir(output_dir):
+            shutil.rmtree(output_dir)
+        os.makedirs(os.path.dirname(os.path.abspath(output_dir)), exist_ok=True)
+        os.replace(work_dir, output_dir)
+        logger.info(f"Exported embedding model to {output_dir} (min cosine to PyTorch: {parity:.4f})")
+        return meta
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def ensure_onnx_model(quantize: bool, model_name: str = settings.EMBEDDING_MODEL) -> str:
+    """
+    Return the directory of a current ONNX export, exporting the model if needed.
+
+    The export runs under the same file lock as index builds, taken on
+    ``EMBEDDING_ONNX_PATH``, so workers starting together export once.
+
+    Args:
+        quantize (bool): Whether the export should have int8 weights.
+        model_name (str): HuggingFace model name.
+
+    Returns:
+        str: Export directory.
+    """
+    # Imported here because the retriever service imports this module
+    from app.services.retriever_service import index_lock
+
+    model_dir = onnx_model_dir(quantize, model_name)
+
+    def is_current() -> bool:
+        meta = read_onnx_meta(model_dir)
+        return meta is not None and meta.get("export_version") == ONNX_EXPORT_VERSION and meta.get("model") == model_name
+
+    if is_current():
+        return model_dir
+
+    with index_lock(settings.EMBEDDING_ONNX_PATH, exclusive=True):
+        if not is_current():
+            export_onnx_model(model_dir, quantize, model_name)
+    return model_dir
+
+def create_backend_embeddings(backend: str = settings.EMBEDDING_BACKEND, threads: int = settings.EMBEDDING_THREADS) -> Embeddings:
+    """
+    Create the uncached embedding model for a backend.
+
+    Args:
+        backend (str): ``torch``, ``onnx`` or ``onnx-int8``.
+        threads (int): ONNX Runtime intra-op threads; 0 lets ONNX Runtime decide.
+
+    Returns:
+        Embeddings: Embedding model producing normalized vectors.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == "torch":
+        return create_torch_embeddings()
+    if backend in ("onnx", "onnx-int8"):
+        return OnnxEmbeddings(ensure_onnx_model(quantize=backend == "onnx-int8"), threads=threads)
+    raise ValueError(f"Unknown EMBEDDING_BACKEND '{backend}', expected one of {', '.join(EMBEDDING_BACKENDS)}")
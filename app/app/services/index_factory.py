@@ -0,0 +1,179 @@
+"""
+Index factory module for the Employee Search RAG application.
+
+This module builds the FAISS index behind the vector store according to
+``VECTOR_INDEX_TYPE``: exact flat search, HNSW graphs, IVF partitions with
+flat or product-quantized codes, or 8-bit scalar quantization.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+from langchain_community.vectorstores.faiss import dependable_faiss_import
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_TYPES = ("flat", "hnsw", "ivf", "ivfpq", "sq8")
+
+# faiss asks for at least this many training points per IVF list / PQ centroid
+MIN_POINTS_PER_CENTROID = 39
+
+def index_config(**overrides: Any) -> Dict[str, Any]:
+    """
+    Return the index configuration, taken from settings unless overridden.
+
+    Only the parameters relevant to the chosen index type are included, so
+    the result can be stored in the index manifest.
+
+    Args:
+        **overrides: Values replacing the corresponding settings, e.g. ``index_type="hnsw"``.
+
+    Returns:
+        Dict[str, Any]: Index configuration.
+    """
+    config = {
+        "index_type": settings.VECTOR_INDEX_TYPE,
+        "hnsw_m": settings.HNSW_M,
+        "hnsw_ef_construction": settings.HNSW_EF_CONSTRUCTION,
+        "hnsw_ef_search": settings.HNSW_EF_SEARCH,
+        "ivf_nlist": settings.IVF_NLIST,
+        "ivf_nprobe": settings.IVF_NPROBE,
+        "pq_m": settings.PQ_M,
+        "pq_nbits": settings.PQ_NBITS,
+    }
+    config.update(overrides)
+
+    index_type = config["index_type"]
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown VECTOR_INDEX_TYPE '{index_type}', expected one of {INDEX_TYPES}")
+
+    prefixes = {"hnsw": ("hnsw_",), "ivf": ("ivf_",), "ivfpq": ("ivf_", "pq_")}.get(index_type, ())
+    return {
+        key: value for key, value in config.items()
+        if key == "index_type" or key.startswith(prefixes)
+    }
+
+def create_index(dim: int, training_vectors: Optional[np.ndarray] = None, config: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Create an empty FAISS index that accepts explicit 64-bit labels.
+
+    IVF indexes take labels natively and keep a hashtable direct map so
+    vectors can be reconstructed and removed by label. Other types are
+    wrapped in an IndexIDMap2. IVF, PQ and SQ8 indexes are trained on
+    ``training_vectors``; ``nlist`` is reduced when there are too few of
+    them, and IVF-PQ falls back to IVF-Flat if PQ cannot be trained.
+
+    Args:
+        dim (int): Vector dimension.
+        training_vectors (np.ndarray, optional): Vectors used to train IVF/PQ/SQ8 indexes.
+        config (Dict[str, Any], optional): Index configuration, see index_config().
+
+    Returns:
+        Any: Trained, empty FAISS index.
+    """
+    faiss = dependable_faiss_import()
+    config = config or index_config()
+    index_type = config["index_type"]
+
+    if index_type == "flat":
+        return faiss.IndexIDMap2(faiss.IndexFlatL2(dim))
+
+    if index_type == "sq8":
+        sq = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit)
+        if training_vectors is not None and len(training_vectors):
+            sq.train(np.ascontiguousarray(training_vectors, dtype=np.float32))
+        return faiss.IndexIDMap2(sq)
+
+    if index_type == "hnsw":
+        hnsw = faiss.IndexHNSWFlat(dim, config["hnsw_m"])
+        hnsw.hnsw.efConstruction = config["hnsw_ef_construction"]
+        hnsw.hnsw.efSearch = config["hnsw_ef_search"]
+        return faiss.IndexIDMap2(hnsw)
+
+    n_train = 0 if training_vectors is None else len(training_vectors)
+    nlist = max(1, min(config["ivf_nlist"], n_train // MIN_POINTS_PER_CENTROID))
+    if nlist < config["ivf_nlist"]:
+        logger.warning(f"Only {n_train} training vectors, reducing IVF nlist from {config['ivf_nlist']} to {nlist}")
+
+    quantizer = faiss.IndexFlatL2(dim)
+    if index_type == "ivfpq" and dim % config["pq_m"] == 0 and n_train >= MIN_POINTS_PER_CENTROID * (1 << config["pq_nbits"]):
+        index = faiss.IndexIVFPQ(quantizer, dim, nlist, config["pq_m"], config["pq_nbits"])
+    else:
+        if index_type == "ivfpq":
+            logger.warning("Cannot train PQ with these settings or this little data, falling back to IVF-Flat")
+        index = faiss.IndexIVFFlat(quantizer, dim, nlist)
+
+    if n_train:
+        index.train(np.ascontiguousarray(training_vectors, dtype=np.float32))
+    index.nprobe = min(config["ivf_nprobe"], nlist)
+    index.set_direct_map_type(faiss.DirectMap.Hashtable)
+    return index
+
+def needs_training(config: Dict[str, Any]) -> bool:
+    """
+    Check whether an index type must be trained before vectors are added.
+
+    Args:
+        config (Dict[str, Any]): Index configuration, see index_config().
+
+    Returns:
+        bool: True for IVF, IVF-PQ and SQ8 indexes.
+    """
+    return config["index_type"] in ("ivf", "ivfpq", "sq8")
+
+def supports_remove(index: Any) -> bool:
+    """
+    Check whether an index supports removing vectors in place.
+
+    Args:
+        index (Any): FAISS index.
+
+    Returns:
+        bool: False for HNSW graphs, True otherwise.
+    """
+    faiss = dependable_faiss_import()
+    inner = faiss.downcast_index(index.index) if isinstance(index, faiss.IndexIDMap2) else index
+    return not isinstance(inner, faiss.IndexHNSW)
+
+def search_parameters(index: Any, selector: Optional[Any] = None) -> Optional[Any]:
+    """
+    Build search parameters matching the index type.
+
+    FAISS rejects parameter objects of the wrong type, and a generic object
+    would reset nprobe/efSearch to their defaults, so the type-specific
+    variant carrying the index's configured values is returned.
+
+    Args:
+        index (Any): FAISS index to search.
+        selector (Any, optional): ID selector restricting the search.
+
+    Returns:
+        Optional[Any]: Search parameters, or None when no selector is needed.
+    """
+    if selector is None:
+        return None
+
+    faiss = dependable_faiss_import()
+    inner = faiss.downcast_index(index.index) if isinstance(index, faiss.IndexIDMap2) else index
+
+    if isinstance(inner, faiss.IndexIVF):
+        return faiss.SearchParametersIVF(sel=selector, nprobe=inner.nprobe)
+    if isinstance(inner, faiss.IndexHNSW):
+        return faiss.SearchParametersHNSW(sel=selector, efSearch=inner.hnsw.efSearch)
+    return faiss.SearchParameters(sel=selector)
+
+def index_bytes(index: Any) -> int:
+    """
+    Return the serialized size of an index.
+
+    Args:
+        index (Any): FAISS index.
+
+    Returns:
+        int: Size in bytes.
+    """
+    faiss = dependable_faiss_import()
+    return int(faiss.serialize_index(index).size)
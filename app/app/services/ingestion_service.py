@@ -0,0 +1,178 @@
+"""
+Ingestion service module for the Employee Search RAG application.
+
+This module handles the streaming side of index builds: employee chunks are
+turned into documents lazily, embedded (optionally across a pool of worker
+processes) and handed to the vector store one chunk at a time, so peak memory
+is bounded by the chunk size rather than the dataset size.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+from app.services.embedding_cache import CachedEmbeddings
+
+logger = logging.getLogger(__name__)
+
+# Embedding model of the current worker process, set by _init_worker
+_worker_embeddings: Optional[Embeddings] = None
+
+def _init_worker(factory: Callable[[], Embeddings], threads: int) -> None:
+    global _worker_embeddings
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    # ONNX Runtime sessions take their thread count from the settings
+    settings.EMBEDDING_THREADS = threads
+    _worker_embeddings = factory()
+
+def _embed_in_worker(texts: List[str]) -> np.ndarray:
+    return np.asarray(_worker_embeddings.embed_documents(texts), dtype=np.float32)
+
+class ProcessPoolEmbeddings(Embeddings):
+    """
+    Embeddings that spread document batches over a pool of worker processes.
+
+    Each worker loads its own copy of the model from ``factory``, which must be
+    a picklable top-level callable, and gets an equal share of the CPU threads.
+    Workers are started with ``spawn`` so they do not inherit the parent's
+    torch thread pools.
+    """
+
+    def __init__(self, factory: Callable[[], Embeddings], workers: int, batch_size: int = 64):
+        self.workers = workers
+        self.batch_size = batch_size
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(factory, threads)
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        vectors = list(self._pool.map(_embed_in_worker, batches))
+        if not vectors:
+            return []
+        return np.concatenate(vectors).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._pool.shutdown()
+
+class IngestionProgress:
+    """
+    Running totals and throughput of an ingestion run.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.employees = 0
+        self.documents = 0
+        self.chunks = 0
+
+    def update(self, employees: int, documents: int) -> None:
+        """
+        Record a finished chunk and log progress.
+
+        Args:
+            employees (int): Employees in the chunk.
+            documents (int): Documents in the chunk.
+        """
+        self.employees += employees
+        self.documents += documents
+        self.chunks += 1
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        logger.info(
+            f"Ingested {self.employees} employees / {self.documents} documents in {elapsed:.1f}s "
+            f"({self.employees / elapsed:.0f} employees/s, {self.documents / elapsed:.0f} documents/s)"
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the totals and throughput so far.
+
+        Returns:
+            Dict[str, Any]: Counts, elapsed seconds and rates.
+        """
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "employees": self.employees,
+            "documents": self.documents,
+            "chunks": self.chunks,
+            "seconds": round(elapsed, 3),
+            "employees_per_second": round(self.employees / elapsed, 1),
+            "documents_per_second": round(self.documents / elapsed, 1),
+        }
+
+def parallel_embeddings(embeddings: Embeddings, factory: Callable[[], Embeddings], workers: int) -> Embeddings:
+    """
+    Wrap an embedding model so that document embeddings run in worker processes.
+
+    The persistent embedding cache stays in the parent process, so only
+    uncached texts are sent to the workers.
+
+    Args:
+        embeddings (Embeddings): Embedding model, possibly cache-wrapped.
+        factory (Callable[[], Embeddings]): Creates the uncached model in each worker.
+        workers (int): Number of worker processes.
+
+    Returns:
+        Embeddings: Embeddings backed by a process pool.
+    """
+    pool = ProcessPoolEmbeddings(factory, workers)
+    if isinstance(embeddings, CachedEmbeddings):
+        return CachedEmbeddings(pool, embeddings.cache)
+    return pool
+
+def close_embeddings(embeddings: Embeddings) -> None:
+    """Shut down the process pool behind embeddings from parallel_embeddings, if any."""
+    if isinstance(embeddings, CachedEmbeddings):
+        embeddings = embeddings.embeddings
+    if isinstance(embeddings, ProcessPoolEmbeddings):
+        embeddings.close()
+
+def embed_employee_chunks(
+    chunks: Iterable[List[Dict[str, Any]]],
+    embeddings: Embeddings,
+    build_documents: Callable[[Dict[str, Any]], List[Document]]
+) -> Iterator[Tuple[List[Tuple[int, List[Document]]], np.ndarray]]:
+    """
+    Build and embed the documents of each employee chunk.
+
+    Documents are only built for the chunk being embedded, and nothing from
+    earlier chunks is retained, so memory stays proportional to the chunk.
+
+    Args:
+        chunks (Iterable[List[Dict[str, Any]]]): Chunks of employee records.
+        embeddings (Embeddings): Embedding model.
+        build_documents (Callable): Builds the documents of one employee.
+
+    Yields:
+        Tuple[List[Tuple[int, List[Document]]], np.ndarray]: (employee id, documents)
+        pairs of the chunk and the float32 vectors of all its documents, in order.
+    """
+    progress = IngestionProgress()
+    for chunk in chunks:
+        docs_by_employee = [(emp["id"], build_documents(emp)) for emp in chunk]
+        texts = [doc.page_content for _, docs in docs_by_employee for doc in docs]
+        vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+        yield docs_by_employee, vectors
+        progress.update(len(chunk), len(texts))
+
+    logger.info(f"Ingestion finished: {progress.summary()}")
@@ -0,0 +1,120 @@
+"""
+Journal service module for the Employee Search RAG application.
+
+This module records employee writes in an append-only JSON Lines journal next
+to the data file. A write appends one line instead of rewriting the data file
+and the persisted indexes; the journal is replayed on top of them when the
+data is loaded, and folded into them by compaction.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Tuple
+
+from app.core.config import settings
+from app.services.data_service import resolve_data_path
+
+logger = logging.getLogger(__name__)
+
+def journal_path(file_path: str = settings.DATA_PATH) -> str:
+    """
+    Return the path of the write journal of a data file.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+
+    Returns:
+        str: Absolute path to the journal, the data file path with a ``.journal`` suffix.
+    """
+    return f"{resolve_data_path(file_path)}.journal"
+
+def journal_size(file_path: str = settings.DATA_PATH) -> int:
+    """
+    Return the size of the write journal in bytes, 0 if there is none.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+
+    Returns:
+        int: Journal size in bytes.
+    """
+    try:
+        return os.path.getsize(journal_path(file_path))
+    except OSError:
+        return 0
+
+def append_journal(entry: Dict[str, Any], file_path: str = settings.DATA_PATH) -> Tuple[int, int]:
+    """
+    Durably append a write to the journal.
+
+    Callers hold ``index_lock(exclusive=True)`` so that appends from several
+    workers and compactions do not interleave.
+
+    Args:
+        entry (Dict[str, Any]): Write to record, ``{"op": "upsert", "employee": {...}}``
+            or ``{"op": "delete", "id": ...}``.
+        file_path (str): Path to the data file, relative to the application root.
+
+    Returns:
+        Tuple[int, int]: Journal size before and after the append.
+    """
+    with open(journal_path(file_path), "a", encoding="utf-8") as f:
+        start = f.tell()
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+        return start, f.tell()
+
+def read_journal(file_path: str = settings.DATA_PATH) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read the writes recorded in the journal, oldest first.
+
+    A last line without a newline is an append still in progress or cut
+    short by a crash, and is left out.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], int]: The writes, and the journal size they cover in bytes.
+    """
+    try:
+        with open(journal_path(file_path), "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return [], 0
+
+    end = data.rfind(b"\n") + 1
+    if end < len(data):
+        logger.warning(f"Ignoring an incomplete write at the end of {journal_path(file_path)}")
+    entries = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+    return entries, end
+
+def journal_length(file_path: str = settings.DATA_PATH) -> int:
+    """
+    Count the writes recorded in the journal.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+
+    Returns:
+        int: Number of complete journal lines.
+    """
+    try:
+        with open(journal_path(file_path), "rb") as f:
+            return f.read().count(b"\n")
+    except FileNotFoundError:
+        return 0
+
+def clear_journal(file_path: str = settings.DATA_PATH) -> None:
+    """
+    Remove the journal once its writes are saved to the data file and indexes.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+    """
+    try:
+        os.remove(journal_path(file_path))
+    except FileNotFoundError:
+        pass
@@ -5,18 +5,30 @@ This module handles all LLM-related functionality including chain building,
 prompt management, and response generation.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import threading
+import time
+from typing import Dict, Any, Optional, List, AsyncIterator, Iterator, Tuple, Union
+from uuid import UUID
 from langchain_community.llms import Ollama
 from langchain.chains import RetrievalQA
 from langchain.prompts import PromptTemplate
 from langchain.chains.combine_documents import create_stuff_documents_chain
 from langchain.chains import create_retrieval_chain
-from langchain_core.runnables import RunnablePassthrough
-import requests
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.documents import Document
+from langchain_core.outputs import LLMResult
 
 from app.core.config import settings
+from app.services.context_service import default_context_budget, estimate_tokens
+from app.services.metrics_service import (
+    GENERATED_TOKENS, PROMPT_TOKENS, RETRIEVED_DOCUMENTS, TIME_TO_FIRST_TOKEN, TOKENS_PER_SECOND, observe_stage
+)
+from app.services.ollama_service import get_ollama_pool, ollama_base_urls
+from app.services.query_parser import is_follow_up
 from app.services.retriever_service import get_retriever
+from app.services.session_service import ChatSession
 
 logger = logging.getLogger(__name__)
 
@@ -24,67 +36,634 @@ def check_ollama_connection() -> bool:
     """
     Check if the Ollama service is running and accessible.
 
+    Reads the health cached by the Ollama pool's background checks rather
+    than querying Ollama inline.
+
     Returns:
-        bool: True if Ollama is running and accessible, False otherwise.
+        bool: True if at least one Ollama server is running and accessible, False otherwise.
     """
-    try:
-        response = requests.get(f"{settings.OLLAMA_BASE_URL}/api/tags")
-        return response.status_code == 200
-    except requests.exceptions.ConnectionError:
-        return False
+    return get_ollama_pool().healthy
+
+def keep_alive_value(keep_alive: str) -> Union[int, str]:
+    """
+    Convert OLLAMA_KEEP_ALIVE to what Ollama expects.
+
+    Args:
+        keep_alive (str): Duration such as ``"30m"``, or a number of seconds such as ``"-1"``.
+
+    Returns:
+        Union[int, str]: Seconds as an int, durations unchanged.
+    """
+    return int(keep_alive) if keep_alive.lstrip("-").isdigit() else keep_alive
+
+class PooledOllama(Ollama):
+    """
+    Ollama LLM that sends its requests through the shared OllamaPool.
+
+    Builds the same request body as the LangChain wrapper but, instead of a
+    new connection per call, streams it over the pool's keep-alive
+    connections to the least-loaded healthy server, behind its circuit
+    breaker. A ``context`` bound with ``llm.bind(context=...)`` continues a
+    previous generation.
+    """
+
+    def _request_body(self, payload: Any, stop: Optional[List[str]], **kwargs: Any) -> Dict[str, Any]:
+        # Ollama takes the context of a previous generation at the top level, not as an option
+        context = kwargs.pop("context", None)
+        if self.stop is not None and stop is not None:
+            raise ValueError("`stop` found in both the input and default params.")
+        elif self.stop is not None:
+            stop = self.stop
+
+        params = self._default_params
+        for key in self._default_params:
+            if key in kwargs:
+                params[key] = kwargs[key]
+
+        if "options" in kwargs:
+            params["options"] = kwargs["options"]
+        else:
+            params["options"] = {
+                **params["options"],
+                "stop": stop,
+                **{k: v for k, v in kwargs.items() if k not in self._default_params},
+            }
+
+        if payload.get("messages"):
+            return {"messages": payload.get("messages", []), **params}
+        body = {"prompt": payload.get("prompt"), "images": payload.get("images", []), **params}
+        if context:
+            body["context"] = context
+        return body
+
+    def _api_path(self, api_url: str) -> str:
+        # The pool picks the server, so only the path of the wrapper's URL is kept
+        return api_url[len(self.base_url):] if api_url.startswith(self.base_url) else api_url
+
+    def _create_stream(self, api_url: str, payload: Any, stop: Optional[List[str]] = None, **kwargs: Any) -> Iterator[str]:
+        body = self._request_body(payload, stop, **kwargs)
+        yield from get_ollama_pool().stream_lines(self._api_path(api_url), body, self.headers)
+
+    async def _acreate_stream(
+        self,
+        api_url: str,
+        payload: Any,
+        stop: Optional[List[str]] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        body = self._request_body(payload, stop, **kwargs)
+        async for line in get_ollama_pool().astream_lines(self._api_path(api_url), body, self.headers):
+            yield line
 
 def get_llm() -> Ollama:
     """
     Initialize and return the Ollama LLM instance.
 
     Returns:
-        Ollama: Configured LLM instance.
+        Ollama: Configured LLM instance using the shared Ollama pool.
 
     Raises:
         ConnectionError: If Ollama service is not running.
     """
     if not check_ollama_connection():
         raise ConnectionError(
-            f"Cannot connect to Ollama at {settings.OLLAMA_BASE_URL}. "
+            f"Cannot connect to Ollama at {', '.join(ollama_base_urls())}. "
             "Make sure it's running with 'ollama run mistral:7b'"
         )
     
-    return Ollama(
+    return PooledOllama(
+        base_url=ollama_base_urls()[0],
         model=settings.LLM_MODEL,
         temperature=settings.LLM_TEMPERATURE,
         num_ctx=settings.LLM_CONTEXT_SIZE,
+        keep_alive=keep_alive_value(settings.OLLAMA_KEEP_ALIVE),
         stop=["Human:", "Assistant:"]
     )
 
-def get_qa_chain(prompt: PromptTemplate) -> Any:
+class LLMMetricsCallback(BaseCallbackHandler):
+    """
+    Callback handler timing the document chain and the Ollama call.
+
+    Records prompt assembly (chain start until the LLM is called), time to
+    first token, the whole LLM call, and Ollama's own prompt evaluation and
+    generation durations, token counts and tokens per second.
+    """
+
+    # Run in the caller's context so the request's Server-Timing sees the stages
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chain_starts: Dict[UUID, float] = {}
+        self._llm_runs: Dict[UUID, Dict[str, Any]] = {}
+
+    def on_chain_start(self, serialized: Any, inputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._chain_starts[run_id] = time.perf_counter()
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._chain_starts.pop(run_id, None)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._chain_starts.pop(run_id, None)
+
+    def on_llm_start(
+        self,
+        serialized: Any,
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any
+    ) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            chain_start = self._chain_starts.get(parent_run_id)
+            self._llm_runs[run_id] = {
+                "start": now,
+                "first_token": None,
+                "tokens": 0,
+                "prompt_tokens": sum(estimate_tokens(prompt) for prompt in prompts),
+            }
+        if chain_start is not None:
+            observe_stage("prompt", now - chain_start)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._llm_runs.get(run_id)
+            if run is None:
+                return
+            run["tokens"] += 1
+            if run["first_token"] is not None:
+                return
+            run["first_token"] = time.perf_counter()
+        ttft = run["first_token"] - run["start"]
+        TIME_TO_FIRST_TOKEN.observe(ttft)
+        observe_stage("llm_first_token", ttft)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._llm_runs.pop(run_id, None)
+        if run is None:
+            return
+        observe_stage("llm", time.perf_counter() - run["start"])
+
+        info = {}
+        if response.generations and response.generations[0]:
+            info = response.generations[0][0].generation_info or {}
+
+        PROMPT_TOKENS.observe(info.get("prompt_eval_count") or run["prompt_tokens"])
+        eval_count = info.get("eval_count") or run["tokens"]
+        GENERATED_TOKENS.observe(eval_count)
+
+        # Ollama reports durations in nanoseconds
+        if info.get("prompt_eval_duration"):
+            observe_stage("llm_prompt_eval", info["prompt_eval_duration"] / 1e9)
+        if info.get("eval_duration"):
+            observe_stage("llm_generate", info["eval_duration"] / 1e9)
+            TOKENS_PER_SECOND.observe(eval_count / (info["eval_duration"] / 1e9))
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._llm_runs.pop(run_id, None)
+
+class OllamaContextCallback(BaseCallbackHandler):
+    """
+    Callback handler capturing the ``context`` tokens Ollama returns with a generation.
+
+    One instance is attached per call, so concurrent generations do not mix
+    up their contexts.
+    """
+
+    run_inline = True
+
+    def __init__(self):
+        self.context: Optional[List[int]] = None
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        if response.generations and response.generations[0]:
+            info = response.generations[0][0].generation_info or {}
+            self.context = info.get("context") or self.context
+
+class SessionTurn:
+    """
+    Generation plan for one turn of a chat session.
+
+    Holds the document chain and its input for the turn, whether it continues
+    the session's Ollama context, and the callback capturing the context
+    Ollama returns.
+    """
+
+    def __init__(self, chain: Any, inputs: Dict[str, Any], continued: bool):
+        self.chain = chain
+        self.inputs = inputs
+        self.continued = continued
+        self.capture = OllamaContextCallback()
+
+class QAChain:
+    """
+    Retrieval QA pipeline that exposes the retrieval step separately.
+
+    Keeping retrieval and generation apart lets callers report the retrieved
+    employees before the LLM has produced its first token. ``callbacks`` are
+    attached to every document chain call. ``llm`` and ``follow_up_prompt``
+    are needed for chat sessions only.
+    """
+
+    def __init__(
+        self,
+        retriever: Any,
+        document_chain: Any,
+        callbacks: Optional[List[BaseCallbackHandler]] = None,
+        llm: Optional[Any] = None,
+        follow_up_prompt: Optional[PromptTemplate] = None
+    ):
+        self.retriever = retriever
+        self.document_chain = document_chain
+        self.callbacks = callbacks or []
+        self.llm = llm
+        self.follow_up_prompt = follow_up_prompt
+
+    def _generation_input(self, query: str, docs: List[Document], **extra: Any) -> Dict[str, Any]:
+        RETRIEVED_DOCUMENTS.observe(len(docs))
+        return {"context": docs, "question": query, **extra}
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        return {"callbacks": self.callbacks}
+
+    def with_retriever(self, retriever: Any) -> "QAChain":
+        """
+        Return a copy of the chain retrieving with another retriever.
+
+        The LLM, document chain and callbacks are shared; the context budget
+        sized for the prompt is carried over to the new retriever.
+
+        Args:
+            retriever (Any): Retriever of a reloaded index.
+
+        Returns:
+            QAChain: Chain generating like this one from ``retriever``'s documents.
+        """
+        if getattr(retriever, "group_by_employee", False) and retriever.context_token_budget is None:
+            retriever.context_token_budget = getattr(self.retriever, "context_token_budget", None)
+        return QAChain(
+            retriever,
+            self.document_chain,
+            callbacks=self.callbacks,
+            llm=self.llm,
+            follow_up_prompt=self.follow_up_prompt
+        )
+
+    def retriever_for(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        extracted: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Return the retriever to use for a request.
+
+        Args:
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+            extracted (Dict[str, Any], optional): Filters already extracted from the query.
+
+        Returns:
+            Any: The chain's retriever, restricted by ``filters`` if given.
+        """
+        if (filters or extracted is not None) and hasattr(self.retriever, "with_filters"):
+            return self.retriever.with_filters(filters, extracted)
+        return self.retriever
+
+    def invoke(self, query: str, filters: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Retrieve context for a query and generate the full answer.
+
+        Args:
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+
+        Returns:
+            str: Generated answer.
+        """
+        docs = self.retriever_for(filters).invoke(query)
+        return self.document_chain.invoke(self._generation_input(query, docs), config=self._config)
+
+    async def ainvoke(self, query: str, filters: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Asynchronously retrieve context for a query and generate the full answer.
+
+        Args:
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+
+        Returns:
+            str: Generated answer.
+        """
+        answer, _ = await self.ainvoke_with_docs(query, filters)
+        return answer
+
+    async def ainvoke_with_docs(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        extracted: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, List[Document]]:
+        """
+        Asynchronously generate an answer and return the documents it was based on.
+
+        Args:
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+            extracted (Dict[str, Any], optional): Filters already extracted from the query.
+
+        Returns:
+            Tuple[str, List[Document]]: Generated answer and retrieved documents.
+        """
+        docs = await self.aretrieve(query, filters, extracted)
+        answer = await self.document_chain.ainvoke(self._generation_input(query, docs), config=self._config)
+        return answer, docs
+
+    async def aretrieve(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        extracted: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Asynchronously retrieve context for a query, without generating.
+
+        Args:
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+            extracted (Dict[str, Any], optional): Filters already extracted from the query.
+
+        Returns:
+            List[Document]: Retrieved documents.
+        """
+        return await self.retriever_for(filters, extracted).ainvoke(query)
+
+    async def aretrieve_batch(
+        self,
+        queries: List[str],
+        query_vectors: List[List[float]],
+        filters: Optional[List[Optional[Dict[str, Any]]]] = None,
+        extracted: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[List[Document]]:
+        """
+        Asynchronously retrieve context for many embedded queries at once.
+
+        Args:
+            queries (List[str]): User questions.
+            query_vectors (List[List[float]]): Query embeddings.
+            filters (List[Optional[Dict[str, Any]]], optional): Explicit structured pre-filters per query.
+            extracted (List[Optional[Dict[str, Any]]], optional): Filters already extracted from each query.
+
+        Returns:
+            List[List[Document]]: Retrieved documents per query, in input order.
+        """
+        return await asyncio.to_thread(self.retriever.search_batch, queries, query_vectors, filters, extracted)
+
+    async def agenerate(self, query: str, docs: List[Document]) -> str:
+        """
+        Asynchronously generate an answer from already retrieved documents.
+
+        Args:
+            query (str): User question.
+            docs (List[Document]): Retrieved documents.
+
+        Returns:
+            str: Generated answer.
+        """
+        return await self.document_chain.ainvoke(self._generation_input(query, docs), config=self._config)
+
+    async def astream(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        extracted: Optional[Dict[str, Any]] = None,
+        docs: Optional[List[Document]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream an answer as events.
+
+        The first event carries the retrieved employee ids; every following
+        event carries one chunk of generated text as Ollama produces it.
+
+        Args:
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+            extracted (Dict[str, Any], optional): Filters already extracted from the query.
+            docs (List[Document], optional): Documents already retrieved; retrieved here if not given.
+
+        Yields:
+            Dict[str, Any]: ``{"employee_ids": [...]}`` followed by ``{"token": str}`` events.
+        """
+        if docs is None:
+            docs = await self.aretrieve(query, filters, extracted)
+        yield {"employee_ids": get_employee_ids(docs)}
+
+        async for token in self.document_chain.astream(self._generation_input(query, docs), config=self._config):
+            yield {"token": token}
+
+    def session_retriever(self, session: ChatSession, query: str, filters: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Return the retriever for a turn of a chat session.
+
+        Follow-up questions ("which of them know Kubernetes?") are narrowed
+        to the employees retrieved for the previous answer.
+
+        Args:
+            session (ChatSession): Chat session.
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+
+        Returns:
+            Any: Retriever for the turn.
+        """
+        retriever = self.retriever_for(filters)
+        if session.employee_ids and is_follow_up(query) and hasattr(retriever, "with_candidates"):
+            return retriever.with_candidates(session.employee_ids)
+        return retriever
+
+    async def aretrieve_in_session(
+        self,
+        session: ChatSession,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Asynchronously retrieve context for a turn of a chat session, without generating.
+
+        Args:
+            session (ChatSession): Chat session.
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+
+        Returns:
+            List[Document]: Retrieved documents.
+        """
+        return await self.session_retriever(session, query, filters).ainvoke(query)
+
+    def plan_turn(self, session: ChatSession, query: str, docs: List[Document]) -> SessionTurn:
+        """
+        Decide how to generate the answer to a turn of a chat session.
+
+        A question that does not follow up on the conversation is answered
+        like a stateless one. A follow-up continues the Ollama context of the
+        previous turn when it still fits the context window, sending only the
+        documents of employees Ollama has not seen yet; otherwise the earlier
+        turns are replayed as text in the follow-up prompt.
+
+        Args:
+            session (ChatSession): Chat session.
+            query (str): User question.
+            docs (List[Document]): Retrieved documents.
+
+        Returns:
+            SessionTurn: Chain, input and context handling for the turn.
+        """
+        if self.llm is None or self.follow_up_prompt is None or not session.turns or not is_follow_up(query):
+            return SessionTurn(self.document_chain, self._generation_input(query, docs), continued=False)
+
+        new_docs = [doc for doc in docs if doc.metadata["id"] not in session.sent_employee_ids]
+        prompt_tokens = (
+            estimate_tokens(self.follow_up_prompt.template)
+            + estimate_tokens(query)
+            + sum(estimate_tokens(doc.page_content) for doc in new_docs)
+        )
+        context = session.ollama_context
+        if (
+            settings.SESSION_CONTEXT_REUSE
+            and context
+            and len(context) + prompt_tokens + settings.LLM_RESPONSE_TOKENS <= settings.LLM_CONTEXT_SIZE
+        ):
+            chain = create_stuff_documents_chain(self.llm.bind(context=context), self.follow_up_prompt)
+            inputs = self._generation_input(query, new_docs, history="(continued from the conversation above)")
+            return SessionTurn(chain, inputs, continued=True)
+
+        chain = create_stuff_documents_chain(self.llm, self.follow_up_prompt)
+        return SessionTurn(chain, self._generation_input(query, docs, history=session.history()), continued=False)
+
+    async def ainvoke_in_session(
+        self,
+        session: ChatSession,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        docs: Optional[List[Document]] = None
+    ) -> Tuple[str, List[Document]]:
+        """
+        Asynchronously answer one turn of a chat session and record it.
+
+        Callers serialize the turns of a session with ``session.lock``.
+
+        Args:
+            session (ChatSession): Chat session.
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+            docs (List[Document], optional): Documents already retrieved; retrieved here if not given.
+
+        Returns:
+            Tuple[str, List[Document]]: Generated answer and retrieved documents.
+        """
+        if docs is None:
+            docs = await self.aretrieve_in_session(session, query, filters)
+        turn = self.plan_turn(session, query, docs)
+        answer = await turn.chain.ainvoke(turn.inputs, config={"callbacks": self.callbacks + [turn.capture]})
+        session.record_turn(query, answer, get_employee_ids(docs), turn.capture.context, turn.continued)
+        return answer, docs
+
+    async def astream_in_session(
+        self,
+        session: ChatSession,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        docs: Optional[List[Document]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream one turn of a chat session as events and record it once complete.
+
+        Args:
+            session (ChatSession): Chat session.
+            query (str): User question.
+            filters (Dict[str, Any], optional): Explicit structured pre-filters.
+            docs (List[Document], optional): Documents already retrieved; retrieved here if not given.
+
+        Yields:
+            Dict[str, Any]: ``{"employee_ids": [...]}`` followed by ``{"token": str}`` events.
+        """
+        if docs is None:
+            docs = await self.aretrieve_in_session(session, query, filters)
+        employee_ids = get_employee_ids(docs)
+        yield {"employee_ids": employee_ids}
+
+        turn = self.plan_turn(session, query, docs)
+        chunks = []
+        async for token in turn.chain.astream(turn.inputs, config={"callbacks": self.callbacks + [turn.capture]}):
+            chunks.append(token)
+            yield {"token": token}
+        session.record_turn(query, "".join(chunks), employee_ids, turn.capture.context, turn.continued)
+
+def get_employee_ids(docs: List[Document]) -> List[int]:
+    """
+    Collect the distinct employee ids referenced by retrieved documents.
+
+    Args:
+        docs (List[Document]): Retrieved documents.
+
+    Returns:
+        List[int]: Employee ids in retrieval order.
+    """
+    return list(dict.fromkeys(doc.metadata["id"] for doc in docs))
+
+def get_qa_chain(
+    prompt: PromptTemplate,
+    retriever: Optional[Any] = None,
+    llm: Optional[Ollama] = None,
+    follow_up_prompt: Optional[PromptTemplate] = None
+) -> QAChain:
     """
     Build and return a Question-Answering chain.
 
+    Args:
+        prompt (PromptTemplate): Prompt used to stuff the retrieved documents.
+        retriever (Any, optional): Retriever to use. Built via get_retriever if not given.
+        llm (Ollama, optional): LLM to generate with. Created via get_llm if not given.
+        follow_up_prompt (PromptTemplate, optional): Prompt for follow-up questions in chat sessions.
+
     Returns:
-        Any: Configured QA chain.
+        QAChain: Configured QA chain.
 
     Raises:
         Exception: If there's an error building the chain.
     """
     try:
-        logger.info("Initializing LLM")
-        llm = get_llm()
+        if llm is None:
+            logger.info("Initializing LLM")
+            llm = get_llm()
         
-        logger.info("Building vector store")
-        retriever = get_retriever()
+        if retriever is None:
+            logger.info("Building vector store")
+            retriever = get_retriever()
+
+        # Size the packed context to what the prompt leaves of the LLM window
+        if getattr(retriever, "group_by_employee", False) and retriever.context_token_budget is None:
+            retriever.context_token_budget = default_context_budget(prompt.template)
+            logger.info(f"Packing retrieved context into {retriever.context_token_budget} tokens")
 
         
         # Create document chain
         document_chain = create_stuff_documents_chain(llm, prompt)
         
-        # Create the final chain with proper input handling
-        chain = (
-            {"context": retriever, "question": RunnablePassthrough()}
-            | document_chain
+        return QAChain(
+            retriever,
+            document_chain,
+            callbacks=[LLMMetricsCallback()],
+            llm=llm,
+            follow_up_prompt=follow_up_prompt
         )
         
-        return chain
-        
     except Exception as e:
         logger.error(f"Error building QA chain: {str(e)}")
         raise 
\ No newline at end of file
@@ -0,0 +1,273 @@
+"""
+Metrics service module for the Employee Search RAG application.
+
+This module handles latency and throughput instrumentation: a small
+thread-safe metrics registry rendered in the Prometheus text format, and
+per-stage timers that also feed the ``Server-Timing`` header of the current
+request. It has no dependencies beyond the standard library so the API can
+import it before the ML stack is loaded.
+"""
+
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192)
+RATE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def escape_label_value(value: str) -> str:
+    """Escape backslashes, quotes and newlines in a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Render a label set as ``{name="value",...}``."""
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label_value(value)}"' for name, value in pairs) + "}"
+
+def format_value(value: float) -> str:
+    """Render a sample value the way Prometheus expects."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class Metric:
+    """
+    Base class of registry metrics.
+
+    Samples are kept per label set; ``labelnames`` fixes which labels a
+    metric takes, so typos fail loudly instead of creating new series.
+    """
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple((name, str(labels[name])) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter of a label set by ``amount``."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            return [f"{self.name}{format_labels(key)} {format_value(value)}" for key, value in self._values.items()]
+
+class Gauge(Metric):
+    """
+    Gauge that is either set explicitly or read from ``function`` at scrape time.
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, *args: Any, function: Optional[Callable[[], float]] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.function = function
+        self._values: Dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge of a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self) -> List[str]:
+        if self.function is not None:
+            try:
+                return [f"{self.name} {format_value(self.function())}"]
+            except Exception as e:
+                logger.warning(f"Error collecting gauge {self.name}: {str(e)}")
+                return []
+        with self._lock:
+            return [f"{self.name}{format_labels(key)} {format_value(value)}" for key, value in self._values.items()]
+
+class Histogram(Metric):
+    """Histogram with cumulative buckets, a sum and a count per label set."""
+
+    type_name = "histogram"
+
+    def __init__(self, *args: Any, buckets: Sequence[float] = LATENCY_BUCKETS, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelKey, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, (counts, total) in self._values.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets + (math.inf,), counts):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{format_labels(key, ('le', format_value(bound)))} {cumulative}")
+                lines.append(f"{self.name}_sum{format_labels(key)} {format_value(total[0])}")
+                lines.append(f"{self.name}_count{format_labels(key)} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """Collection of metrics rendered together on ``/metrics``."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Add a metric, or return the already registered metric of that name.
+
+        Args:
+            metric (Metric): Metric to register.
+
+        Returns:
+            Metric: The registered metric.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.register(Counter(
+    "rag_http_requests_total", "HTTP requests by route and status.", ["method", "route", "status"]
+))
+HTTP_DURATION = registry.register(Histogram(
+    "rag_http_request_duration_seconds", "HTTP request latency until the response starts.", ["method", "route"]
+))
+STAGE_DURATION = registry.register(Histogram(
+    "rag_stage_duration_seconds", "Latency of each request processing stage.", ["stage"]
+))
+RETRIEVED_DOCUMENTS = registry.register(Histogram(
+    "rag_retrieved_documents", "Documents passed to the LLM per question.", buckets=COUNT_BUCKETS
+))
+PROMPT_TOKENS = registry.register(Histogram(
+    "rag_prompt_tokens", "Prompt tokens per generation, as counted by Ollama when available.", buckets=TOKEN_BUCKETS
+))
+GENERATED_TOKENS = registry.register(Histogram(
+    "rag_generated_tokens", "Tokens generated per answer.", buckets=TOKEN_BUCKETS
+))
+TIME_TO_FIRST_TOKEN = registry.register(Histogram(
+    "rag_llm_time_to_first_token_seconds", "Time from the LLM call to its first token."
+))
+TOKENS_PER_SECOND = registry.register(Histogram(
+    "rag_llm_tokens_per_second", "Generation speed reported by Ollama.", buckets=RATE_BUCKETS
+))
+
+_request_timings: ContextVar[Optional["RequestTimings"]] = ContextVar("request_timings", default=None)
+
+class RequestTimings:
+    """
+    Stage durations of the current request, reported as ``Server-Timing``.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add time spent in a stage; repeated stages accumulate."""
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def header(self) -> str:
+        """
+        Format the stages and total elapsed time as a Server-Timing header value.
+
+        Returns:
+            str: e.g. ``embed;dur=12.1, vector_search;dur=3.4, total;dur=40.2``.
+        """
+        with self._lock:
+            stages = list(self.stages.items())
+        parts = [f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in stages]
+        parts.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.1f}")
+        return ", ".join(parts)
+
+def start_request_timings() -> RequestTimings:
+    """
+    Start collecting stage timings for the current request context.
+
+    Returns:
+        RequestTimings: Timings that stages of this request will report into.
+    """
+    timings = RequestTimings()
+    _request_timings.set(timings)
+    return timings
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """
+    Record the duration of a stage in the histogram and the current request.
+
+    Args:
+        stage (str): Stage name.
+        seconds (float): Duration in seconds.
+    """
+    STAGE_DURATION.observe(seconds, stage=stage)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(stage, seconds)
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """Time the enclosed block as ``stage``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
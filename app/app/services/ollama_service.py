@@ -0,0 +1,486 @@
+"""
+Ollama service module for the Employee Search RAG application.
+
+This module handles the HTTP side of talking to Ollama: one shared keep-alive
+connection pool for every request, background health polling whose result is
+cached, a circuit breaker per server and least-loaded routing across several
+Ollama base URLs.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.services.metrics_service import Gauge, registry
+
+logger = logging.getLogger(__name__)
+
+class OllamaUnavailableError(ConnectionError):
+    """Raised without contacting Ollama when no server is healthy and closed."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class OllamaRequestError(ValueError):
+    """Raised when Ollama answers a request with an error status."""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are refused for ``reset_timeout`` seconds. It then half-opens:
+    a single trial request is let through, which closes the circuit again on
+    success and re-opens it on failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout passed."""
+        with self._lock:
+            self._update()
+            return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial request through."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent, reserving the trial slot if half-open.
+
+        Returns:
+            bool: True if the request may proceed.
+        """
+        with self._lock:
+            self._update()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Ollama circuit closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"Ollama circuit opened after {self._failures} consecutive failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_cancelled(self) -> None:
+        """Release the trial slot of a request that ended without a verdict."""
+        with self._lock:
+            self._trial_running = False
+
+    def _update(self) -> None:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_running = False
+
+class OllamaEndpoint:
+    """One Ollama server with its load, cached health and circuit breaker."""
+
+    def __init__(self, base_url: str, breaker: CircuitBreaker):
+        self.base_url = base_url.rstrip("/")
+        self.breaker = breaker
+        self.in_flight = 0
+        self.healthy = False
+        self.models: List[str] = []
+        self.checked_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def status(self) -> Dict[str, Any]:
+        """Describe the endpoint for the readiness probe."""
+        return {
+            "base_url": self.base_url,
+            "healthy": self.healthy,
+            "circuit": self.breaker.state,
+            "in_flight": self.in_flight,
+            "models": self.models,
+            "error": self.error,
+        }
+
+def ollama_base_urls() -> List[str]:
+    """
+    Return the configured Ollama servers.
+
+    Returns:
+        List[str]: OLLAMA_BASE_URLS split on commas, or OLLAMA_BASE_URL if unset.
+    """
+    urls = [url.strip() for url in settings.OLLAMA_BASE_URLS.split(",") if url.strip()]
+    return urls or [settings.OLLAMA_BASE_URL]
+
+class OllamaPool:
+    """
+    Shared HTTP connection pool and router for one or more Ollama servers.
+
+    All Ollama traffic goes through one ``httpx.Client`` and one
+    ``httpx.AsyncClient`` with keep-alive connections. A daemon thread polls
+    ``/api/tags`` on every server every ``health_interval`` seconds and caches
+    the result, so no request checks health inline. Each request is routed
+    to the healthy server with a closed circuit and the fewest requests in
+    flight; when there is none it fails immediately with
+    OllamaUnavailableError instead of queueing on a dead backend. A request
+    that cannot connect is retried on the next server, since nothing was
+    sent yet.
+    """
+
+    def __init__(
+        self,
+        base_urls: Optional[List[str]] = None,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        health_interval: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None
+    ):
+        pool_size = pool_size or settings.OLLAMA_POOL_SIZE
+        self.connect_timeout = connect_timeout or settings.OLLAMA_CONNECT_TIMEOUT
+        self.health_interval = health_interval or settings.OLLAMA_HEALTH_INTERVAL
+        self.endpoints = [
+            OllamaEndpoint(url, CircuitBreaker(
+                failure_threshold or settings.OLLAMA_CIRCUIT_FAILURES,
+                reset_timeout or settings.OLLAMA_CIRCUIT_RESET
+            ))
+            for url in base_urls or ollama_base_urls()
+        ]
+
+        self._limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self._timeout = httpx.Timeout(timeout or settings.OLLAMA_TIMEOUT, connect=self.connect_timeout)
+        self._client = httpx.Client(limits=self._limits, timeout=self._timeout)
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+        self._round_robin = itertools.count()
+        self._stop = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+
+    @property
+    def healthy(self) -> bool:
+        """True if at least one server answered the last health check."""
+        return any(endpoint.healthy for endpoint in self.endpoints)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently running across all servers."""
+        return sum(endpoint.in_flight for endpoint in self.endpoints)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Describe every server for the readiness probe."""
+        return [endpoint.status() for endpoint in self.endpoints]
+
+    def start(self) -> None:
+        """Check every server once, then keep polling in a background thread."""
+        if self._poller is not None:
+            return
+        self.check_health()
+        self._poller = threading.Thread(target=self._poll, name="ollama-health", daemon=True)
+        self._poller.start()
+
+    async def aclose(self) -> None:
+        """Stop health polling and close all pooled connections."""
+        self._stop.set()
+        self._client.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def check_health(self) -> None:
+        """Query ``/api/tags`` on every server and cache the result."""
+        for endpoint in self.endpoints:
+            try:
+                response = self._client.get(f"{endpoint.base_url}/api/tags", timeout=self.connect_timeout)
+                response.raise_for_status()
+                endpoint.models = [model["name"] for model in response.json().get("models", [])]
+                endpoint.error = None
+                if not endpoint.healthy:
+                    logger.info(f"Ollama at {endpoint.base_url} is up")
+                endpoint.healthy = True
+            except Exception as e:
+                endpoint.error = str(e) or type(e).__name__
+                if endpoint.healthy or endpoint.checked_at is None:
+                    logger.warning(f"Ollama at {endpoint.base_url} is unreachable: {endpoint.error}")
+                endpoint.healthy = False
+            endpoint.checked_at = time.time()
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.health_interval):
+            self.check_health()
+
+    def acquire(self) -> OllamaEndpoint:
+        """
+        Pick the least-loaded available server and count a request against it.
+
+        Returns:
+            OllamaEndpoint: Server to send the request to; pass it to ``release``.
+
+        Raises:
+            OllamaUnavailableError: If no server is healthy with a closed or half-open circuit.
+        """
+        with self._lock:
+            offset = next(self._round_robin)
+            count = len(self.endpoints)
+            # Rotating the start spreads ties instead of always picking the first server
+            candidates = sorted(
+                (self.endpoints[(offset + i) % count] for i in range(count)),
+                key=lambda endpoint: endpoint.in_flight
+            )
+            for endpoint in candidates:
+                if endpoint.healthy and endpoint.breaker.allow():
+                    endpoint.in_flight += 1
+                    return endpoint
+
+        raise self._unavailable()
+
+    def check_available(self) -> None:
+        """
+        Fail fast if no request could currently be routed.
+
+        Lets callers reject a request before it waits in a queue for a
+        server that is down.
+
+        Raises:
+            OllamaUnavailableError: If every server is unhealthy or has an open circuit.
+        """
+        if not any(endpoint.healthy and endpoint.breaker.state != CircuitBreaker.OPEN for endpoint in self.endpoints):
+            raise self._unavailable()
+
+    def _unavailable(self) -> OllamaUnavailableError:
+        retry_after = min(
+            (endpoint.breaker.retry_after() for endpoint in self.endpoints if endpoint.healthy),
+            default=self.health_interval
+        )
+        return OllamaUnavailableError(
+            f"No Ollama server available at {', '.join(e.base_url for e in self.endpoints)}",
+            retry_after=max(1.0, retry_after)
+        )
+
+    def release(self, endpoint: OllamaEndpoint, error: Optional[BaseException] = None, completed: bool = True) -> None:
+        """
+        Return a request's slot and report its outcome to the circuit breaker.
+
+        Args:
+            endpoint (OllamaEndpoint): Server returned by ``acquire``.
+            error (BaseException, optional): Error the request failed with.
+            completed (bool): False if the caller stopped reading before the end.
+        """
+        with self._lock:
+            endpoint.in_flight -= 1
+        if error is not None and self._is_backend_failure(error):
+            endpoint.breaker.record_failure()
+        elif error is None and completed:
+            endpoint.breaker.record_success()
+        else:
+            endpoint.breaker.record_cancelled()
+
+    def _failover(self, endpoint: OllamaEndpoint, error: BaseException, attempt: int) -> bool:
+        # Take the server out of rotation until the next health check sees it up
+        endpoint.healthy = False
+        endpoint.error = str(error) or type(error).__name__
+        logger.warning(f"Cannot connect to Ollama at {endpoint.base_url}: {endpoint.error}")
+        return attempt + 1 < len(self.endpoints) and self.healthy
+
+    @staticmethod
+    def _is_backend_failure(error: BaseException) -> bool:
+        # Client errors such as an unknown model say nothing about the server's health
+        if isinstance(error, OllamaRequestError):
+            return error.status_code >= 500
+        return isinstance(error, httpx.TransportError)
+
+    @staticmethod
+    def _check_status(response: httpx.Response, body: str) -> None:
+        if response.status_code == 200:
+            return
+        if response.status_code == 404:
+            raise OllamaRequestError(
+                "Ollama call failed with status code 404. "
+                f"Maybe your model is not found and you should pull the model with `ollama pull {settings.LLM_MODEL}`.",
+                status_code=404
+            )
+        raise OllamaRequestError(
+            f"Ollama call failed with status code {response.status_code}. Details: {body}",
+            status_code=response.status_code
+        )
+
+    def stream_lines(self, path: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Iterator[str]:
+        """
+        POST a streaming request to the chosen server and yield its NDJSON lines.
+
+        Args:
+            path (str): API path, e.g. ``/api/generate``.
+            payload (Dict[str, Any]): JSON request body.
+            headers (Dict[str, str], optional): Extra request headers.
+
+        Yields:
+            str: Non-empty response lines.
+
+        Raises:
+            OllamaUnavailableError: If no server is available or none accepts the connection.
+            OllamaRequestError: If Ollama answers with an error status.
+        """
+        for attempt in range(len(self.endpoints)):
+            endpoint = self.acquire()
+            error: Optional[BaseException] = None
+            completed = False
+            try:
+                with self._client.stream("POST", f"{endpoint.base_url}{path}", json=payload, headers=headers) as response:
+                    if response.status_code != 200:
+                        self._check_status(response, response.read().decode("utf-8", "replace"))
+                    for line in response.iter_lines():
+                        if line:
+                            yield line
+                completed = True
+                return
+            except httpx.ConnectError as e:
+                # Nothing was sent yet, so the request can go to another server
+                error = e
+                if not self._failover(endpoint, e, attempt):
+                    raise self._unavailable() from e
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self.release(endpoint, error, completed)
+
+    async def astream_lines(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously POST a streaming request and yield its NDJSON lines.
+
+        Args:
+            path (str): API path, e.g. ``/api/generate``.
+            payload (Dict[str, Any]): JSON request body.
+            headers (Dict[str, str], optional): Extra request headers.
+
+        Yields:
+            str: Non-empty response lines.
+
+        Raises:
+            OllamaUnavailableError: If no server is available or none accepts the connection.
+            OllamaRequestError: If Ollama answers with an error status.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(limits=self._limits, timeout=self._timeout)
+        client = self._async_client
+
+        for attempt in range(len(self.endpoints)):
+            endpoint = self.acquire()
+            error: Optional[BaseException] = None
+            completed = False
+            try:
+                async with client.stream("POST", f"{endpoint.base_url}{path}", json=payload, headers=headers) as response:
+                    if response.status_code != 200:
+                        self._check_status(response, (await response.aread()).decode("utf-8", "replace"))
+                    async for line in response.aiter_lines():
+                        if line:
+                            yield line
+                completed = True
+                return
+            except httpx.ConnectError as e:
+                error = e
+                if not self._failover(endpoint, e, attempt):
+                    raise self._unavailable() from e
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self.release(endpoint, error, completed)
+
+_pool: Optional[OllamaPool] = None
+_pool_lock = threading.Lock()
+
+def get_ollama_pool() -> OllamaPool:
+    """
+    Return the process-wide Ollama pool, starting its health polling on first use.
+
+    Returns:
+        OllamaPool: Shared pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = OllamaPool()
+            _pool.start()
+        return _pool
+
+async def close_ollama_pool() -> None:
+    """Close the process-wide Ollama pool if it was created."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        await pool.aclose()
+
+def check_ollama_available() -> None:
+    """
+    Fail fast if the process-wide pool cannot route a request.
+
+    Raises:
+        OllamaUnavailableError: If no Ollama server is available.
+    """
+    if _pool is not None:
+        _pool.check_available()
+
+def ollama_status() -> List[Dict[str, Any]]:
+    """
+    Describe the configured Ollama servers.
+
+    Returns:
+        List[Dict[str, Any]]: Cached health, circuit state and load per server; empty before first use.
+    """
+    return _pool.status() if _pool is not None else []
+
+registry.register(Gauge(
+    "rag_ollama_available_servers", "Ollama servers that are healthy with a closed circuit.",
+    function=lambda: sum(
+        endpoint.healthy and endpoint.breaker.state == CircuitBreaker.CLOSED for endpoint in _pool.endpoints
+    ) if _pool is not None else 0
+))
+registry.register(Gauge(
+    "rag_ollama_in_flight", "Requests in flight to Ollama.",
+    function=lambda: _pool.in_flight if _pool is not None else 0
+))
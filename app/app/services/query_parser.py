@@ -0,0 +1,318 @@
+"""
+Query parser module for the Employee Search RAG application.
+
+This module extracts structured filters (availability, experience and skills)
+from natural language questions so they can be applied before retrieval,
+scores how completely a question is described by its filters, and recognizes
+follow-up questions that refer to the previous answer.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+AVAILABILITY_PATTERNS = [
+    # The data only knows available and unavailable; "busy" and "occupied" mean unavailable
+    ("unavailable", re.compile(r"\b(?:unavailable|not available|occupied|busy)\b", re.IGNORECASE)),
+    ("available", re.compile(r"\b(?:available|free|on the bench)\b", re.IGNORECASE)),
+]
+OPPOSITE_AVAILABILITY = {"available": "unavailable", "unavailable": "available"}
+# A negation right before a status flips it: "not busy", "isn't currently occupied"
+NEGATION_PATTERN = re.compile(
+    r"\b(?:not|no|never|isn'?t|aren'?t|wasn'?t|weren'?t)\s+(?:currently\s+|presently\s+|yet\s+)?$",
+    re.IGNORECASE
+)
+
+# "5+ years", "at least 5 years", "minimum of 5 yrs", "5 or more years"
+MIN_EXPERIENCE_PATTERN = re.compile(
+    r"(?:\b(?:at least|minimum(?: of)?|min\.?)\s+(\d+)\s*(?:years?|yrs?)\b)"
+    r"|(?:\b(\d+)\s*\+\s*(?:years?|yrs?)\b)"
+    r"|(?:\b(\d+)\s*(?:years?|yrs?)?\s+or\s+more\s+(?:years?|yrs?)\b)",
+    re.IGNORECASE
+)
+# "more than 4 years", "over 4 years" mean at least 5; "no more than" is an upper bound
+EXCLUSIVE_EXPERIENCE_PATTERN = re.compile(
+    r"(?<!no )\b(?:more than|over|greater than|above)\s+(\d+)\s*(?:years?|yrs?)\b",
+    re.IGNORECASE
+)
+# "at most 5 years", "up to 5 yrs", "no more than 5 years"
+MAX_EXPERIENCE_PATTERN = re.compile(
+    r"\b(?:at most|up to|no more than|maximum(?: of)?|max\.?)\s+(\d+)\s*(?:years?|yrs?)\b",
+    re.IGNORECASE
+)
+# "less than 3 years", "under 3 years" mean at most 2
+EXCLUSIVE_MAX_EXPERIENCE_PATTERN = re.compile(
+    r"\b(?:less than|fewer than|under|below)\s+(\d+)\s*(?:years?|yrs?)\b",
+    re.IGNORECASE
+)
+# "between 3 and 6 years", "3-6 years", "3 to 6 years"
+EXPERIENCE_RANGE_PATTERN = re.compile(
+    r"\b(?:between\s+(\d+)\s+and\s+(\d+)|(\d+)\s*(?:-|to)\s*(\d+))\s*(?:years?|yrs?)\b",
+    re.IGNORECASE
+)
+
+# Words that only phrase a filter question ("list the available engineers with ...")
+FILTER_QUESTION_WORDS = frozenset("""
+    a all also an and any anybody anyone are at can could currently dev developer developers devs do does
+    employee employees engineer engineers experience experienced expertise familiar find for get give good has
+    have having i in is know knowing knows list looking me members need now of on people person please
+    proficient programmer programmers right show skill skilled skills solid somebody someone staff strong team
+    the there us want we what which who whom whose with work working year years you yrs
+""".split())
+
+# Residual words that ask for more than a filter: reasoning, ranking, alternatives or other fields
+OPEN_QUESTION_PATTERN = re.compile(
+    r"\b(?:why|how|compare|comparison|versus|vs|best|better|top|most|least|recommend|suggest|should|explain|"
+    r"describe|summari[sz]e|tell|about|or|not|without|except|project|projects|worked|built|lead|mentor|"
+    r"similar|like|team up|pair)\b",
+    re.IGNORECASE
+)
+
+WORD_PATTERN = re.compile(r"[\w#+.]+")
+
+# "which of those know AWS?", "are they available?", "tell me more about him"
+FOLLOW_UP_PATTERN = re.compile(
+    r"\b(?:those|these|them|they|their|theirs|he|she|him|her|his|hers|"
+    r"(?:the )?(?:above|previous|same|former|latter)|any of|which of|who of|among|one of|more about)\b",
+    re.IGNORECASE
+)
+
+def is_follow_up(query: str) -> bool:
+    """
+    Check whether a query refers back to the employees of the previous answer.
+
+    Args:
+        query (str): Natural language query.
+
+    Returns:
+        bool: True if the query contains a back-reference such as "those" or "which of".
+    """
+    return FOLLOW_UP_PATTERN.search(query) is not None
+
+def availability_matches(query: str) -> List[Tuple[str, int, int]]:
+    """
+    Find the availability statuses mentioned in a query.
+
+    A status preceded by a negation ("not busy") is flipped, and its span
+    includes the negation.
+
+    Args:
+        query (str): Natural language query.
+
+    Returns:
+        List[Tuple[str, int, int]]: ``(status, start, end)`` per mention.
+    """
+    matches = []
+    for status, pattern in AVAILABILITY_PATTERNS:
+        for match in pattern.finditer(query):
+            start = match.start()
+            negation = NEGATION_PATTERN.search(query, 0, start)
+            if negation:
+                matches.append((OPPOSITE_AVAILABILITY[status], negation.start(), match.end()))
+            else:
+                matches.append((status, start, match.end()))
+    return matches
+
+def extract_availability(query: str) -> Optional[str]:
+    """
+    Extract an availability status mentioned in a query.
+
+    Args:
+        query (str): Natural language query.
+
+    Returns:
+        Optional[str]: "available" or "unavailable", or None if no status or
+        contradicting statuses are mentioned.
+    """
+    statuses = {status for status, _, _ in availability_matches(query)}
+    return statuses.pop() if len(statuses) == 1 else None
+
+def extract_min_experience(query: str) -> Optional[int]:
+    """
+    Extract a minimum number of years of experience from a query.
+
+    Args:
+        query (str): Natural language query.
+
+    Returns:
+        Optional[int]: Minimum years of experience, or None.
+    """
+    match = MIN_EXPERIENCE_PATTERN.search(query)
+    if match:
+        return int(next(group for group in match.groups() if group is not None))
+
+    match = EXCLUSIVE_EXPERIENCE_PATTERN.search(query)
+    if match:
+        return int(match.group(1)) + 1
+
+    match = EXPERIENCE_RANGE_PATTERN.search(query)
+    if match:
+        return int(match.group(1) or match.group(3))
+
+    return None
+
+def extract_max_experience(query: str) -> Optional[int]:
+    """
+    Extract a maximum number of years of experience from a query.
+
+    Args:
+        query (str): Natural language query.
+
+    Returns:
+        Optional[int]: Maximum years of experience, or None.
+    """
+    match = MAX_EXPERIENCE_PATTERN.search(query)
+    if match:
+        return int(match.group(1))
+
+    match = EXCLUSIVE_MAX_EXPERIENCE_PATTERN.search(query)
+    if match:
+        return max(int(match.group(1)) - 1, 0)
+
+    match = EXPERIENCE_RANGE_PATTERN.search(query)
+    if match:
+        return int(match.group(2) or match.group(4))
+
+    return None
+
+@lru_cache(maxsize=8)
+def skill_patterns(vocabulary: Tuple[str, ...]) -> List[Tuple[str, "re.Pattern[str]"]]:
+    """
+    Compile the match pattern of every skill, longest skill first.
+
+    Cached per vocabulary, so queries do not recompile one pattern per known
+    skill.
+
+    Args:
+        vocabulary (Tuple[str, ...]): Known skill names, sorted.
+
+    Returns:
+        List[Tuple[str, re.Pattern]]: Skills with their patterns, longest first.
+    """
+    patterns = []
+    for skill in sorted(vocabulary, key=len, reverse=True):
+        flags = 0 if len(skill) <= 2 else re.IGNORECASE
+        patterns.append((skill, re.compile(rf"(?<![\w.#+]){re.escape(skill)}(?![\w#+])", flags)))
+    return patterns
+
+def skill_spans(query: str, vocabulary: Iterable[str]) -> List[Tuple[str, int, int]]:
+    """
+    Find known skills mentioned in a query along with where they were found.
+
+    Args:
+        query (str): Natural language query.
+        vocabulary (Iterable[str]): Known skill names.
+
+    Returns:
+        List[Tuple[str, int, int]]: Matched skills in vocabulary spelling with
+        the start and end offset of their first mention.
+    """
+    matched: List[Tuple[str, int, int]] = []
+    remaining = query
+    for skill, pattern in skill_patterns(tuple(sorted(set(vocabulary)))):
+        match = pattern.search(remaining)
+        if match:
+            matched.append((skill, match.start(), match.end()))
+            # Blank out every mention, keeping offsets, so shorter skills cannot match inside it
+            remaining = pattern.sub(lambda m: " " * len(m.group(0)), remaining)
+    return matched
+
+def extract_skills(query: str, vocabulary: Iterable[str]) -> List[str]:
+    """
+    Find known skills mentioned in a query.
+
+    Longer skills are matched first so "Machine Learning" wins over a shorter
+    overlapping skill. Skills of two characters or fewer ("Go", "AI") must
+    match case-sensitively to avoid matching ordinary words.
+
+    Args:
+        query (str): Natural language query.
+        vocabulary (Iterable[str]): Known skill names.
+
+    Returns:
+        List[str]: Matched skills in vocabulary spelling.
+    """
+    return [skill for skill, _, _ in skill_spans(query, vocabulary)]
+
+def extract_filters(query: str, skill_vocabulary: Iterable[str]) -> Dict[str, Any]:
+    """
+    Extract all structured filters from a query.
+
+    Args:
+        query (str): Natural language query.
+        skill_vocabulary (Iterable[str]): Known skill names.
+
+    Returns:
+        Dict[str, Any]: Any of ``availability``, ``min_experience`` and ``skills``
+        that were found in the query.
+    """
+    filters: Dict[str, Any] = {}
+
+    availability = extract_availability(query)
+    if availability:
+        filters["availability"] = availability
+
+    min_experience = extract_min_experience(query)
+    if min_experience is not None:
+        filters["min_experience"] = min_experience
+
+    skills = extract_skills(query, skill_vocabulary)
+    if skills:
+        filters["skills"] = skills
+
+    return filters
+
+def parse_query(query: str, skill_vocabulary: Iterable[str]) -> Dict[str, Any]:
+    """
+    Extract the filters of a query and score how completely they describe it.
+
+    The confidence is the share of the query's words that are either part of
+    a recognized filter or only phrase a filter question ("who", "list",
+    "engineers", "with"). It is 0 when no filter was found, for follow-up
+    questions, and when the words left over ask for more than a filter, such
+    as a comparison, a recommendation, alternatives ("or"), projects, a
+    number or a capitalized word (likely an unknown skill or a name) that is
+    not part of a recognized filter.
+
+    Args:
+        query (str): Natural language query.
+        skill_vocabulary (Iterable[str]): Known skill names.
+
+    Returns:
+        Dict[str, Any]: ``filters`` as returned by ``extract_filters``,
+        ``max_experience`` (int or None) and ``confidence`` in [0, 1].
+    """
+    filters = extract_filters(query, skill_vocabulary)
+    max_experience = extract_max_experience(query)
+    parsed = {"filters": filters, "max_experience": max_experience, "confidence": 0.0}
+    if not (filters or max_experience is not None) or is_follow_up(query):
+        return parsed
+
+    spans = [(start, end) for _, start, end in skill_spans(query, skill_vocabulary)]
+    if "availability" in filters:
+        spans.extend((start, end) for _, start, end in availability_matches(query))
+    for pattern in (
+        MIN_EXPERIENCE_PATTERN, EXCLUSIVE_EXPERIENCE_PATTERN, MAX_EXPERIENCE_PATTERN,
+        EXCLUSIVE_MAX_EXPERIENCE_PATTERN, EXPERIENCE_RANGE_PATTERN
+    ):
+        spans.extend(match.span() for match in pattern.finditer(query))
+
+    residual = list(query)
+    for start, end in spans:
+        residual[start:end] = " " * (end - start)
+    residual = "".join(residual)
+    # A number outside a recognized filter is a constraint the filters do not express
+    if OPEN_QUESTION_PATTERN.search(residual) or re.search(r"\d", residual):
+        return parsed
+
+    words = WORD_PATTERN.findall(query)
+    unexplained = [
+        word for word in (word.strip(".") for word in WORD_PATTERN.findall(residual))
+        if word and word.lower() not in FILTER_QUESTION_WORDS
+    ]
+    # Capitalized or symbolic words ("COBOL", "C++") are likely skills, names or projects outside the filters
+    if any(word[0].isupper() or not word.isalpha() for word in unexplained if word != words[0]):
+        return parsed
+
+    parsed["confidence"] = round(1 - len(unexplained) / len(words), 3)
+    return parsed
@@ -0,0 +1,278 @@
+"""
+Reload service module for the Employee Search RAG application.
+
+This module handles hot reloads of the employee data: everything built from
+one version of the data is bundled into a ServingState, and a reloader
+builds the next state off the request path when the data file changes (or
+on request) and swaps it in with a single reference assignment. Requests
+keep the state they started with, so in-flight requests finish on the old
+version, whose memory is released once the last of them completes.
+"""
+
+import gc
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.metrics_service import Counter, Gauge, registry
+
+logger = logging.getLogger(__name__)
+
+RELOADS = registry.register(Counter(
+    "rag_index_reloads_total", "Employee data reloads by result.", ["result"]
+))
+
+class ServingState:
+    """
+    Employee data and indexes built from one version of the data file.
+
+    A reload builds a new state instead of changing this one. Employee writes
+    are the exception: the indexes lock internally and are updated in place,
+    and the reloader replays the writes onto a state it is building.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        fingerprint: Any,
+        search_index: Any,
+        vector_store: Any,
+        retriever: Any,
+        answer_cache: Any,
+        skill_synonyms: Optional[Any] = None,
+        employees: Optional[List[Dict[str, Any]]] = None
+    ):
+        self.version = version
+        self.fingerprint = fingerprint
+        self.search_index = search_index
+        self.vector_store = vector_store
+        self.retriever = retriever
+        self.answer_cache = answer_cache
+        self.skill_synonyms = skill_synonyms
+        self.employees = employees
+        self.loaded_at = time.time()
+
+    def describe(self) -> Dict[str, Any]:
+        """Summarize the state for the API."""
+        return {
+            "version": self.version,
+            "employees": len(self.search_index),
+            "documents": len(self.vector_store.index_to_docstore_id),
+            "loaded_at": self.loaded_at,
+        }
+
+def file_signature(paths: List[str]) -> Tuple[Tuple[int, int], ...]:
+    """
+    Return the modification time and size of files, to detect changes cheaply.
+
+    Args:
+        paths (List[str]): Files to stat; missing files have a (0, 0) signature.
+
+    Returns:
+        Tuple[Tuple[int, int], ...]: ``(mtime_ns, size)`` per path.
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((0, 0))
+    return tuple(signature)
+
+class IndexReloader:
+    """
+    Builds and atomically swaps the serving state.
+
+    ``build`` creates a state from the current data, reusing what it can of
+    the previous state (such as the embedding model); ``fingerprint``
+    identifies the data a state is built from, so reloads of unchanged data
+    are skipped. Builds run without ``lock``, the employee write lock, so
+    writes carry on during a reload: writers record each change with
+    ``record``, and the changes made during a build are replayed onto the new
+    state under the lock just before the swap. A background thread
+    polls ``watch_paths`` every ``interval`` seconds and reloads once a
+    change has been stable for one poll.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[int, Any, Optional[ServingState]], ServingState],
+        fingerprint: Callable[[], Any],
+        watch_paths: Callable[[], List[str]],
+        lock: threading.Lock,
+        interval: float = settings.RELOAD_WATCH_INTERVAL,
+        drain_timeout: float = settings.RELOAD_DRAIN_TIMEOUT,
+        on_swap: Optional[Callable[[ServingState], None]] = None
+    ):
+        self.build = build
+        self.fingerprint = fingerprint
+        self.watch_paths = watch_paths
+        self.lock = lock
+        self.interval = interval
+        self.drain_timeout = drain_timeout
+        self.on_swap = on_swap
+        self.state: Optional[ServingState] = None
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._draining: Dict[int, List[weakref.ref]] = {}
+        # Changes to replay onto the state being built, None when no build is running
+        self._pending: Optional[List[Callable[[ServingState], None]]] = None
+
+        registry.register(Gauge(
+            "rag_index_version", "Version of the employee data being served.",
+            function=lambda: self.state.version if self.state is not None else 0
+        ))
+        registry.register(Gauge(
+            "rag_index_versions_draining", "Replaced data versions still referenced by in-flight requests.",
+            function=lambda: sum(1 for refs in list(self._draining.values()) if self._alive(refs))
+        ))
+
+    def load(self) -> ServingState:
+        """
+        Build and install the first state.
+
+        Returns:
+            ServingState: The installed state.
+        """
+        with self._reload_lock, self.lock:
+            state = self.build(1, self.fingerprint(), None)
+            self._install(state)
+        return state
+
+    @property
+    def building(self) -> bool:
+        """Whether a new state is being built. Read with ``lock`` held."""
+        return self._pending is not None
+
+    def record(self, change: Callable[[ServingState], None]) -> None:
+        """
+        Record a write applied to the served state, to replay it onto the state being built.
+
+        Callers hold ``lock``. A no-op when no reload is running.
+
+        Args:
+            change (Callable[[ServingState], None]): Applies the write to a state.
+        """
+        if self._pending is not None:
+            self._pending.append(change)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Build a new state from the current data and swap it in.
+
+        Concurrent calls run one after the other; the second one usually
+        finds the data unchanged. Writes made while the state is built are
+        replayed onto it before the swap.
+
+        Args:
+            force (bool): Rebuild even if the data fingerprint is unchanged.
+
+        Returns:
+            bool: True if a new state was swapped in, False if the data was unchanged.
+
+        Raises:
+            Exception: If building the new state fails; the current state stays in place.
+        """
+        with self._reload_lock:
+            start = time.perf_counter()
+            with self.lock:
+                previous = self.state
+                fingerprint = self.fingerprint()
+                if not force and previous is not None and fingerprint == previous.fingerprint:
+                    RELOADS.inc(result="unchanged")
+                    return False
+                self._pending = []
+
+            try:
+                state = self.build((previous.version if previous else 0) + 1, fingerprint, previous)
+                with self.lock:
+                    pending, self._pending = self._pending, None
+                    for change in pending:
+                        change(state)
+                    self._install(state)
+            except Exception as e:
+                with self.lock:
+                    self._pending = None
+                RELOADS.inc(result="failed")
+                logger.error(f"Reload failed, still serving version {previous.version if previous else None}: {str(e)}")
+                raise
+
+            RELOADS.inc(result="reloaded")
+            logger.info(f"Reloaded employee data as version {state.version} in {time.perf_counter() - start:.2f}s")
+            if previous is not None:
+                self._retire(previous)
+            return True
+
+    def _install(self, state: ServingState) -> None:
+        # A single reference assignment: requests see either the old or the new state
+        self.state = state
+        if self.on_swap is not None:
+            self.on_swap(state)
+
+    def _retire(self, state: ServingState) -> None:
+        version = state.version
+        # The indexes are tracked too: they hold the memory and could outlive the state
+        self._draining[version] = [
+            weakref.ref(component) for component in (state, state.vector_store, state.search_index)
+        ]
+        del state
+        threading.Thread(target=self._drain, args=(version,), name=f"index-drain-{version}", daemon=True).start()
+
+    @staticmethod
+    def _alive(refs: List[weakref.ref]) -> bool:
+        return any(ref() is not None for ref in refs)
+
+    def _drain(self, version: int) -> None:
+        # Requests hold the state they started with; collect it once the last one is done
+        deadline = time.monotonic() + self.drain_timeout
+        while time.monotonic() < deadline:
+            if not self._alive(self._draining[version]):
+                break
+            gc.collect()
+            if not self._alive(self._draining[version]):
+                break
+            time.sleep(0.5)
+
+        if not self._alive(self._draining.pop(version)):
+            logger.info(f"Released employee data version {version}")
+        else:
+            logger.warning(f"Employee data version {version} is still referenced after {self.drain_timeout}s")
+
+    def start(self) -> None:
+        """Start watching the data files in a background thread, if ``interval`` is set."""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._watch, name="index-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background watcher."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _watch(self) -> None:
+        last = file_signature(self.watch_paths())
+        changed = False
+        while not self._stop.wait(self.interval):
+            signature = file_signature(self.watch_paths())
+            if signature != last:
+                # Wait for the file to stop changing before reading it
+                last = signature
+                changed = True
+                continue
+            if not changed:
+                continue
+            changed = False
+            try:
+                self.reload()
+            except Exception:
+                # Logged by reload; the next change triggers another attempt
+                pass
@@ -5,18 +5,60 @@ This module handles all vector store and retrieval-related functionality includi
 document formatting, embedding generation, and similarity search.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import List, Dict, Any
-from langchain_community.embeddings import HuggingFaceEmbeddings
+import os
+import pickle
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Iterator, Mapping, Optional, Set, Tuple, Union
+import numpy as np
+from langchain_community.docstore.base import Docstore
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.faiss import dependable_faiss_import
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun, CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 from app.core.config import settings
-from app.services.data_service import load_employee_docs
+from app.services.data_service import chunked, iter_employee_chunks, resolve_data_path
+from app.services.bm25_service import BM25_VERSION, BM25Index, MappedBM25Index, write_bm25_index
+from app.services.embedding_batcher import QueryEmbeddingBatcher
+from app.services.context_service import group_by_employee, pack_context
+from app.services.embedding_cache import CachedEmbeddings, get_embedding_cache
+from app.services.embedding_service import create_backend_embeddings, embedding_model_id
+from app.services.index_factory import create_index, index_config, needs_training, search_parameters, supports_remove
+from app.services.ingestion_service import close_embeddings, embed_employee_chunks, parallel_embeddings
+from app.services.metrics_service import timed_stage
+from app.services.query_parser import extract_filters
+from app.services.search_service import EmployeeSearchIndex
+from app.services.snapshot_service import SNAPSHOT_VERSION, EmployeeSnapshot, write_snapshot
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the document builders below change their output, so that
+# persisted indexes built from the old documents are detected as stale.
+DOCUMENT_BUILDER_VERSION = "2"
+MANIFEST_FILENAME = "manifest.json"
+LOCK_FILENAME = ".lock"
+INDEX_NAME = "index"
+LABELS_FILENAME = "labels.npy"
+
+# Each document's FAISS label is (employee id << EMPLOYEE_LABEL_BITS) | ordinal,
+# so all documents of one employee occupy a single contiguous label range.
+EMPLOYEE_LABEL_BITS = 20
+
 def format_employee(emp: Dict[str, Any]) -> str:
     """
     Format employee information into a structured document.
@@ -90,64 +132,1077 @@ Availability: {emp['availability']}""",
         }
     )
 
-def get_retriever() -> Any:
+def employee_label(employee_id: int, ordinal: int = 0) -> int:
     """
-    Build and return a configured retriever.
+    Compute the FAISS label of an employee's document.
+
+    Args:
+        employee_id (int): Employee identifier.
+        ordinal (int): Position of the document among the employee's documents.
 
     Returns:
-        Any: Configured retriever instance.
+        int: 64-bit label used in the ID-mapped index.
     """
-    try:
-        employees = load_employee_docs()
-        logger.info(f"Loaded {len(employees)} employees from data source.")
-        
-        # Create documents with enhanced metadata
-        docs = []
-        for emp in employees:
-            # Create main document
-            main_doc = Document(
-                page_content=format_employee(emp),
-                metadata={
-                    "id": emp["id"],
-                    "name": emp["name"],
-                    "availability": emp["availability"],
-                    "skills": emp["skills"],
-                    "experience": emp["experience_years"],
-                    "projects": emp["projects"],
-                    "type": "employee_profile"
-                }
-            )
-            docs.append(main_doc)
-            
-            # Create skill-specific documents
-            for skill in emp["skills"]:
-                docs.append(create_skill_document(emp, skill))
-                
-            # Create project-specific documents
-            for project in emp["projects"]:
-                docs.append(create_project_document(emp, project))
-        
-        # Initialize embeddings
-        embeddings = HuggingFaceEmbeddings(
-            model_name=settings.EMBEDDING_MODEL,
-            model_kwargs={'device': 'cpu'},
-            encode_kwargs={'normalize_embeddings': True}
-        )
-        
-        # Create vector store
-        db = FAISS.from_documents(docs, embeddings)
-        db.save_local(settings.VECTOR_STORE_PATH)
-        
-        # Return retriever with hybrid search
-        return db.as_retriever(
-            search_type="similarity_score_threshold",
-            search_kwargs={
-                "k": settings.MAX_RESULTS,
-                "score_threshold": settings.SIMILARITY_THRESHOLD,
-                "filter": None
+    return (employee_id << EMPLOYEE_LABEL_BITS) | ordinal
+
+def label_document_id(label: int) -> str:
+    """
+    Return the document id of a FAISS label.
+
+    Args:
+        label (int): Label computed by ``employee_label``.
+
+    Returns:
+        str: Document id ``<employee id>:<ordinal>``.
+    """
+    return f"{label >> EMPLOYEE_LABEL_BITS}:{label & ((1 << EMPLOYEE_LABEL_BITS) - 1)}"
+
+def build_employee_documents(emp: Dict[str, Any]) -> List[Document]:
+    """
+    Build the profile, skill and project documents for a single employee.
+
+    Args:
+        emp (Dict[str, Any]): Employee information dictionary.
+
+    Returns:
+        List[Document]: Documents derived from the employee record, with
+        stable ids of the form "<employee id>:<ordinal>".
+    """
+    # Create main document
+    docs = [
+        Document(
+            page_content=format_employee(emp),
+            metadata={
+                "id": emp["id"],
+                "name": emp["name"],
+                "availability": emp["availability"],
+                "skills": emp["skills"],
+                "experience": emp["experience_years"],
+                "projects": emp["projects"],
+                "type": "employee_profile"
             }
         )
-        
+    ]
+
+    # Create skill-specific documents
+    for skill in emp["skills"]:
+        docs.append(create_skill_document(emp, skill))
+
+    # Create project-specific documents
+    for project in emp["projects"]:
+        docs.append(create_project_document(emp, project))
+
+    for ordinal, doc in enumerate(docs):
+        doc.id = f"{emp['id']}:{ordinal}"
+
+    return docs
+
+class SnapshotDocstore(Docstore):
+    """
+    Read-only docstore that rebuilds documents from the employee snapshot on demand.
+
+    Document ids are ``<employee id>:<ordinal>``, so a document is the
+    ordinal-th output of build_employee_documents for the employee's snapshot
+    record and workers do not need to unpickle every document.
+    """
+
+    def __init__(self, snapshot: EmployeeSnapshot):
+        self.snapshot = snapshot
+
+    def search(self, search: str) -> Union[str, Document]:
+        employee_id, _, ordinal = search.partition(":")
+        row = self.snapshot.row_of(int(employee_id))
+        if row is not None:
+            docs = build_employee_documents(self.snapshot.record(row))
+            if int(ordinal) < len(docs):
+                return docs[int(ordinal)]
+        return f"ID {search} not found."
+
+class SnapshotLabels(Mapping[int, str]):
+    """
+    Read-only ``index_to_docstore_id`` over the sorted labels of a persisted index.
+
+    Document ids follow from the labels, so only the memory-mapped label
+    array is kept.
+    """
+
+    def __init__(self, labels: np.ndarray):
+        self.labels = labels
+
+    def __getitem__(self, label: int) -> str:
+        if label not in self:
+            raise KeyError(label)
+        return label_document_id(int(label))
+
+    def __contains__(self, label: object) -> bool:
+        position = int(np.searchsorted(self.labels, label))
+        return position < len(self.labels) and self.labels[position] == label
+
+    def __iter__(self) -> Iterator[int]:
+        return (int(label) for label in self.labels)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+class EmployeeVectorStore(FAISS):
+    """
+    FAISS vector store whose documents are keyed by employee id.
+
+    Vectors are stored under labels derived from the employee id, so a single
+    employee's documents can be replaced or removed without re-embedding or
+    renumbering the rest of the index. The index type (flat, HNSW, IVF, IVF-PQ
+    or SQ8) comes from index_factory. HNSW graphs cannot drop nodes, so their
+    removed vectors are skipped by searches and the graph is rebuilt once
+    HNSW_REBUILD_STALE_RATIO of it is stale. Searches and writes are serialized
+    through ``lock``. When loaded for shared serving, documents are rebuilt
+    from the employee ``snapshot`` until the first write copies them.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+        # Manifest of the data this store reflects, set when loaded or saved
+        self.manifest: Optional[Dict[str, Any]] = None
+        # A memory-mapped index is read-only and must be copied before writes
+        self._index_owned = False
+        # Employee snapshot backing the docstore when serving from shared files
+        self.snapshot: Optional[EmployeeSnapshot] = None
+        # Built on first lexical search (or mapped from shared files) and then patched with every write
+        self._lexical: Optional[Union[BM25Index, MappedBM25Index]] = None
+        # Positions of removed or replaced vectors left in an HNSW graph, skipped by searches until compact()
+        self._stale_offsets: Set[int] = set()
+
+    @property
+    def version(self) -> Optional[str]:
+        """Short hash identifying the data and settings the index was built from."""
+        if self.manifest is None:
+            return None
+        return hashlib.sha256(json.dumps(self.manifest, sort_keys=True).encode()).hexdigest()[:16]
+
+    @classmethod
+    def from_employees(
+        cls,
+        employees: List[Dict[str, Any]],
+        embeddings: Embeddings,
+        config: Optional[Dict[str, Any]] = None
+    ) -> "EmployeeVectorStore":
+        """
+        Embed all employee documents into a new vector store.
+
+        Args:
+            employees (List[Dict[str, Any]]): Employee records.
+            embeddings (Embeddings): Embedding model.
+            config (Dict[str, Any], optional): Index configuration, see index_config().
+
+        Returns:
+            EmployeeVectorStore: Newly built vector store.
+        """
+        return cls.from_employee_chunks(chunked(employees, settings.INGEST_CHUNK_SIZE), embeddings, config)
+
+    @classmethod
+    def from_employee_chunks(
+        cls,
+        chunks: Iterable[List[Dict[str, Any]]],
+        embeddings: Embeddings,
+        config: Optional[Dict[str, Any]] = None,
+        document_embeddings: Optional[Embeddings] = None
+    ) -> "EmployeeVectorStore":
+        """
+        Build a vector store from a stream of employee chunks.
+
+        Each chunk's documents are built, embedded and appended to the index
+        before the next chunk is read. Index types that need training buffer
+        the first INDEX_TRAIN_SIZE vectors, train on them and then continue
+        streaming.
+
+        Args:
+            chunks (Iterable[List[Dict[str, Any]]]): Chunks of employee records.
+            embeddings (Embeddings): Embedding model used for queries.
+            config (Dict[str, Any], optional): Index configuration, see index_config().
+            document_embeddings (Embeddings, optional): Model used to embed the documents,
+                e.g. a process pool. Defaults to ``embeddings``.
+
+        Returns:
+            EmployeeVectorStore: Newly built vector store.
+
+        Raises:
+            ValueError: If the chunks contain no employees.
+        """
+        config = config or index_config()
+        logger.info(f"Building {config['index_type']} index with {settings.EMBEDDING_MODEL}")
+
+        store: Optional[EmployeeVectorStore] = None
+        pending: List[Tuple[List[Tuple[int, List[Document]]], np.ndarray]] = []
+        pending_vectors = 0
+
+        def create_store() -> "EmployeeVectorStore":
+            training_vectors = np.concatenate([vectors for _, vectors in pending])
+            new_store = cls(embeddings, create_index(training_vectors.shape[1], training_vectors, config), InMemoryDocstore(), {})
+            new_store._index_owned = True
+            for docs_by_employee, vectors in pending:
+                new_store._add_chunk(docs_by_employee, vectors)
+            pending.clear()
+            return new_store
+
+        for docs_by_employee, vectors in embed_employee_chunks(
+            chunks, document_embeddings or embeddings, build_employee_documents
+        ):
+            if store is not None:
+                store._add_chunk(docs_by_employee, vectors)
+                continue
+
+            pending.append((docs_by_employee, vectors))
+            pending_vectors += len(vectors)
+            if not needs_training(config) or pending_vectors >= settings.INDEX_TRAIN_SIZE:
+                store = create_store()
+
+        if store is None:
+            if not pending:
+                raise ValueError("No employee documents to index")
+            store = create_store()
+
+        return store
+
+    def similarity_search_with_score_by_vector(self, *args: Any, **kwargs: Any):
+        with self.lock:
+            # LangChain searches the index directly, which would return stale HNSW vectors
+            self.compact()
+            return super().similarity_search_with_score_by_vector(*args, **kwargs)
+
+    def search_with_relevance(
+        self,
+        query_vector: List[float],
+        k: int,
+        employee_ids: Optional[Set[int]] = None
+    ) -> List[Tuple[Document, float]]:
+        """
+        Vector search, optionally restricted to a set of employees.
+
+        Small employee sets are pushed into FAISS as an ID selector over their
+        document labels, so only their vectors are scored. Sets with more than
+        PREFILTER_MAX_LABELS documents are searched with oversampling and
+        post-filtered instead, which is cheaper than building the selector.
+
+        Args:
+            query_vector (List[float]): Query embedding.
+            k (int): Maximum number of results.
+            employee_ids (Set[int], optional): Employees to restrict the search to.
+
+        Returns:
+            List[Tuple[Document, float]]: Documents with relevance scores in [0, 1], best first.
+        """
+        faiss = dependable_faiss_import()
+        relevance = self._select_relevance_score_fn()
+        vector = np.asarray([query_vector], dtype=np.float32)
+
+        with self.lock:
+            if employee_ids is None:
+                distances, labels = self._search(vector, k)
+            else:
+                allowed_labels = self._labels_for(employee_ids, settings.PREFILTER_MAX_LABELS)
+                if allowed_labels is not None:
+                    if not len(allowed_labels):
+                        return []
+                    distances, labels = self._search(vector, k, faiss.IDSelectorBatch(allowed_labels))
+                else:
+                    fetch_k = min(self.index.ntotal, k * 10)
+                    distances, labels = self._search(vector, fetch_k)
+
+            return self._collect_hits(distances[0], labels[0], k, employee_ids, relevance)
+
+    def search_with_relevance_batch(
+        self,
+        query_vectors: List[List[float]],
+        k: int,
+        employee_ids: Optional[List[Optional[Set[int]]]] = None
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        Vector search for many queries at once.
+
+        Unrestricted queries are scored together in a single multi-query FAISS
+        search. Queries restricted to employees need their own ID selector and
+        are searched one by one with ``search_with_relevance``.
+
+        Args:
+            query_vectors (List[List[float]]): Query embeddings.
+            k (int): Maximum number of results per query.
+            employee_ids (List[Optional[Set[int]]], optional): Employees to restrict each query to.
+
+        Returns:
+            List[List[Tuple[Document, float]]]: Results per query, in input order.
+        """
+        employee_ids = employee_ids or [None] * len(query_vectors)
+        results: List[List[Tuple[Document, float]]] = [[] for _ in query_vectors]
+
+        shared = []
+        for i, allowed in enumerate(employee_ids):
+            if allowed is None:
+                shared.append(i)
+            else:
+                results[i] = self.search_with_relevance(query_vectors[i], k, allowed)
+
+        if shared:
+            relevance = self._select_relevance_score_fn()
+            matrix = np.asarray([query_vectors[i] for i in shared], dtype=np.float32)
+            with self.lock:
+                distances, labels = self._search(matrix, k)
+                for row, i in enumerate(shared):
+                    results[i] = self._collect_hits(distances[row], labels[row], k, None, relevance)
+
+        return results
+
+    def _search(self, vectors: np.ndarray, k: int, selector: Optional[Any] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Search the index for labels, skipping stale HNSW vectors."""
+        if not self._stale_offsets:
+            params = search_parameters(self.index, selector)
+            return self.index.search(vectors, k, params=params) if params else self.index.search(vectors, k)
+
+        # Stale vectors share their label with the live replacement, so they
+        # are excluded by position in the inner graph and mapped to labels here
+        faiss = dependable_faiss_import()
+        graph = faiss.downcast_index(self.index.index)
+        live = faiss.IDSelectorNot(faiss.IDSelectorBatch(np.fromiter(self._stale_offsets, dtype=np.int64)))
+        if selector is not None:
+            allowed = faiss.IDSelectorTranslated(self.index.id_map, selector)
+            live = faiss.IDSelectorAnd(allowed, live)
+        distances, offsets = graph.search(vectors, k, params=search_parameters(graph, live))
+        labels = np.array(
+            [[self.index.id_map.at(int(offset)) if offset >= 0 else -1 for offset in row] for row in offsets],
+            dtype=np.int64
+        )
+        return distances, labels
+
+    def _collect_hits(
+        self,
+        distances: np.ndarray,
+        labels: np.ndarray,
+        k: int,
+        employee_ids: Optional[Set[int]],
+        relevance: Any
+    ) -> List[Tuple[Document, float]]:
+        results = []
+        for distance, label in zip(distances, labels):
+            if label == -1:
+                continue
+            if employee_ids is not None and (int(label) >> EMPLOYEE_LABEL_BITS) not in employee_ids:
+                continue
+            doc = self.docstore.search(self.index_to_docstore_id[int(label)])
+            results.append((doc, relevance(float(distance))))
+            if len(results) == k:
+                break
+        return results
+
+    def lexical_search(
+        self,
+        query: str,
+        k: int,
+        employee_ids: Optional[Set[int]] = None
+    ) -> List[Document]:
+        """
+        BM25 search over the stored documents.
+
+        Args:
+            query (str): Query text.
+            k (int): Maximum number of results.
+            employee_ids (Set[int], optional): Employees to restrict the search to.
+
+        Returns:
+            List[Document]: Matching documents, best first.
+        """
+        with self.lock:
+            self.load_lexical_index()
+            hits = self._lexical.search(query, k, employee_ids)
+            return [self.docstore.search(doc_id) for doc_id, _ in hits]
+
+    def load_lexical_index(self) -> None:
+        """
+        Build the BM25 index if it is not built or mapped yet.
+
+        Called at load time so the first hybrid search does not pay for it.
+        """
+        with self.lock:
+            if self._lexical is not None:
+                return
+            lexical = BM25Index()
+            for label, doc_id in self.index_to_docstore_id.items():
+                lexical.add(doc_id, self.docstore.search(doc_id).page_content, label >> EMPLOYEE_LABEL_BITS)
+            self._lexical = lexical
+
+    def upsert_employee(self, emp: Dict[str, Any]) -> None:
+        """
+        Re-embed one employee's documents and replace them in the index.
+
+        Args:
+            emp (Dict[str, Any]): New employee record.
+        """
+        docs = build_employee_documents(emp)
+        # Embed outside the lock so searches are not blocked by the model
+        vectors = np.asarray(
+            self._embed_documents([doc.page_content for doc in docs]),
+            dtype=np.float32
+        )
+
+        with self.lock:
+            self._ensure_writable()
+            self._remove_employee_documents(emp["id"])
+            self._add_employee_documents(emp["id"], docs, vectors)
+
+    def delete_employee(self, employee_id: int) -> None:
+        """
+        Remove all documents of one employee from the index.
+
+        Args:
+            employee_id (int): Employee identifier.
+        """
+        with self.lock:
+            self._ensure_writable()
+            self._remove_employee_documents(employee_id)
+
+    def _ensure_writable(self) -> None:
+        if not self._index_owned:
+            faiss = dependable_faiss_import()
+            self.index = faiss.deserialize_index(faiss.serialize_index(self.index))
+            self._index_owned = True
+        if self.snapshot is not None:
+            docs = {}
+            for row in range(len(self.snapshot)):
+                for doc in build_employee_documents(self.snapshot.record(row)):
+                    docs[doc.id] = doc
+            self.docstore = InMemoryDocstore(docs)
+            self.index_to_docstore_id = dict(self.index_to_docstore_id.items())
+            self.snapshot = None
+        if isinstance(self._lexical, MappedBM25Index):
+            # The mapped postings are read-only; rebuild from the documents now in memory
+            self._lexical = None
+            self.load_lexical_index()
+
+    def _add_employee_documents(self, employee_id: int, docs: List[Document], vectors: np.ndarray) -> None:
+        labels = np.array(
+            [employee_label(employee_id, ordinal) for ordinal in range(len(docs))],
+            dtype=np.int64
+        )
+        self.docstore.add({doc.id: doc for doc in docs})
+        for label, doc in zip(labels.tolist(), docs):
+            self.index_to_docstore_id[label] = doc.id
+        self.index.add_with_ids(vectors, labels)
+
+        if self._lexical is not None:
+            for doc in docs:
+                self._lexical.add(doc.id, doc.page_content, employee_id)
+
+    def _add_chunk(self, docs_by_employee: List[Tuple[int, List[Document]]], vectors: np.ndarray) -> None:
+        offset = 0
+        for employee_id, docs in docs_by_employee:
+            self._add_employee_documents(employee_id, docs, vectors[offset:offset + len(docs)])
+            offset += len(docs)
+
+    def _labels_for(self, employee_ids: Set[int], limit: int) -> Optional[np.ndarray]:
+        """Collect the document labels of the given employees, or None past ``limit``."""
+        labels = []
+        for employee_id in employee_ids:
+            label = employee_label(employee_id)
+            while label in self.index_to_docstore_id:
+                labels.append(label)
+                label += 1
+            if len(labels) > limit:
+                return None
+        return np.array(labels, dtype=np.int64)
+
+    def _remove_employee_documents(self, employee_id: int) -> None:
+        labels = self._labels_for({employee_id}, self.index.ntotal)
+        if len(labels):
+            self._remove_labels(labels)
+
+        doc_ids = [self.index_to_docstore_id.pop(label) for label in labels.tolist()]
+        if doc_ids:
+            self.docstore.delete(doc_ids)
+
+        if self._lexical is not None:
+            for doc_id in doc_ids:
+                self._lexical.remove(doc_id)
+
+    def _remove_labels(self, labels: np.ndarray) -> None:
+        faiss = dependable_faiss_import()
+        if supports_remove(self.index):
+            # IVF hashtable direct maps only accept explicit label arrays
+            self.index.remove_ids(faiss.IDSelectorArray(labels))
+            return
+
+        # HNSW graphs cannot drop nodes, so the vectors are only marked stale
+        # and the graph is rebuilt once enough of it is
+        positions = np.flatnonzero(np.isin(faiss.vector_to_array(self.index.id_map), labels))
+        self._stale_offsets.update(positions.tolist())
+        if len(self._stale_offsets) > settings.HNSW_REBUILD_STALE_RATIO * self.index.ntotal:
+            self.compact(exclude=labels)
+
+    def compact(self, exclude: Optional[np.ndarray] = None) -> None:
+        """
+        Rebuild an HNSW graph without its stale vectors.
+
+        A no-op for other index types and for graphs without stale vectors.
+
+        Args:
+            exclude (np.ndarray, optional): Labels being removed, left out of the rebuilt graph.
+        """
+        with self.lock:
+            if not self._stale_offsets:
+                return
+
+            logger.info(f"Rebuilding HNSW index without {len(self._stale_offsets)} stale vectors")
+            removed = set(exclude.tolist()) if exclude is not None else set()
+            kept = np.array([label for label in self.index_to_docstore_id if label not in removed], dtype=np.int64)
+            # reconstruct() reads the newest vector stored under each label
+            vectors = self.index.reconstruct_batch(kept) if len(kept) else None
+
+            config = self.manifest.get("index") if self.manifest else index_config(index_type="hnsw")
+            index = create_index(self.index.d, config=config)
+            if len(kept):
+                index.add_with_ids(vectors, kept)
+            self.index = index
+            self._stale_offsets = set()
+
+def create_embedding_model() -> Embeddings:
+    """
+    Create the uncached embedding model.
+
+    Returns:
+        Embeddings: Embedding model of the configured EMBEDDING_BACKEND, producing normalized vectors.
+    """
+    return create_backend_embeddings(settings.EMBEDDING_BACKEND, settings.EMBEDDING_THREADS)
+
+def get_embeddings() -> Embeddings:
+    """
+    Initialize and return the embedding model.
+
+    Document embeddings go through the persistent embedding cache when it is
+    enabled, so rebuilds only embed new or changed texts.
+
+    Returns:
+        Embeddings: Configured embedding model.
+    """
+    embeddings = create_embedding_model()
+
+    if settings.EMBEDDING_CACHE_ENABLED:
+        return CachedEmbeddings(embeddings, get_embedding_cache(normalize=True))
+    return embeddings
+
+def compute_data_hash(file_path: str = settings.DATA_PATH) -> str:
+    """
+    Compute the SHA-256 hash of the employee data file.
+
+    Args:
+        file_path (str): Path to the data file, relative to the application root.
+
+    Returns:
+        str: Hex digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(resolve_data_path(file_path), "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def build_manifest(data_hash: str) -> Dict[str, Any]:
+    """
+    Build the manifest describing how a persisted index was produced.
+
+    Args:
+        data_hash (str): Hash of the employee data the index was built from.
+
+    Returns:
+        Dict[str, Any]: Manifest contents.
+    """
+    return {
+        "data_hash": data_hash,
+        "embedding_model": embedding_model_id(),
+        "normalize_embeddings": True,
+        "document_builder_version": DOCUMENT_BUILDER_VERSION,
+        "employee_snapshot_version": SNAPSHOT_VERSION,
+        "bm25_version": BM25_VERSION,
+        "index": index_config(),
+    }
+
+def read_manifest(path: str = settings.VECTOR_STORE_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Read the manifest stored next to a persisted index.
+
+    Args:
+        path (str): Directory of the persisted vector store.
+
+    Returns:
+        Optional[Dict[str, Any]]: Manifest contents, or None if missing or unreadable.
+    """
+    manifest_path = os.path.join(path, MANIFEST_FILENAME)
+    try:
+        with open(manifest_path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def write_manifest(manifest: Dict[str, Any], path: str = settings.VECTOR_STORE_PATH) -> None:
+    """
+    Atomically write the manifest next to a persisted index.
+
+    Args:
+        manifest (Dict[str, Any]): Manifest contents.
+        path (str): Directory of the persisted vector store.
+    """
+    manifest_path = os.path.join(path, MANIFEST_FILENAME)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+@contextmanager
+def index_lock(path: str = settings.VECTOR_STORE_PATH, exclusive: bool = False) -> Iterator[None]:
+    """
+    Hold a file lock on a persisted vector store across processes.
+
+    Workers load under a shared lock and build or save under an exclusive
+    one, so concurrently starting workers build the index once and never
+    load a half-written one. A no-op where ``fcntl`` is unavailable.
+
+    Args:
+        path (str): Directory of the persisted vector store.
+        exclusive (bool): Take the exclusive lock instead of a shared one.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, LOCK_FILENAME), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def load_vector_store(embeddings: Embeddings, path: str = settings.VECTOR_STORE_PATH) -> EmployeeVectorStore:
+    """
+    Load a persisted vector store, memory-mapping the FAISS index when enabled.
+
+    With SHARED_SNAPSHOT the documents are served from the memory-mapped
+    employee snapshot instead of being unpickled.
+
+    Args:
+        embeddings (Embeddings): Embedding model used for queries.
+        path (str): Directory of the persisted vector store.
+
+    Returns:
+        EmployeeVectorStore: Loaded vector store.
+    """
+    faiss = dependable_faiss_import()
+    index_path = os.path.join(path, f"{INDEX_NAME}.faiss")
+
+    if settings.VECTOR_STORE_MMAP:
+        # IO_FLAG_MMAP_IFC maps flat codes without copying them (faiss >= 1.10)
+        io_flags = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+        index = faiss.read_index(index_path, io_flags)
+    else:
+        index = faiss.read_index(index_path)
+
+    if settings.SHARED_SNAPSHOT:
+        snapshot = EmployeeSnapshot.open(path)
+        labels = np.load(os.path.join(path, LABELS_FILENAME), mmap_mode="r")
+        db = EmployeeVectorStore(embeddings, index, SnapshotDocstore(snapshot), SnapshotLabels(labels))
+        db.snapshot = snapshot
+        # Postings written with the store, so workers neither build nor copy them
+        db._lexical = MappedBM25Index.open(path, label_document_id)
+    else:
+        # The docstore pickle is written by save_vector_store, never by third parties
+        with open(os.path.join(path, f"{INDEX_NAME}.pkl"), "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+        db = EmployeeVectorStore(embeddings, index, docstore, index_to_docstore_id)
+
+    db._index_owned = not settings.VECTOR_STORE_MMAP
+    return db
+
+def save_vector_store(
+    db: EmployeeVectorStore,
+    manifest: Dict[str, Any],
+    employees: Iterable[Dict[str, Any]],
+    path: str = settings.VECTOR_STORE_PATH
+) -> None:
+    """
+    Persist a vector store, its BM25 postings, its employee snapshot and its manifest.
+
+    The old manifest is removed first so that an interrupted save is seen as
+    stale on the next start instead of loading a half-written index. Files
+    are written under temporary names and renamed into place, so processes
+    that memory-map the previous files keep reading them unchanged. Callers
+    hold ``index_lock(path, exclusive=True)``.
+
+    Args:
+        db (EmployeeVectorStore): Vector store to persist.
+        manifest (Dict[str, Any]): Manifest describing the stored index.
+        employees (Iterable[Dict[str, Any]]): Employee records the store was built from, in load order.
+        path (str): Directory of the persisted vector store.
+    """
+    os.makedirs(path, exist_ok=True)
+    manifest_path = os.path.join(path, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    temporary_name = f"{INDEX_NAME}.tmp"
+    with db.lock:
+        # Stale HNSW vectors are not recorded on disk, so they are dropped first
+        db.compact()
+        db.save_local(path, index_name=temporary_name)
+        labels = np.array(sorted(db.index_to_docstore_id), dtype=np.int64)
+        write_bm25_index((
+            (label, label >> EMPLOYEE_LABEL_BITS, db.docstore.search(doc_id).page_content)
+            for label, doc_id in db.index_to_docstore_id.items()
+        ), path)
+    for extension in ("faiss", "pkl"):
+        os.replace(
+            os.path.join(path, f"{temporary_name}.{extension}"),
+            os.path.join(path, f"{INDEX_NAME}.{extension}")
+        )
+    labels_path = os.path.join(path, LABELS_FILENAME)
+    with open(f"{labels_path}.tmp", "wb") as f:
+        np.save(f, labels)
+    os.replace(f"{labels_path}.tmp", labels_path)
+
+    write_snapshot(employees, path)
+    write_manifest(manifest, path)
+    db.manifest = manifest
+
+def get_vector_store(
+    employees: Optional[List[Dict[str, Any]]] = None,
+    embeddings: Optional[Embeddings] = None
+) -> EmployeeVectorStore:
+    """
+    Load the persisted vector store, rebuilding it only when it is stale.
+
+    The index is reused when the manifest next to it matches the current data
+    file hash, embedding model, document builder version and index settings.
+
+    Rebuilds stream the employees in chunks of INGEST_CHUNK_SIZE and embed
+    them in INGEST_EMBED_WORKERS processes when that is set. The build runs
+    under an exclusive file lock: workers starting together wait for the
+    first one to build and then load its result.
+
+    Args:
+        employees (List[Dict[str, Any]], optional): Employee records to index.
+            Streamed from the data file if not given.
+        embeddings (Embeddings, optional): Embedding model to use, such as the
+            one of the store being reloaded. Created via get_embeddings if not given.
+
+    Returns:
+        EmployeeVectorStore: Ready-to-query vector store.
+    """
+    if embeddings is None:
+        embeddings = get_embeddings()
+    expected = build_manifest(compute_data_hash())
+
+    if settings.VECTOR_STORE_MODE == "load_or_build":
+        with index_lock():
+            db = load_current_vector_store(embeddings, expected)
+        if db is not None:
+            return db
+
+    with index_lock(exclusive=True):
+        # Another worker may have built the index while this one waited
+        if settings.VECTOR_STORE_MODE == "load_or_build":
+            db = load_current_vector_store(embeddings, expected)
+            if db is not None:
+                return db
+        logger.info("Persisted vector store is missing or stale, rebuilding")
+
+        def records() -> Iterator[Dict[str, Any]]:
+            if employees is not None:
+                return iter(employees)
+            return (emp for chunk in iter_employee_chunks() for emp in chunk)
+
+        document_embeddings = embeddings
+        if settings.INGEST_EMBED_WORKERS > 0:
+            document_embeddings = parallel_embeddings(embeddings, create_embedding_model, settings.INGEST_EMBED_WORKERS)
+        try:
+            db = EmployeeVectorStore.from_employee_chunks(
+                chunked(records(), settings.INGEST_CHUNK_SIZE), embeddings, expected["index"], document_embeddings
+            )
+        finally:
+            close_embeddings(document_embeddings)
+        save_vector_store(db, expected, records())
+
+        if settings.SHARED_SNAPSHOT:
+            # Serve from the files just written so this worker shares their pages too
+            db = load_vector_store(embeddings)
+            db.manifest = expected
+        return db
+
+def load_current_vector_store(embeddings: Embeddings, expected: Dict[str, Any]) -> Optional[EmployeeVectorStore]:
+    """
+    Load the persisted vector store if its manifest matches.
+
+    Args:
+        embeddings (Embeddings): Embedding model used for queries.
+        expected (Dict[str, Any]): Manifest of the current data and settings.
+
+    Returns:
+        Optional[EmployeeVectorStore]: The loaded store, or None if missing, stale or unreadable.
+    """
+    if read_manifest() != expected:
+        return None
+    try:
+        db = load_vector_store(embeddings)
+        db.manifest = expected
+        logger.info(f"Loaded persisted vector store from {settings.VECTOR_STORE_PATH}")
+        return db
+    except Exception as e:
+        logger.warning(f"Failed to load persisted vector store, rebuilding: {str(e)}")
+        return None
+
+def reciprocal_rank_fusion(rankings: List[List[Document]], k: int = settings.RRF_K) -> List[Document]:
+    """
+    Fuse several rankings of documents with reciprocal rank fusion.
+
+    Args:
+        rankings (List[List[Document]]): Rankings to fuse, each best first.
+        k (int): RRF constant; larger values flatten the contribution of top ranks.
+
+    Returns:
+        List[Document]: Fused ranking, best first.
+    """
+    scores: Dict[str, float] = {}
+    docs: Dict[str, Document] = {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking):
+            scores[doc.id] = scores.get(doc.id, 0.0) + 1.0 / (k + rank + 1)
+            docs.setdefault(doc.id, doc)
+    return [docs[doc_id] for doc_id in sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))]
+
+class EmployeeRetriever(BaseRetriever):
+    """
+    Hybrid retriever over an EmployeeVectorStore.
+
+    Structured filters (availability, minimum experience, skills) are resolved
+    to a set of employee ids through the search index and applied before
+    scoring. Vector hits above the similarity threshold are then fused with
+    BM25 hits using reciprocal rank fusion. Filters come from ``filters`` when
+    set explicitly, otherwise they are extracted from the query; extracted
+    filters that match nobody are ignored rather than returning nothing.
+    ``candidate_ids`` further restricts retrieval to a set of employees, such
+    as those of the previous answer in a chat session.
+
+    When ``group_by_employee`` is set, hits are collapsed to the best document
+    per employee and ``k`` counts employees. With a ``context_token_budget``,
+    each employee is then returned as one compact summary, packed until the
+    budget is used up.
+
+    Async retrieval embeds the query through a QueryEmbeddingBatcher, so
+    concurrent requests share batched forward passes of the embedding model.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    vector_store: EmployeeVectorStore
+    batcher: Optional[QueryEmbeddingBatcher] = None
+    search_index: Optional[EmployeeSearchIndex] = None
+    filters: Optional[Dict[str, Any]] = None
+    extracted_filters: Optional[Dict[str, Any]] = None
+    candidate_ids: Optional[Set[int]] = None
+    k: int = settings.MAX_RESULTS
+    score_threshold: float = settings.SIMILARITY_THRESHOLD
+    fetch_k: int = settings.HYBRID_FETCH_K
+    hybrid: bool = settings.HYBRID_SEARCH_ENABLED
+    auto_filters: bool = settings.QUERY_FILTER_EXTRACTION
+    group_by_employee: bool = settings.GROUP_RESULTS_BY_EMPLOYEE
+    context_token_budget: Optional[int] = None
+
+    def with_candidates(self, employee_ids: Optional[Iterable[int]]) -> "EmployeeRetriever":
+        """
+        Return a copy of this retriever restricted to a candidate set of employees.
+
+        Used for follow-up questions, which are answered from the employees
+        of the previous answer. Structured filters narrow the candidates
+        further; extracted filters that match none of them are ignored.
+
+        Args:
+            employee_ids (Iterable[int], optional): Candidate employees, or None for no restriction.
+
+        Returns:
+            EmployeeRetriever: Retriever restricted to the candidates.
+        """
+        candidates = set(employee_ids) if employee_ids is not None else None
+        return self.model_copy(update={"candidate_ids": candidates})
+
+    def with_filters(
+        self,
+        filters: Optional[Dict[str, Any]],
+        extracted: Optional[Dict[str, Any]] = None
+    ) -> "EmployeeRetriever":
+        """
+        Return a copy of this retriever with explicit structured filters.
+
+        Args:
+            filters (Dict[str, Any], optional): Any of ``availability``,
+                ``min_experience`` and ``skills``. Empty values are ignored.
+            extracted (Dict[str, Any], optional): Filters already extracted
+                from the query, used instead of extracting them again.
+
+        Returns:
+            EmployeeRetriever: Retriever applying the filters.
+        """
+        filters = {key: value for key, value in (filters or {}).items() if value not in (None, [], "")}
+        return self.model_copy(update={"filters": filters or None, "extracted_filters": extracted})
+
+    def resolve_employee_ids(self, query: str) -> Optional[Set[int]]:
+        """
+        Resolve the structured filters for a query to allowed employee ids.
+
+        Args:
+            query (str): User question.
+
+        Returns:
+            Optional[Set[int]]: Allowed employee ids, or None for no restriction.
+        """
+        candidates = self.candidate_ids
+        if self.search_index is None:
+            return set(candidates) if candidates is not None else None
+
+        if self.filters:
+            employee_ids = self.search_index.search_ids(**self.filters)
+            return employee_ids if candidates is None else employee_ids & candidates
+
+        if self.auto_filters:
+            extracted = self.extracted_filters
+            if extracted is None:
+                extracted = extract_filters(query, self.search_index.skill_vocabulary())
+            if extracted:
+                employee_ids = self.search_index.search_ids(**extracted)
+                if candidates is not None:
+                    employee_ids &= candidates
+                if employee_ids:
+                    logger.info(f"Pre-filtering retrieval with {extracted} ({len(employee_ids)} employees)")
+                    return employee_ids
+
+        return set(candidates) if candidates is not None else None
+
+    def search(self, query: str, query_vector: List[float]) -> List[Document]:
+        """
+        Return the fused, pre-filtered documents for an embedded query.
+
+        Args:
+            query (str): User question.
+            query_vector (List[float]): Query embedding.
+
+        Returns:
+            List[Document]: Up to ``k`` relevant documents, best first.
+        """
+        return self.search_batch([query], [query_vector])[0]
+
+    def search_batch(
+        self,
+        queries: List[str],
+        query_vectors: List[List[float]],
+        filters: Optional[List[Optional[Dict[str, Any]]]] = None,
+        extracted: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[List[Document]]:
+        """
+        Return the fused, pre-filtered documents for many embedded queries.
+
+        Vector search runs as one multi-query search for all queries without
+        pre-filters.
+
+        Args:
+            queries (List[str]): User questions.
+            query_vectors (List[List[float]]): Query embeddings.
+            filters (List[Optional[Dict[str, Any]]], optional): Explicit
+                structured filters per query, see ``with_filters``.
+            extracted (List[Optional[Dict[str, Any]]], optional): Filters
+                already extracted from each query, see ``with_filters``.
+
+        Returns:
+            List[List[Document]]: Up to ``k`` relevant documents per query, best first.
+        """
+        filters = filters or [None] * len(queries)
+        extracted = extracted or [None] * len(queries)
+        with timed_stage("prefilter"):
+            employee_ids = [
+                (
+                    self.with_filters(query_filters, query_extracted)
+                    if query_filters or query_extracted is not None else self
+                ).resolve_employee_ids(query)
+                for query, query_filters, query_extracted in zip(queries, filters, extracted)
+            ]
+
+        # Filters that match nobody return nothing without searching
+        searchable = [i for i, allowed in enumerate(employee_ids) if allowed is None or allowed]
+        fetch_k = max(self.fetch_k, self.k) if self.hybrid or self.group_by_employee else self.k
+        with timed_stage("vector_search"):
+            vector_hits = self.vector_store.search_with_relevance_batch(
+                [query_vectors[i] for i in searchable], fetch_k, [employee_ids[i] for i in searchable]
+            )
+
+        results: List[List[Document]] = [[] for _ in queries]
+        for i, hits in zip(searchable, vector_hits):
+            ranked = [doc for doc, score in hits if score >= self.score_threshold]
+            results[i] = self._rank(queries[i], ranked, employee_ids[i], fetch_k)
+        return results
+
+    def _rank(self, query: str, ranked: List[Document], employee_ids: Optional[Set[int]], fetch_k: int) -> List[Document]:
+        if self.hybrid:
+            with timed_stage("lexical_search"):
+                lexical_hits = self.vector_store.lexical_search(query, fetch_k, employee_ids)
+            ranked = reciprocal_rank_fusion([ranked, lexical_hits])
+
+        if not self.group_by_employee:
+            return ranked[:self.k]
+
+        best = group_by_employee(ranked)[:self.k]
+        if self.context_token_budget is None:
+            return best
+
+        lookup = self.search_index.get if self.search_index is not None else None
+        with timed_stage("context_packing"):
+            return pack_context(best, self.context_token_budget, lookup)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        with timed_stage("embed"):
+            query_vector = self.vector_store.embedding_function.embed_query(query)
+        return self.search(query, query_vector)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        with timed_stage("embed"):
+            if self.batcher is not None:
+                query_vector = await self.batcher.embed(query)
+            else:
+                query_vector = await asyncio.to_thread(self.vector_store.embedding_function.embed_query, query)
+        return await asyncio.to_thread(self.search, query, query_vector)
+
+def get_retriever(
+    db: Optional[EmployeeVectorStore] = None,
+    batcher: Optional[QueryEmbeddingBatcher] = None,
+    search_index: Optional[EmployeeSearchIndex] = None
+) -> EmployeeRetriever:
+    """
+    Build and return a configured retriever.
+
+    Args:
+        db (EmployeeVectorStore, optional): Vector store to retrieve from. Loaded or built
+            via get_vector_store if not given.
+        batcher (QueryEmbeddingBatcher, optional): Batcher for async query embeddings.
+            Created for the vector store's embedding model if not given.
+        search_index (EmployeeSearchIndex, optional): Structured index used to resolve
+            pre-filters. Without it, retrieval is not pre-filtered.
+
+    Returns:
+        EmployeeRetriever: Configured retriever instance.
+    """
+    try:
+        if db is None:
+            db = get_vector_store()
+        if batcher is None:
+            batcher = QueryEmbeddingBatcher(db.embedding_function)
+
+        return EmployeeRetriever(vector_store=db, batcher=batcher, search_index=search_index)
+
     except Exception as e:
         logger.error(f"Error building retriever: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
@@ -0,0 +1,154 @@
+"""
+Router service module for the Employee Search RAG application.
+
+This module handles filter-style chat questions ("list available people with
+React") without retrieval or the LLM: questions the query parser describes
+completely enough are answered from the structured employee search with a
+templated response.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.metrics_service import Counter, registry
+from app.services.query_parser import parse_query
+from app.services.search_service import EmployeeSearchIndex
+
+logger = logging.getLogger(__name__)
+
+CHAT_ROUTES = registry.register(Counter(
+    "rag_chat_routes_total", "Chat questions by how they were answered.", ["route"]
+))
+
+def route_query(
+    query: str,
+    search_index: EmployeeSearchIndex,
+    explicit_filters: Optional[Dict[str, Any]] = None,
+    threshold: float = settings.STRUCTURED_ROUTING_THRESHOLD
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Decide whether a question can be answered from structured search.
+
+    Args:
+        query (str): User question.
+        search_index (EmployeeSearchIndex): Index of all employees.
+        explicit_filters (Dict[str, Any], optional): Filters set on the request;
+            they take precedence over filters found in the question.
+        threshold (float): Minimum parser confidence to answer without the LLM.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Dict[str, Any]]: The parsed query to
+        answer from search, or None to fall through to the QA chain, and the
+        filters extracted from the question for the chain's retrieval.
+    """
+    parsed = parse_query(query, search_index.skill_vocabulary())
+    availability = parsed["filters"].get("availability")
+    if availability and availability not in search_index.availability_values():
+        # A status no employee has would be answered "nobody"; let the LLM interpret it
+        parsed["confidence"] = 0.0
+    if not settings.STRUCTURED_ROUTING_ENABLED or parsed["confidence"] < threshold:
+        CHAT_ROUTES.inc(route="llm")
+        return None, parsed["filters"]
+
+    parsed["filters"] = {**parsed["filters"], **(explicit_filters or {})}
+    CHAT_ROUTES.inc(route="search")
+    logger.info(f"Answering from structured search: {parsed['filters']} (confidence {parsed['confidence']})")
+    return parsed, parsed["filters"]
+
+def describe_filters(filters: Dict[str, Any], max_experience: Optional[int] = None) -> str:
+    """
+    Describe filters as a phrase for a templated answer.
+
+    Args:
+        filters (Dict[str, Any]): Any of ``availability``, ``min_experience`` and ``skills``.
+        max_experience (int, optional): Maximum years of experience.
+
+    Returns:
+        str: Phrase such as "who are available, with React and AWS, with at least 5 years of experience".
+    """
+    parts: List[str] = []
+    if filters.get("availability"):
+        parts.append(f"who are {filters['availability']}")
+    if filters.get("skills"):
+        skills = filters["skills"]
+        parts.append("with " + (skills[0] if len(skills) == 1 else f"{', '.join(skills[:-1])} and {skills[-1]}"))
+
+    min_experience = filters.get("min_experience")
+    if min_experience is not None and max_experience is not None:
+        parts.append(f"with {min_experience} to {max_experience} years of experience")
+    elif min_experience is not None:
+        parts.append(f"with at least {min_experience} years of experience")
+    elif max_experience is not None:
+        parts.append(f"with at most {max_experience} years of experience")
+    return ", ".join(parts)
+
+def structured_search(
+    search_index: EmployeeSearchIndex,
+    filters: Dict[str, Any],
+    max_experience: Optional[int] = None,
+    limit: int = settings.STRUCTURED_ROUTING_MAX_LISTED
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Find the employees matching parsed filters, most experienced first.
+
+    Args:
+        search_index (EmployeeSearchIndex): Index of all employees.
+        filters (Dict[str, Any]): Keyword filters of ``EmployeeSearchIndex.search``.
+        max_experience (int, optional): Maximum years of experience.
+        limit (int): Maximum number of employees to return.
+
+    Returns:
+        Tuple[int, List[Dict[str, Any]]]: Number of matching employees and the first ``limit`` of them.
+    """
+    if max_experience is None:
+        total, employee_ids, _ = search_index.search_page(**filters, sort="-experience", limit=limit)
+        return total, [emp for emp in map(search_index.get, employee_ids) if emp is not None]
+
+    # The index has no upper bound on experience, so it is applied to the matches
+    matches = [emp for emp in search_index.search(**filters) if emp["experience_years"] <= max_experience]
+    matches.sort(key=lambda emp: (-emp["experience_years"], emp["name"]))
+    return len(matches), matches[:limit]
+
+def format_structured_answer(total: int, employees: List[Dict[str, Any]], description: str) -> str:
+    """
+    Format the templated answer to a filter-style question.
+
+    Args:
+        total (int): Number of matching employees.
+        employees (List[Dict[str, Any]]): Employees to list.
+        description (str): Filters as returned by ``describe_filters``.
+
+    Returns:
+        str: Answer listing the employees.
+    """
+    if not total:
+        return f"I couldn't find any employees {description}."
+
+    noun = "employee" if total == 1 else "employees"
+    lines = [f"I found {total} {noun} {description}:", ""]
+    for emp in employees:
+        projects = f" Projects: {', '.join(emp['projects'])}." if emp.get("projects") else ""
+        lines.append(
+            f"- {emp['name']} ({emp['experience_years']} years of experience, {emp['availability']}). "
+            f"Skills: {', '.join(emp['skills'])}.{projects}"
+        )
+    if total > len(employees):
+        lines.append("")
+        lines.append(f"...and {total - len(employees)} more. Use /employees/search to see them all.")
+    return "\n".join(lines)
+
+def answer_structured(search_index: EmployeeSearchIndex, parsed: Dict[str, Any]) -> Tuple[str, List[int]]:
+    """
+    Answer a routed question from structured search.
+
+    Args:
+        search_index (EmployeeSearchIndex): Index of all employees.
+        parsed (Dict[str, Any]): Parsed query returned by ``route_query``.
+
+    Returns:
+        Tuple[str, List[int]]: Templated answer and the ids of the listed employees.
+    """
+    total, employees = structured_search(search_index, parsed["filters"], parsed["max_experience"])
+    description = describe_filters(parsed["filters"], parsed["max_experience"])
+    return format_structured_answer(total, employees, description), [emp["id"] for emp in employees]
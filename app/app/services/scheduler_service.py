@@ -0,0 +1,123 @@
+"""
+Scheduler service module for the Employee Search RAG application.
+
+This module bounds how many LLM generations run against Ollama at once and
+applies backpressure when too many requests are waiting for a slot.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from app.core.config import settings
+from app.services.metrics_service import timed_stage
+
+logger = logging.getLogger(__name__)
+
+class SchedulerBusyError(Exception):
+    """Raised when a request cannot be admitted to the LLM scheduler."""
+
+    def __init__(self, message: str, status_code: int, retry_after: int):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+class LLMScheduler:
+    """
+    Admission control for LLM generations.
+
+    At most ``max_concurrency`` generations run at once. Up to ``queue_depth``
+    further requests wait for a slot for at most ``queue_timeout`` seconds.
+    Requests beyond the queue are rejected with 429, and requests that time
+    out while queued are rejected with 503.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = settings.LLM_MAX_CONCURRENCY,
+        queue_depth: int = settings.LLM_QUEUE_DEPTH,
+        queue_timeout: float = settings.LLM_QUEUE_TIMEOUT,
+        retry_after: int = settings.LLM_RETRY_AFTER
+    ):
+        self.max_concurrency = max_concurrency
+        self.queue_depth = queue_depth
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._waiting = 0
+        self._running = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests queued for a generation slot."""
+        return self._waiting
+
+    @property
+    def running(self) -> int:
+        """Number of generations currently running."""
+        return self._running
+
+    async def acquire(self) -> Callable[[], None]:
+        """
+        Wait for a generation slot.
+
+        Returns:
+            Callable[[], None]: Idempotent callback that returns the slot.
+
+        Raises:
+            SchedulerBusyError: If the queue is full (429) or the wait timed out (503).
+        """
+        if not self._semaphore.locked():
+            # A free slot is taken without suspending
+            await self._semaphore.acquire()
+        else:
+            if self._waiting >= self.queue_depth:
+                logger.warning(f"LLM queue full ({self._waiting} waiting), rejecting request")
+                raise SchedulerBusyError("LLM queue is full", 429, self.retry_after)
+
+            self._waiting += 1
+            # Shielded so a slot granted just as the wait gives up is returned rather than leaked
+            waiter = asyncio.ensure_future(self._semaphore.acquire())
+            try:
+                with timed_stage("queue_wait"):
+                    await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._abandon(waiter)
+                logger.warning(f"Request waited {self.queue_timeout}s for an LLM slot, giving up")
+                raise SchedulerBusyError("Timed out waiting for the LLM", 503, self.retry_after)
+            except asyncio.CancelledError:
+                self._abandon(waiter)
+                raise
+            finally:
+                self._waiting -= 1
+
+        self._running += 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._running -= 1
+                self._semaphore.release()
+
+        return release
+
+    def _abandon(self, waiter: "asyncio.Future[bool]") -> None:
+        # Cancel the acquire, and return the slot if it was granted anyway
+        def release_granted(future: "asyncio.Future[bool]") -> None:
+            if not future.cancelled() and future.exception() is None:
+                self._semaphore.release()
+
+        waiter.add_done_callback(release_granted)
+        waiter.cancel()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a generation slot for the duration of the block."""
+        release = await self.acquire()
+        try:
+            yield
+        finally:
+            release()
@@ -0,0 +1,597 @@
+"""
+Search service module for the Employee Search RAG application.
+
+This module handles structured employee search using in-memory indexes that are
+built once at load time and patched on every employee write, so filtering does
+not scan the full employee list on each request. Search results can be sorted,
+paged with opaque cursors and rendered from JSON fragments serialized once per
+employee instead of per request.
+"""
+
+import base64
+import bisect
+import heapq
+import json
+import logging
+import threading
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple, Union
+
+from app.core.config import settings
+from app.services.trigram_index import TrigramIndex
+
+logger = logging.getLogger(__name__)
+
+EMPLOYEE_FIELDS = ("id", "name", "skills", "experience_years", "projects", "availability")
+SORT_FIELDS = ("name", "experience", "relevance")
+
+def parse_sort(sort: Optional[str]) -> Tuple[Optional[str], bool]:
+    """
+    Parse a sort parameter such as ``name``, ``-experience`` or ``relevance``.
+
+    Args:
+        sort (str, optional): Field from SORT_FIELDS, prefixed with ``-`` for descending order.
+
+    Returns:
+        Tuple[Optional[str], bool]: Sort field (None for load order) and whether it is descending.
+
+    Raises:
+        ValueError: If the field cannot be sorted on.
+    """
+    if not sort:
+        return None, False
+    field = sort.lstrip("-")
+    if field not in SORT_FIELDS:
+        raise ValueError(f"Cannot sort by '{field}', expected one of {', '.join(SORT_FIELDS)}")
+    return field, sort.startswith("-")
+
+def resolve_sort(search: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the sort order of a search, defaulting to relevance for fuzzy searches.
+
+    Args:
+        search (Dict[str, Any]): Keyword arguments of ``EmployeeSearchIndex.search_page``.
+
+    Returns:
+        Optional[str]: Sort parameter, None for load order.
+    """
+    if search.get("sort"):
+        return search["sort"]
+    # Fuzzy matches are only useful best first
+    if search.get("fuzzy") and (search.get("name") or search.get("project")):
+        return "relevance"
+    return None
+
+def encode_cursor(sort: Optional[str], key: Tuple[Any, ...]) -> str:
+    """Encode the sort key of the last returned employee as an opaque cursor."""
+    raw = json.dumps([sort or "", list(key)], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, sort: Optional[str]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by ``encode_cursor`` for the same sort order.
+
+    Args:
+        cursor (str): Cursor from a previous page.
+        sort (str, optional): Sort parameter of the current request.
+
+    Returns:
+        Tuple[Any, ...]: Sort key to continue after.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort order.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, key = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if cursor_sort != (sort or ""):
+        raise ValueError("Cursor was issued for a different sort order")
+    return tuple(key)
+
+class EmployeeSearchIndex:
+    """
+    In-memory inverted index over employee records.
+
+    Maintains lowercase skill and availability posting sets, an
+    experience-sorted array so ``min_experience`` is a bisect, and trigram
+    indexes over employee and project names for substring and fuzzy name
+    lookups. Results are
+    returned in load order (new employees are appended at the end) unless a
+    sort order is requested. Each employee's fields are also kept as
+    serialized JSON fragments so a page of results is rendered by joining
+    bytes. All public methods are safe to call from concurrent threads.
+    """
+
+    def __init__(
+        self,
+        employees: Optional[List[Dict[str, Any]]] = None,
+        fuzzy_threshold: float = settings.NAME_FUZZY_THRESHOLD,
+        index_projects: bool = settings.NAME_INDEX_PROJECTS
+    ):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.index_projects = index_projects
+        self._lock = threading.RLock()
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._order: Dict[int, int] = {}
+        self._next_order = 0
+        self._names: Dict[int, str] = {}
+        self._skills: Dict[str, Set[int]] = {}
+        self._skill_names: Dict[str, str] = {}
+        self._availability: Dict[str, Set[int]] = {}
+        self._experience: List[Tuple[int, int]] = []
+        self._experience_by_id: Dict[int, int] = {}
+        self._fragments: Dict[int, Dict[str, bytes]] = {}
+        self._serialized: Dict[int, bytes] = {}
+        self._sorted: Dict[Optional[str], List[Tuple[Any, ...]]] = {}
+        self._name_index = TrigramIndex()
+        self._project_index = TrigramIndex()
+
+        for emp in employees or []:
+            self.upsert(emp)
+
+        logger.info(f"Built search index over {len(self._records)} employees")
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, employee_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up an employee by id.
+
+        Args:
+            employee_id (int): Employee identifier.
+
+        Returns:
+            Optional[Dict[str, Any]]: Employee record, or None if not indexed.
+        """
+        return self._records.get(employee_id)
+
+    def records(self) -> List[Dict[str, Any]]:
+        """
+        Return all employee records in load order.
+
+        Returns:
+            List[Dict[str, Any]]: Employee records.
+        """
+        with self._lock:
+            return list(self._records.values())
+
+    def skill_vocabulary(self) -> List[str]:
+        """
+        Return the distinct skills of all indexed employees.
+
+        Returns:
+            List[str]: One spelling per case-insensitive skill.
+        """
+        with self._lock:
+            return list(self._skill_names.values())
+
+    def availability_values(self) -> List[str]:
+        """
+        Return the distinct availability statuses of all indexed employees.
+
+        Returns:
+            List[str]: Lowercase statuses.
+        """
+        with self._lock:
+            return list(self._availability)
+
+    def upsert(self, emp: Dict[str, Any]) -> None:
+        """
+        Add an employee or replace an existing one, keeping its position.
+
+        Args:
+            emp (Dict[str, Any]): Employee record.
+        """
+        with self._lock:
+            employee_id = emp["id"]
+            if employee_id in self._records:
+                self._unindex(self._records[employee_id])
+            else:
+                self._order[employee_id] = self._next_order
+                self._next_order += 1
+
+            self._records[employee_id] = emp
+            self._serialize(emp)
+            self._sorted.clear()
+            self._names[employee_id] = emp["name"].lower()
+            self._name_index.add(employee_id, [emp["name"]])
+            if self.index_projects:
+                self._project_index.add(employee_id, emp["projects"])
+            for skill in emp["skills"]:
+                self._skills.setdefault(skill.lower(), set()).add(employee_id)
+                self._skill_names.setdefault(skill.lower(), skill)
+            self._availability.setdefault(emp["availability"].lower(), set()).add(employee_id)
+            bisect.insort(self._experience, (emp["experience_years"], employee_id))
+            self._experience_by_id[employee_id] = emp["experience_years"]
+
+    def delete(self, employee_id: int) -> None:
+        """
+        Remove an employee from the index.
+
+        Args:
+            employee_id (int): Employee identifier.
+        """
+        with self._lock:
+            emp = self._records.pop(employee_id, None)
+            if emp is None:
+                return
+            self._unindex(emp)
+            del self._order[employee_id]
+            self._fragments.pop(employee_id, None)
+            self._serialized.pop(employee_id, None)
+            self._sorted.clear()
+
+    def search(
+        self,
+        name: Optional[str] = None,
+        skills: Optional[List[Union[str, List[str]]]] = None,
+        min_experience: Optional[int] = None,
+        availability: Optional[str] = None,
+        project: Optional[str] = None,
+        fuzzy: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Return employees matching all given filters.
+
+        Args:
+            name (str, optional): Case-insensitive substring of the employee name.
+            skills (List[str], optional): Skills the employee must all have (case-insensitive);
+                an entry may be a list of alternatives, any of which matches.
+            min_experience (int, optional): Minimum years of experience.
+            availability (str, optional): Availability status (case-insensitive).
+            project (str, optional): Case-insensitive substring of a project name.
+            fuzzy (bool): Also match names and projects similar to ``name`` and ``project``.
+
+        Returns:
+            List[Dict[str, Any]]: Matching employee records in load order.
+        """
+        with self._lock:
+            candidates = self._match({
+                "name": name,
+                "skills": skills,
+                "min_experience": min_experience,
+                "availability": availability,
+                "project": project,
+                "fuzzy": fuzzy,
+            }, {})
+            if candidates is None:
+                return self.records()
+            return [self._records[employee_id] for employee_id in sorted(candidates, key=self._order.__getitem__)]
+
+    def search_ids(
+        self,
+        name: Optional[str] = None,
+        skills: Optional[List[Union[str, List[str]]]] = None,
+        min_experience: Optional[int] = None,
+        availability: Optional[str] = None,
+        project: Optional[str] = None,
+        fuzzy: bool = False
+    ) -> Set[int]:
+        """
+        Return the ids of the employees matching all given filters.
+
+        Takes the same filters as ``search`` without building the result records.
+
+        Returns:
+            Set[int]: Matching employee ids.
+        """
+        with self._lock:
+            candidates = self._match({
+                "name": name,
+                "skills": skills,
+                "min_experience": min_experience,
+                "availability": availability,
+                "project": project,
+                "fuzzy": fuzzy,
+            }, {})
+            return set(self._records) if candidates is None else set(candidates)
+
+    def search_page(
+        self,
+        name: Optional[str] = None,
+        skills: Optional[List[Union[str, List[str]]]] = None,
+        min_experience: Optional[int] = None,
+        availability: Optional[str] = None,
+        project: Optional[str] = None,
+        fuzzy: bool = False,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[int, List[int], Optional[str]]:
+        """
+        Return one sorted page of the employees matching all given filters.
+
+        Pages are keyed on the sort key of the last employee returned, so
+        employees added or removed between requests do not shift later pages.
+
+        Args:
+            name (str, optional): Case-insensitive substring of the employee name.
+            skills (List[str], optional): Skills the employee must all have (case-insensitive);
+                an entry may be a list of alternatives, any of which matches.
+            min_experience (int, optional): Minimum years of experience.
+            availability (str, optional): Availability status (case-insensitive).
+            project (str, optional): Case-insensitive substring of a project name.
+            fuzzy (bool): Also match names and projects similar to ``name`` and ``project``.
+            sort (str, optional): ``name``, ``experience`` or ``relevance``, ``-`` prefixed for
+                descending; ``relevance`` for fuzzy searches and load order otherwise if unset.
+            limit (int, optional): Maximum employees per page; all remaining if unset.
+            cursor (str, optional): ``next_cursor`` of the previous page.
+
+        Returns:
+            Tuple[int, List[int], Optional[str]]: Total matches, employee ids of
+            the page, and the cursor of the next page (None on the last page).
+
+        Raises:
+            ValueError: If the sort order or the cursor is invalid.
+        """
+        return self.search_page_batch([{
+            "name": name,
+            "skills": skills,
+            "min_experience": min_experience,
+            "availability": availability,
+            "project": project,
+            "fuzzy": fuzzy,
+            "sort": sort,
+            "limit": limit,
+            "cursor": cursor,
+        }])[0]
+
+    def search_page_batch(self, searches: List[Dict[str, Any]]) -> List[Tuple[int, List[int], Optional[str]]]:
+        """
+        Evaluate many searches in one pass under a single lock.
+
+        Work shared between searches, such as a name lookup or the employees
+        above an experience threshold, is done once for the whole batch.
+
+        Args:
+            searches (List[Dict[str, Any]]): Keyword arguments of ``search_page`` per search.
+
+        Returns:
+            List[Tuple[int, List[int], Optional[str]]]: ``search_page`` results in input order.
+
+        Raises:
+            ValueError: If any sort order or cursor is invalid.
+        """
+        orders = []
+        for search in searches:
+            sort = resolve_sort(search)
+            field, descending = parse_sort(sort)
+            after = decode_cursor(search["cursor"], sort) if search.get("cursor") else None
+            orders.append((sort, field, descending, after))
+
+        with self._lock:
+            memo: Dict[Any, Any] = {}
+            results = []
+            for search, (sort, field, descending, after) in zip(searches, orders):
+                candidates = self._match(search, memo)
+                limit = search.get("limit")
+                if candidates is None and field != "relevance":
+                    results.append(self._page(self._sorted_keys(field), descending, limit, after, sort))
+                    continue
+
+                scores = self._relevance(search, memo) if field == "relevance" else None
+                ids = self._records if candidates is None else candidates
+                # Walking the presorted keys costs about (limit + 1) * len(self) / len(ids) steps
+                if field != "relevance" and limit is not None and (limit + 1) * len(self._records) < len(ids) ** 2:
+                    page, more = self._walk_page(self._sorted_keys(field), ids, descending, limit, after)
+                else:
+                    page, more = self._select_page((self._sort_key(field, i, scores) for i in ids), descending, limit, after)
+                next_cursor = encode_cursor(sort, page[-1]) if more and page else None
+                results.append((len(ids), [key[-1] for key in page], next_cursor))
+            return results
+
+    @staticmethod
+    def _page(
+        keys: List[Tuple[Any, ...]],
+        descending: bool,
+        limit: Optional[int],
+        after: Optional[Tuple[Any, ...]],
+        sort: Optional[str]
+    ) -> Tuple[int, List[int], Optional[str]]:
+        total = len(keys)
+        if descending:
+            end = bisect.bisect_left(keys, after) if after is not None else total
+            start = 0 if limit is None else max(0, end - limit)
+            page = keys[start:end][::-1]
+            more = start > 0
+        else:
+            start = bisect.bisect_right(keys, after) if after is not None else 0
+            end = total if limit is None else min(total, start + limit)
+            page = keys[start:end]
+            more = end < total
+
+        next_cursor = encode_cursor(sort, page[-1]) if more and page else None
+        return total, [key[-1] for key in page], next_cursor
+
+    @staticmethod
+    def _walk_page(
+        keys: List[Tuple[Any, ...]],
+        ids: Set[int],
+        descending: bool,
+        limit: int,
+        after: Optional[Tuple[Any, ...]]
+    ) -> Tuple[List[Tuple[Any, ...]], bool]:
+        # Scan all sorted keys from the cursor, keeping those of matching employees
+        if descending:
+            end = bisect.bisect_left(keys, after) if after is not None else len(keys)
+            positions = range(end - 1, -1, -1)
+        else:
+            positions = range(bisect.bisect_right(keys, after) if after is not None else 0, len(keys))
+
+        page = []
+        for position in positions:
+            if keys[position][-1] in ids:
+                page.append(keys[position])
+                if len(page) > limit:
+                    return page[:limit], True
+        return page, False
+
+    @staticmethod
+    def _select_page(
+        keys: Iterable[Tuple[Any, ...]],
+        descending: bool,
+        limit: Optional[int],
+        after: Optional[Tuple[Any, ...]]
+    ) -> Tuple[List[Tuple[Any, ...]], bool]:
+        # Only the page and one more key are ordered, not all the matches
+        if after is not None:
+            keys = (key for key in keys if (key < after if descending else key > after))
+        if limit is None:
+            return sorted(keys, reverse=descending), False
+        page = (heapq.nlargest if descending else heapq.nsmallest)(limit + 1, keys)
+        return page[:limit], len(page) > limit
+
+    def serialize(self, employee_ids: List[int], fields: Optional[List[str]] = None) -> bytes:
+        """
+        Render employees as a JSON array from their pre-serialized fragments.
+
+        Args:
+            employee_ids (List[int]): Employees to render, in order.
+            fields (List[str], optional): Fields to include; all of EMPLOYEE_FIELDS if unset.
+
+        Returns:
+            bytes: UTF-8 JSON array.
+        """
+        with self._lock:
+            if not fields:
+                items = [self._serialized[employee_id] for employee_id in employee_ids]
+            else:
+                items = [
+                    b"{" + b",".join(self._fragments[employee_id][field] for field in fields) + b"}"
+                    for employee_id in employee_ids
+                ]
+        return b"[" + b",".join(items) + b"]"
+
+    def _serialize(self, emp: Dict[str, Any]) -> None:
+        fragments = {
+            field: json.dumps(field).encode("utf-8") + b":" + json.dumps(emp[field], ensure_ascii=False).encode("utf-8")
+            for field in EMPLOYEE_FIELDS
+        }
+        self._fragments[emp["id"]] = fragments
+        self._serialized[emp["id"]] = b"{" + b",".join(fragments.values()) + b"}"
+
+    def _sort_key(
+        self,
+        field: Optional[str],
+        employee_id: int,
+        scores: Optional[Dict[int, float]] = None
+    ) -> Tuple[Any, ...]:
+        # The load position breaks ties and the id comes last so a page maps back to employees
+        order = self._order[employee_id]
+        if field == "name":
+            return (self._names[employee_id], order, employee_id)
+        if field == "experience":
+            return (self._experience_by_id[employee_id], order, employee_id)
+        if field == "relevance":
+            # Negated so the best match sorts first in ascending order
+            return (-(scores or {}).get(employee_id, 0.0), order, employee_id)
+        return (order, employee_id)
+
+    def _sorted_keys(self, field: Optional[str]) -> List[Tuple[Any, ...]]:
+        keys = self._sorted.get(field)
+        if keys is None:
+            keys = sorted(self._sort_key(field, employee_id) for employee_id in self._records)
+            self._sorted[field] = keys
+        return keys
+
+    def _match(self, search: Dict[str, Any], memo: Dict[Any, Any]) -> Optional[Set[int]]:
+        # Sets in memo are shared between searches, so they are never mutated
+        name = search.get("name")
+        skills = search.get("skills")
+        min_experience = search.get("min_experience")
+        availability = search.get("availability")
+        project = search.get("project")
+        fuzzy = bool(search.get("fuzzy"))
+        candidates: Optional[Set[int]] = None
+
+        if skills:
+            postings = sorted((self._skill_posting(skill) for skill in skills), key=len)
+            # Posting sets are never mutated here; intersections build new sets
+            candidates = postings[0]
+            for posting in postings[1:]:
+                candidates = candidates & posting
+
+        if availability:
+            posting = self._availability.get(availability.lower(), set())
+            candidates = posting if candidates is None else candidates & posting
+
+        if min_experience is not None:
+            start = bisect.bisect_left(self._experience, (min_experience,))
+            key = ("experience", min_experience)
+            if candidates is not None and len(candidates) < len(self._experience) - start:
+                experience = self._experience_by_id
+                candidates = {
+                    employee_id for employee_id in candidates
+                    if experience[employee_id] >= min_experience
+                }
+            else:
+                if key not in memo:
+                    memo[key] = {employee_id for _, employee_id in self._experience[start:]}
+                candidates = memo[key] if candidates is None else candidates & memo[key]
+
+        for field, text in (("name", name), ("project", project)):
+            if text:
+                matches = self._text_matches(field, text, fuzzy, memo)
+                candidates = set(matches) if candidates is None else candidates & matches.keys()
+
+        return candidates
+
+    def _skill_posting(self, skill: Union[str, List[str]]) -> Set[int]:
+        if isinstance(skill, str):
+            return self._skills.get(skill.strip().lower(), set())
+        # Alternatives, such as a skill and its synonyms, match any of their postings
+        return set().union(*(self._skills.get(alternative.strip().lower(), ()) for alternative in skill))
+
+    def _text_matches(self, field: str, text: str, fuzzy: bool, memo: Dict[Any, Any]) -> Dict[int, float]:
+        key = (field, text.lower(), fuzzy)
+        if key not in memo:
+            if field == "project" and not self.index_projects:
+                needle = text.lower()
+                memo[key] = {
+                    employee_id: 1.0 for employee_id, emp in self._records.items()
+                    if any(needle in project.lower() for project in emp["projects"])
+                }
+            else:
+                index = self._name_index if field == "name" else self._project_index
+                if fuzzy:
+                    memo[key] = index.lookup(text, self.fuzzy_threshold)
+                else:
+                    memo[key] = dict.fromkeys(index.contains(text), 1.0)
+        return memo[key]
+
+    def _relevance(self, search: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        fuzzy = bool(search.get("fuzzy"))
+        for field in ("name", "project"):
+            if search.get(field):
+                for employee_id, score in self._text_matches(field, search[field], fuzzy, memo).items():
+                    scores[employee_id] = scores.get(employee_id, 0.0) + score
+        return scores
+
+    def _unindex(self, emp: Dict[str, Any]) -> None:
+        employee_id = emp["id"]
+        for skill in emp["skills"]:
+            posting = self._skills.get(skill.lower())
+            if posting is not None:
+                posting.discard(employee_id)
+                if not posting:
+                    del self._skills[skill.lower()]
+                    self._skill_names.pop(skill.lower(), None)
+
+        posting = self._availability.get(emp["availability"].lower())
+        if posting is not None:
+            posting.discard(employee_id)
+            if not posting:
+                del self._availability[emp["availability"].lower()]
+
+        key = (emp["experience_years"], employee_id)
+        position = bisect.bisect_left(self._experience, key)
+        if position < len(self._experience) and self._experience[position] == key:
+            del self._experience[position]
+
+        self._names.pop(employee_id, None)
+        self._name_index.remove(employee_id)
+        self._project_index.remove(employee_id)
+        self._experience_by_id.pop(employee_id, None)
@@ -0,0 +1,175 @@
+"""
+Session service module for the Employee Search RAG application.
+
+This module handles server-side chat sessions: the conversation, the employees
+retrieved for the last answer, which follow-up questions are narrowed to, and
+the Ollama context tokens that let the next turn continue the conversation
+without evaluating the previous turns again.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class ChatSession:
+    """
+    State of one multi-turn conversation.
+
+    ``employee_ids`` are the employees retrieved for the last answer and
+    ``sent_employee_ids`` those whose documents are already part of
+    ``ollama_context``, the token state Ollama returned after the last turn.
+    ``lock`` serializes the turns of a session so each continues the
+    context of the one before.
+    """
+
+    def __init__(self, session_id: str, max_turns: int = settings.SESSION_MAX_TURNS):
+        self.session_id = session_id
+        self.max_turns = max_turns
+        self.created = time.time()
+        self.updated = time.monotonic()
+        self.turns: List[Dict[str, Any]] = []
+        self.employee_ids: List[int] = []
+        self.sent_employee_ids: set = set()
+        self.ollama_context: Optional[List[int]] = None
+        self.lock = asyncio.Lock()
+
+    def record_turn(
+        self,
+        query: str,
+        response: str,
+        employee_ids: List[int],
+        ollama_context: Optional[List[int]] = None,
+        continued: bool = False
+    ) -> None:
+        """
+        Add a completed turn to the session.
+
+        Args:
+            query (str): User question.
+            response (str): Generated answer.
+            employee_ids (List[int]): Employees retrieved for the answer.
+            ollama_context (List[int], optional): Context tokens Ollama returned, if any.
+            continued (bool): Whether the turn was generated on top of the previous context.
+        """
+        self.turns.append({"query": query, "response": response, "employee_ids": employee_ids})
+        del self.turns[:-self.max_turns]
+        self.employee_ids = employee_ids
+        if not ollama_context:
+            self.sent_employee_ids = set()
+        elif continued:
+            self.sent_employee_ids.update(employee_ids)
+        else:
+            self.sent_employee_ids = set(employee_ids)
+        self.ollama_context = ollama_context or None
+        self.updated = time.monotonic()
+
+    def history(self, turns: int = 3) -> str:
+        """
+        Format the last turns as plain text for prompts that cannot reuse Ollama context.
+
+        Args:
+            turns (int): Number of turns to include.
+
+        Returns:
+            str: ``Question: ...\\nAnswer: ...`` blocks, oldest first.
+        """
+        return "\n\n".join(
+            f"Question: {turn['query']}\nAnswer: {turn['response']}" for turn in self.turns[-turns:]
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Describe the session for the API."""
+        return {
+            "session_id": self.session_id,
+            "created": self.created,
+            "turns": self.turns,
+            "employee_ids": self.employee_ids,
+            "context_tokens": len(self.ollama_context or []),
+        }
+
+class SessionStore:
+    """
+    Bounded in-memory store of chat sessions.
+
+    Sessions expire ``ttl`` seconds after their last turn and the least
+    recently used session is evicted once ``max_entries`` is reached.
+    """
+
+    def __init__(self, max_entries: int = settings.SESSION_MAX_ENTRIES, ttl: float = settings.SESSION_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Optional[ChatSession]:
+        """
+        Return a live session.
+
+        Args:
+            session_id (str): Session identifier.
+
+        Returns:
+            Optional[ChatSession]: The session, or None if unknown or expired.
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            if time.monotonic() - session.updated > self.ttl:
+                del self._sessions[session_id]
+                return None
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def get_or_create(self, session_id: str) -> ChatSession:
+        """
+        Return a live session, starting a new one if needed.
+
+        Args:
+            session_id (str): Session identifier chosen by the client.
+
+        Returns:
+            ChatSession: The session.
+        """
+        session = self.get(session_id)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                self._purge()
+                session = ChatSession(session_id)
+                self._sessions[session_id] = session
+            return session
+
+    def delete(self, session_id: str) -> bool:
+        """
+        End a session.
+
+        Args:
+            session_id (str): Session identifier.
+
+        Returns:
+            bool: True if the session existed.
+        """
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, session in self._sessions.items() if now - session.updated > self.ttl]
+        for key in expired:
+            del self._sessions[key]
+        while len(self._sessions) >= self.max_entries:
+            self._sessions.popitem(last=False)
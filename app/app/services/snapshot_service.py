@@ -0,0 +1,601 @@
+"""
+Snapshot service module for the Employee Search RAG application.
+
+This module handles the compact read-only employee snapshot shared by worker
+processes. The employee table is written once, next to the vector store, as
+columnar NumPy arrays and byte blobs; every worker memory-maps the same
+files, so the pages are shared through the OS page cache instead of being
+parsed into per-process dictionaries.
+"""
+
+import json
+import logging
+import mmap
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.search_service import (
+    EMPLOYEE_FIELDS, EmployeeSearchIndex, decode_cursor, encode_cursor, parse_sort, resolve_sort
+)
+from app.services.trigram_index import TrigramIndex
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the snapshot layout changes, so that persisted snapshots are rebuilt
+SNAPSHOT_VERSION = "1"
+SNAPSHOT_PREFIX = "employees"
+SNAPSHOT_ARRAYS = (
+    "ids", "sorted_ids", "id_order", "experience", "experience_order", "experience_rank",
+    "availability", "skills", "skill_offsets", "skill_rows", "skill_row_offsets",
+    "projects", "project_offsets", "name_offsets", "name_order", "name_rank",
+    "project_name_offsets", "record_offsets", "field_spans",
+)
+SNAPSHOT_BLOBS = ("names", "project_names", "records")
+# Lowercase names are joined with a separator that cannot occur in a search needle
+NAME_SEPARATOR = b"\n"
+
+def snapshot_file(path: str, name: str) -> str:
+    """Return the path of one snapshot column or blob."""
+    extension = "npy" if name in SNAPSHOT_ARRAYS else "bin"
+    return os.path.join(path, f"{SNAPSHOT_PREFIX}.{name}.{extension}")
+
+def write_snapshot(employees: Iterable[Dict[str, Any]], path: str = settings.VECTOR_STORE_PATH) -> int:
+    """
+    Write the columnar employee snapshot.
+
+    Every file is written to a temporary name and then renamed over the old
+    one, so workers that still map the previous snapshot keep reading
+    consistent data.
+
+    Args:
+        employees (Iterable[Dict[str, Any]]): Validated employee records, in load order.
+        path (str): Directory of the persisted vector store.
+
+    Returns:
+        int: Number of employees written.
+    """
+    ids: List[int] = []
+    experience: List[int] = []
+    availability: List[int] = []
+    availability_codes: Dict[str, int] = {}
+    skills: List[int] = []
+    skill_offsets = [0]
+    skill_codes: Dict[str, int] = {}
+    skill_names: List[str] = []
+    projects: List[int] = []
+    project_offsets = [0]
+    project_codes: Dict[str, int] = {}
+    names: List[bytes] = []
+    records: List[bytes] = []
+    field_spans: List[List[Tuple[int, int]]] = []
+
+    for emp in employees:
+        ids.append(emp["id"])
+        experience.append(emp["experience_years"])
+        availability.append(availability_codes.setdefault(emp["availability"].lower(), len(availability_codes)))
+        for skill in emp["skills"]:
+            code = skill_codes.setdefault(skill.lower(), len(skill_codes))
+            if code == len(skill_names):
+                skill_names.append(skill)
+            skills.append(code)
+        skill_offsets.append(len(skills))
+        for project in emp["projects"]:
+            projects.append(project_codes.setdefault(project, len(project_codes)))
+        project_offsets.append(len(projects))
+        names.append(emp["name"].lower().replace("\n", " ").encode("utf-8"))
+
+        # Same fragments as EmployeeSearchIndex, with their spans kept for projections
+        fragments = [
+            json.dumps(field).encode("utf-8") + b":" + json.dumps(emp[field], ensure_ascii=False).encode("utf-8")
+            for field in EMPLOYEE_FIELDS
+        ]
+        spans, start = [], 1
+        for fragment in fragments:
+            spans.append((start, start + len(fragment)))
+            start += len(fragment) + 1
+        field_spans.append(spans)
+        records.append(b"{" + b",".join(fragments) + b"}")
+
+    count = len(ids)
+    columns: Dict[str, np.ndarray] = {}
+    columns["ids"] = np.asarray(ids, dtype=np.int64)
+    columns["id_order"] = np.argsort(columns["ids"], kind="stable")
+    columns["sorted_ids"] = columns["ids"][columns["id_order"]]
+    columns["experience"] = np.asarray(experience, dtype=np.int64)
+    # Ties are broken by load position, as in EmployeeSearchIndex sort keys
+    columns["experience_order"] = np.argsort(columns["experience"], kind="stable")
+    columns["experience_rank"] = inverse_permutation(columns["experience_order"])
+    columns["availability"] = np.asarray(availability, dtype=np.int32)
+    columns["skills"] = np.asarray(skills, dtype=np.int32)
+    columns["skill_offsets"] = np.asarray(skill_offsets, dtype=np.int64)
+    columns["projects"] = np.asarray(projects, dtype=np.int32)
+    columns["project_offsets"] = np.asarray(project_offsets, dtype=np.int64)
+    columns["name_order"] = np.asarray(sorted(range(count), key=names.__getitem__), dtype=np.int64)
+    columns["name_rank"] = inverse_permutation(columns["name_order"])
+    columns["name_offsets"] = blob_offsets(names, len(NAME_SEPARATOR))
+    columns["record_offsets"] = blob_offsets(records)
+    columns["field_spans"] = np.asarray(field_spans, dtype=np.int32).reshape(count, len(EMPLOYEE_FIELDS), 2)
+
+    # Rows of each skill, so skill filters intersect sorted postings
+    entry_rows = np.repeat(np.arange(count, dtype=np.int64), np.diff(columns["skill_offsets"]))
+    by_skill = np.lexsort((entry_rows, columns["skills"]))
+    columns["skill_rows"] = entry_rows[by_skill]
+    columns["skill_row_offsets"] = np.searchsorted(
+        columns["skills"][by_skill], np.arange(len(skill_codes) + 1), side="left"
+    ).astype(np.int64)
+
+    project_names = [project.lower().replace("\n", " ").encode("utf-8") for project in project_codes]
+    columns["project_name_offsets"] = blob_offsets(project_names, len(NAME_SEPARATOR))
+
+    blobs = {
+        "names": NAME_SEPARATOR.join(names) + NAME_SEPARATOR,
+        "project_names": NAME_SEPARATOR.join(project_names) + NAME_SEPARATOR,
+        "records": b"".join(records),
+    }
+
+    os.makedirs(path, exist_ok=True)
+    for name, column in columns.items():
+        target = snapshot_file(path, name)
+        with open(f"{target}.tmp", "wb") as f:
+            np.save(f, column)
+        os.replace(f"{target}.tmp", target)
+    for name, blob in blobs.items():
+        target = snapshot_file(path, name)
+        with open(f"{target}.tmp", "wb") as f:
+            f.write(blob)
+        os.replace(f"{target}.tmp", target)
+
+    meta_path = os.path.join(path, f"{SNAPSHOT_PREFIX}.meta.json")
+    with open(f"{meta_path}.tmp", "w") as f:
+        json.dump({
+            "version": SNAPSHOT_VERSION,
+            "count": count,
+            "availability": list(availability_codes),
+            "skills": skill_names,
+            "projects": len(project_codes),
+        }, f)
+    os.replace(f"{meta_path}.tmp", meta_path)
+
+    logger.info(f"Wrote employee snapshot of {count} employees to {path}")
+    return count
+
+def inverse_permutation(order: np.ndarray) -> np.ndarray:
+    """Return the position of every row in a sort order."""
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order), dtype=order.dtype)
+    return rank
+
+def blob_offsets(items: Sequence[bytes], separator: int = 0) -> np.ndarray:
+    """Return the start offsets of byte strings joined with a separator, plus the end."""
+    lengths = np.fromiter((len(item) + separator for item in items), dtype=np.int64, count=len(items))
+    return np.concatenate(([0], np.cumsum(lengths)))
+
+def map_blob(file_path: str) -> bytes:
+    """Memory-map a blob read-only; empty files cannot be mapped and read as b""."""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+class EmployeeSnapshot:
+    """
+    Read-only, memory-mapped columnar employee table.
+
+    Rows are employees in load order. Scalar fields are NumPy columns,
+    skills and projects are offset-indexed code arrays, and names, project
+    names and the serialized JSON records are byte blobs. Nothing is copied
+    into the process when the snapshot is opened.
+    """
+
+    def __init__(self, path: str, meta: Dict[str, Any], columns: Dict[str, np.ndarray], blobs: Dict[str, bytes]):
+        self.path = path
+        self.meta = meta
+        self.columns = columns
+        self.blobs = blobs
+        self.skill_codes = {skill.lower(): code for code, skill in enumerate(meta["skills"])}
+        self.availability_codes = {value: code for code, value in enumerate(meta["availability"])}
+
+    @classmethod
+    def open(cls, path: str = settings.VECTOR_STORE_PATH) -> "EmployeeSnapshot":
+        """
+        Memory-map a snapshot written by ``write_snapshot``.
+
+        Args:
+            path (str): Directory of the persisted vector store.
+
+        Returns:
+            EmployeeSnapshot: The mapped snapshot.
+
+        Raises:
+            FileNotFoundError: If the snapshot is missing.
+            ValueError: If it was written with another snapshot layout.
+        """
+        with open(os.path.join(path, f"{SNAPSHOT_PREFIX}.meta.json"), "r") as f:
+            meta = json.load(f)
+        if meta.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Employee snapshot version {meta.get('version')} is not {SNAPSHOT_VERSION}")
+
+        columns = {name: np.load(snapshot_file(path, name), mmap_mode="r") for name in SNAPSHOT_ARRAYS}
+        blobs = {name: map_blob(snapshot_file(path, name)) for name in SNAPSHOT_BLOBS}
+        return cls(path, meta, columns, blobs)
+
+    def __len__(self) -> int:
+        return self.meta["count"]
+
+    def row_of(self, employee_id: int) -> Optional[int]:
+        """
+        Find the row of an employee.
+
+        Args:
+            employee_id (int): Employee identifier.
+
+        Returns:
+            Optional[int]: Row index, or None if the employee is not in the snapshot.
+        """
+        sorted_ids = self.columns["sorted_ids"]
+        position = int(np.searchsorted(sorted_ids, employee_id))
+        if position < len(sorted_ids) and sorted_ids[position] == employee_id:
+            return int(self.columns["id_order"][position])
+        return None
+
+    def serialized(self, row: int) -> bytes:
+        """Return the JSON object of a row."""
+        offsets = self.columns["record_offsets"]
+        return self.blobs["records"][offsets[row]:offsets[row + 1]]
+
+    def projected(self, row: int, fields: List[str]) -> bytes:
+        """Return a JSON object with only ``fields`` of a row."""
+        record = self.serialized(row)
+        spans = self.columns["field_spans"][row]
+        return b"{" + b",".join(
+            record[spans[EMPLOYEE_FIELDS.index(field)][0]:spans[EMPLOYEE_FIELDS.index(field)][1]]
+            for field in fields
+        ) + b"}"
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Decode the employee record of a row."""
+        return json.loads(self.serialized(row))
+
+    def name(self, row: int) -> str:
+        """Return the lowercase name of a row."""
+        offsets = self.columns["name_offsets"]
+        return self.blobs["names"][offsets[row]:offsets[row + 1] - len(NAME_SEPARATOR)].decode("utf-8")
+
+    def project_name(self, code: int) -> str:
+        """Return the lowercase project name of a project code."""
+        offsets = self.columns["project_name_offsets"]
+        return self.blobs["project_names"][offsets[code]:offsets[code + 1] - len(NAME_SEPARATOR)].decode("utf-8")
+
+    def find(self, blob: str, needle: str) -> np.ndarray:
+        """
+        Find the entries of a name blob containing a substring.
+
+        Args:
+            blob (str): ``names`` or ``project_names``.
+            needle (str): Case-insensitive substring.
+
+        Returns:
+            np.ndarray: Sorted row indexes (names) or project codes (project names).
+        """
+        needle_bytes = needle.lower().encode("utf-8")
+        data = self.blobs[blob]
+        offsets = self.columns["name_offsets" if blob == "names" else "project_name_offsets"]
+        if NAME_SEPARATOR in needle_bytes or not data:
+            return np.empty(0, dtype=np.int64)
+
+        entries = []
+        position = data.find(needle_bytes)
+        while position != -1:
+            entry = int(np.searchsorted(offsets, position, side="right")) - 1
+            entries.append(entry)
+            # One hit per entry is enough, continue with the next entry
+            position = data.find(needle_bytes, int(offsets[entry + 1]))
+        return np.asarray(entries, dtype=np.int64)
+
+class SnapshotSearchIndex(EmployeeSearchIndex):
+    """
+    EmployeeSearchIndex served from a shared EmployeeSnapshot.
+
+    Filters are evaluated on the snapshot's columns and pages are sorted
+    with its precomputed orders, so a worker keeps no per-employee Python
+    objects. Name and project substrings are found by scanning the mapped
+    name blobs; fuzzy lookups build a trigram index on first use. Cursors
+    are interchangeable with EmployeeSearchIndex ones.
+
+    The first write copies the snapshot into the regular in-memory index,
+    which serves all later requests of this process.
+    """
+
+    def __init__(
+        self,
+        snapshot: EmployeeSnapshot,
+        fuzzy_threshold: float = settings.NAME_FUZZY_THRESHOLD,
+        index_projects: bool = settings.NAME_INDEX_PROJECTS
+    ):
+        super().__init__(None, fuzzy_threshold, index_projects)
+        self.snapshot: Optional[EmployeeSnapshot] = snapshot
+        self._fuzzy_names: Optional[TrigramIndex] = None
+        self._fuzzy_projects: Optional[TrigramIndex] = None
+        self._fuzzy_lock = threading.Lock()
+        logger.info(f"Serving search from the employee snapshot of {len(snapshot)} employees")
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self.snapshot is None:
+                return super().__len__()
+            return len(self.snapshot)
+
+    def get(self, employee_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self.snapshot is None:
+                return super().get(employee_id)
+            row = self.snapshot.row_of(employee_id)
+            return None if row is None else self.snapshot.record(row)
+
+    def records(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            if self.snapshot is None:
+                return super().records()
+            return [self.snapshot.record(row) for row in range(len(self.snapshot))]
+
+    def skill_vocabulary(self) -> List[str]:
+        with self._lock:
+            if self.snapshot is None:
+                return super().skill_vocabulary()
+            return list(self.snapshot.meta["skills"])
+
+    def availability_values(self) -> List[str]:
+        with self._lock:
+            if self.snapshot is None:
+                return super().availability_values()
+            return list(self.snapshot.meta["availability"])
+
+    def upsert(self, emp: Dict[str, Any]) -> None:
+        with self._lock:
+            self._materialize()
+            super().upsert(emp)
+
+    def delete(self, employee_id: int) -> None:
+        with self._lock:
+            self._materialize()
+            super().delete(employee_id)
+
+    def search(self, **filters: Any) -> List[Dict[str, Any]]:
+        with self._lock:
+            if self.snapshot is None:
+                return super().search(**filters)
+            rows = self._match_rows(filters, {})
+            return [self.snapshot.record(int(row)) for row in (range(len(self.snapshot)) if rows is None else rows)]
+
+    def search_ids(self, **filters: Any) -> Set[int]:
+        with self._lock:
+            if self.snapshot is None:
+                return super().search_ids(**filters)
+            rows = self._match_rows(filters, {})
+            ids = self.snapshot.columns["ids"]
+            return set((ids if rows is None else ids[rows]).tolist())
+
+    def search_page_batch(self, searches: List[Dict[str, Any]]) -> List[Tuple[int, List[int], Optional[str]]]:
+        orders = []
+        for search in searches:
+            sort = resolve_sort(search)
+            field, descending = parse_sort(sort)
+            after = decode_cursor(search["cursor"], sort) if search.get("cursor") else None
+            orders.append((sort, field, descending, after))
+
+        with self._lock:
+            if self.snapshot is None:
+                return super().search_page_batch(searches)
+            return self._snapshot_pages(searches, orders)
+
+    def serialize(self, employee_ids: List[int], fields: Optional[List[str]] = None) -> bytes:
+        with self._lock:
+            snapshot = self.snapshot
+            if snapshot is None:
+                return super().serialize(employee_ids, fields)
+            rows = [snapshot.row_of(employee_id) for employee_id in employee_ids]
+            if not fields:
+                items = [snapshot.serialized(row) for row in rows]
+            else:
+                items = [snapshot.projected(row, fields) for row in rows]
+        return b"[" + b",".join(items) + b"]"
+
+    def _snapshot_pages(
+        self,
+        searches: List[Dict[str, Any]],
+        orders: List[Tuple[Optional[str], Optional[str], bool, Optional[Tuple[Any, ...]]]]
+    ) -> List[Tuple[int, List[int], Optional[str]]]:
+        snapshot = self.snapshot
+        memo: Dict[Any, Any] = {}
+        results = []
+        for search, (sort, field, descending, after) in zip(searches, orders):
+            rows = self._match_rows(search, memo)
+
+            if field == "relevance":
+                scores = self._relevance_rows(search, memo)
+                ids = snapshot.columns["ids"]
+                matched = range(len(snapshot)) if rows is None else rows
+                page, more = self._select_page(
+                    ((-scores.get(int(row), 0.0), int(row), int(ids[row])) for row in matched),
+                    descending, search.get("limit"), after
+                )
+                next_cursor = encode_cursor(sort, page[-1]) if more and page else None
+                results.append((len(matched), [key[-1] for key in page], next_cursor))
+            else:
+                results.append(self._page_rows(rows, field, descending, search.get("limit"), after, sort))
+        return results
+
+    def _materialize(self) -> None:
+        if self.snapshot is None:
+            return
+        logger.info("Copying the employee snapshot into a writable search index")
+        for row in range(len(self.snapshot)):
+            super().upsert(self.snapshot.record(row))
+        self.snapshot = None
+        self._fuzzy_names = self._fuzzy_projects = None
+
+    def _row_key(self, field: Optional[str], row: int) -> Tuple[Any, ...]:
+        # Same keys as EmployeeSearchIndex._sort_key; the load position is the row
+        employee_id = int(self.snapshot.columns["ids"][row])
+        if field == "name":
+            return (self.snapshot.name(row), row, employee_id)
+        if field == "experience":
+            return (int(self.snapshot.columns["experience"][row]), row, employee_id)
+        return (row, employee_id)
+
+    def _page_rows(
+        self,
+        rows: Optional[np.ndarray],
+        field: Optional[str],
+        descending: bool,
+        limit: Optional[int],
+        after: Optional[Tuple[Any, ...]],
+        sort: Optional[str]
+    ) -> Tuple[int, List[int], Optional[str]]:
+        columns = self.snapshot.columns
+        if rows is None:
+            ordered = range(len(self.snapshot)) if field is None else columns[f"{field}_order"]
+        elif field is None:
+            ordered = rows
+        else:
+            ordered = rows[np.argsort(columns[f"{field}_rank"][rows], kind="stable")]
+
+        total = len(ordered)
+        if descending:
+            end = self._bisect(ordered, field, after, right=False) if after is not None else total
+            start = 0 if limit is None else max(0, end - limit)
+            page = ordered[start:end][::-1]
+            more = start > 0
+        else:
+            start = self._bisect(ordered, field, after, right=True) if after is not None else 0
+            end = total if limit is None else min(total, start + limit)
+            page = ordered[start:end]
+            more = end < total
+
+        page = np.asarray(page, dtype=np.int64)
+        next_cursor = encode_cursor(sort, self._row_key(field, int(page[-1]))) if more and len(page) else None
+        return total, columns["ids"][page].tolist(), next_cursor
+
+    def _bisect(self, ordered: Sequence[int], field: Optional[str], after: Tuple[Any, ...], right: bool) -> int:
+        # Cursors hold sort keys, so positions are found by comparing keys, not rows
+        low, high = 0, len(ordered)
+        while low < high:
+            middle = (low + high) // 2
+            key = self._row_key(field, int(ordered[middle]))
+            if key < after or (right and key == after):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _match_rows(self, search: Dict[str, Any], memo: Dict[Any, Any]) -> Optional[np.ndarray]:
+        columns = self.snapshot.columns
+        candidates: Optional[np.ndarray] = None
+
+        if search.get("skills"):
+            offsets = columns["skill_row_offsets"]
+            for skill in search["skills"]:
+                # A list entry holds alternatives, such as a skill and its synonyms
+                codes = [
+                    code for code in (
+                        self.snapshot.skill_codes.get(alternative.strip().lower())
+                        for alternative in ([skill] if isinstance(skill, str) else skill)
+                    )
+                    if code is not None
+                ]
+                postings = [np.asarray(columns["skill_rows"][offsets[code]:offsets[code + 1]]) for code in codes]
+                if not postings:
+                    posting = np.empty(0, dtype=np.int64)
+                elif len(postings) == 1:
+                    posting = postings[0]
+                else:
+                    posting = np.unique(np.concatenate(postings))
+                candidates = posting if candidates is None else np.intersect1d(candidates, posting, assume_unique=True)
+
+        if search.get("availability"):
+            value = search["availability"].lower()
+            key = ("availability", value)
+            if key not in memo:
+                code = self.snapshot.availability_codes.get(value)
+                memo[key] = (
+                    np.empty(0, dtype=np.int64) if code is None
+                    else np.flatnonzero(columns["availability"] == code)
+                )
+            candidates = memo[key] if candidates is None else np.intersect1d(candidates, memo[key], assume_unique=True)
+
+        if search.get("min_experience") is not None:
+            min_experience = search["min_experience"]
+            if candidates is not None:
+                candidates = candidates[columns["experience"][candidates] >= min_experience]
+            else:
+                key = ("experience", min_experience)
+                if key not in memo:
+                    memo[key] = np.flatnonzero(columns["experience"] >= min_experience)
+                candidates = memo[key]
+
+        fuzzy = bool(search.get("fuzzy"))
+        for field in ("name", "project"):
+            if search.get(field):
+                matches = self._text_rows(field, search[field], fuzzy, memo)
+                rows = np.fromiter(sorted(matches), dtype=np.int64, count=len(matches))
+                candidates = rows if candidates is None else np.intersect1d(candidates, rows, assume_unique=True)
+
+        return candidates
+
+    def _text_rows(self, field: str, text: str, fuzzy: bool, memo: Dict[Any, Any]) -> Dict[int, float]:
+        key = ("rows", field, text.lower(), fuzzy)
+        if key in memo:
+            return memo[key]
+
+        snapshot = self.snapshot
+        if field == "name":
+            scores = dict.fromkeys(snapshot.find("names", text).tolist(), 1.0)
+            if fuzzy:
+                for row, score in self._fuzzy_index("name").fuzzy(text, self.fuzzy_threshold):
+                    scores.setdefault(row, score)
+        else:
+            codes = dict.fromkeys(snapshot.find("project_names", text).tolist(), 1.0)
+            if fuzzy:
+                for code, score in self._fuzzy_index("project").fuzzy(text, self.fuzzy_threshold):
+                    codes.setdefault(code, score)
+            scores = {}
+            if codes:
+                columns = snapshot.columns
+                entries = np.flatnonzero(np.isin(columns["projects"], np.fromiter(codes, dtype=np.int32)))
+                entry_rows = np.searchsorted(columns["project_offsets"], entries, side="right") - 1
+                for row, code in zip(entry_rows.tolist(), columns["projects"][entries].tolist()):
+                    if codes[code] > scores.get(row, 0.0):
+                        scores[row] = codes[code]
+
+        memo[key] = scores
+        return scores
+
+    def _relevance_rows(self, search: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        fuzzy = bool(search.get("fuzzy"))
+        for field in ("name", "project"):
+            if search.get(field):
+                for row, score in self._text_rows(field, search[field], fuzzy, memo).items():
+                    scores[row] = scores.get(row, 0.0) + score
+        return scores
+
+    def _fuzzy_index(self, field: str) -> TrigramIndex:
+        # Built per process on the first fuzzy search, keyed by row or project code
+        with self._fuzzy_lock:
+            if field == "name":
+                if self._fuzzy_names is None:
+                    index = TrigramIndex()
+                    for row in range(len(self.snapshot)):
+                        index.add(row, [self.snapshot.name(row)])
+                    self._fuzzy_names = index
+                return self._fuzzy_names
+            if self._fuzzy_projects is None:
+                index = TrigramIndex()
+                for code in range(self.snapshot.meta["projects"]):
+                    index.add(code, [self.snapshot.project_name(code)])
+                self._fuzzy_projects = index
+            return self._fuzzy_projects
@@ -0,0 +1,265 @@
+"""
+Synonym service module for the Employee Search RAG application.
+
+This module handles skill synonyms for structured search: the distinct skill
+vocabulary is embedded once into a NumPy matrix, a nearest-neighbour synonym
+table is precomputed from it, and manual overrides add abbreviations ("ML",
+"k8s") or remove false friends ("Java" and "JavaScript").
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.core.config import settings
+from app.services.data_service import resolve_data_path
+from app.services.embedding_cache import CachedEmbeddings
+
+logger = logging.getLogger(__name__)
+
+def load_synonym_overrides(path: str = settings.SKILL_SYNONYMS_PATH) -> Dict[str, Any]:
+    """
+    Load the manual synonym overrides.
+
+    The file is JSON with two optional lists: ``groups``, lists of terms that
+    are all synonyms of each other, and ``exclude``, pairs of skills that
+    must never be treated as synonyms.
+
+    Args:
+        path (str): Path of the overrides file, relative to the application root.
+
+    Returns:
+        Dict[str, Any]: ``groups`` and ``exclude``, empty if no path is set or the file does not exist.
+
+    Raises:
+        ValueError: If the file is not valid JSON.
+    """
+    if not path:
+        return {"groups": [], "exclude": []}
+    full_path = resolve_data_path(path)
+    if not os.path.exists(full_path):
+        logger.warning(f"Skill synonym overrides not found at {full_path}, using embedding synonyms only")
+        return {"groups": [], "exclude": []}
+    try:
+        with open(full_path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+    except ValueError as e:
+        logger.error(f"Invalid skill synonym overrides in {full_path}: {str(e)}")
+        raise
+    return {"groups": overrides.get("groups", []), "exclude": overrides.get("exclude", [])}
+
+class SkillSynonyms:
+    """
+    Precomputed synonyms of the skill vocabulary.
+
+    Every skill is embedded once. The rows of the normalized matrix are
+    compared with one matrix product per block of skills, and each skill
+    keeps its ``max_synonyms`` nearest skills above ``threshold``. Expanding
+    a vocabulary skill or an override term is a dictionary lookup. Other
+    terms are embedded on first use, matched with one matrix product against
+    the vocabulary and remembered in a small LRU. Embeddings bypass the
+    persistent embedding cache, which requests could otherwise grow without
+    bound.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Iterable[str],
+        embeddings: Embeddings,
+        threshold: float = settings.SKILL_SYNONYM_THRESHOLD,
+        max_synonyms: int = settings.SKILL_SYNONYM_MAX,
+        overrides: Optional[Dict[str, Any]] = None,
+        max_unknown: int = 1024
+    ):
+        # Skills come from requests too and must not grow the persistent document cache
+        if isinstance(embeddings, CachedEmbeddings):
+            embeddings = embeddings.embeddings
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_synonyms = max_synonyms
+        self.max_unknown = max_unknown
+        self._lock = threading.Lock()
+        self._vocabulary: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._neighbours: Dict[str, List[Tuple[str, float]]] = {}
+        self._unknown: "OrderedDict[str, List[str]]" = OrderedDict()
+
+        overrides = overrides if overrides is not None else load_synonym_overrides()
+        self._groups: Dict[str, Set[str]] = {}
+        for group in overrides["groups"]:
+            for term in group:
+                self._groups.setdefault(term.lower(), set()).update(other for other in group if other.lower() != term.lower())
+        self._excluded: Set[Tuple[str, str]] = set()
+        for first, second in overrides["exclude"]:
+            self._excluded.add((first.lower(), second.lower()))
+            self._excluded.add((second.lower(), first.lower()))
+
+        self.extend(vocabulary)
+
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+
+    def extend(self, skills: Iterable[str]) -> None:
+        """
+        Add new skills to the vocabulary and update the synonym table.
+
+        Only the new skills are embedded; their similarities to the whole
+        vocabulary are computed with one matrix product.
+
+        Args:
+            skills (Iterable[str]): Skills, typically of new or updated employees.
+        """
+        with self._lock:
+            new = list({skill.lower(): skill for skill in skills if skill and skill.lower() not in self._codes}.values())
+            if not new:
+                return
+
+            vectors = self._normalize(self.embeddings.embed_documents(new))
+            for skill in new:
+                self._codes[skill.lower()] = len(self._codes)
+            matrix = vectors if not len(self._vocabulary) else np.vstack([self._matrix, vectors])
+            first = len(self._vocabulary)
+            self._vocabulary.extend(new)
+            self._matrix = matrix
+
+            # Similarities of the new rows to every row, in blocks to bound memory
+            for start in range(0, len(new), 1024):
+                block = vectors[start:start + 1024]
+                scores = block @ matrix.T
+                for offset, row in enumerate(scores):
+                    code = first + start + offset
+                    row[code] = -1.0
+                    self._neighbours[self._vocabulary[code].lower()] = self._nearest(self._vocabulary[code], row)
+                    # Older skills may gain the new skill as a neighbour
+                    for other in np.flatnonzero(row[:first] >= self.threshold):
+                        self._add_neighbour(self._vocabulary[other], self._vocabulary[code], float(row[other]))
+
+            self._unknown.clear()
+            logger.info(f"Skill synonym table covers {len(self._vocabulary)} skills")
+
+    def is_known(self, skills: Iterable[str]) -> bool:
+        """
+        Check whether skills expand without embedding.
+
+        Args:
+            skills (Iterable[str]): Requested skills.
+
+        Returns:
+            bool: True if every skill is in the vocabulary, the overrides or the LRU of earlier terms.
+        """
+        with self._lock:
+            return all(
+                key in self._codes or key in self._groups or key in self._unknown
+                for key in (skill.strip().lower() for skill in skills)
+            )
+
+    def expand(self, skill: str) -> List[str]:
+        """
+        Return a skill with its synonyms.
+
+        Args:
+            skill (str): Requested skill, in any case.
+
+        Returns:
+            List[str]: The skill followed by its synonyms in vocabulary spelling.
+        """
+        return self.expand_many([skill])[0]
+
+    def expand_many(self, skills: List[str]) -> List[List[str]]:
+        """
+        Return each skill with its synonyms.
+
+        Terms outside the vocabulary and the overrides are embedded together
+        and matched with one matrix product.
+
+        Args:
+            skills (List[str]): Requested skills, in any case.
+
+        Returns:
+            List[List[str]]: Per skill, the skill followed by its synonyms.
+        """
+        expanded: List[Optional[List[str]]] = []
+        unknown: List[str] = []
+        with self._lock:
+            for skill in skills:
+                key = skill.strip().lower()
+                if key in self._codes or key in self._groups:
+                    expanded.append(self._known(skill.strip()))
+                elif key in self._unknown:
+                    self._unknown.move_to_end(key)
+                    expanded.append(self._unknown[key])
+                else:
+                    expanded.append(None)
+                    unknown.append(skill.strip())
+            matrix = self._matrix
+            vocabulary = self._vocabulary
+
+        if unknown and len(vocabulary):
+            terms = list(dict.fromkeys(unknown))
+            scores = self._normalize(self.embeddings.embed_documents(terms)) @ matrix.T
+            matches = {
+                term.lower(): [term] + [
+                    name for name, _ in self._nearest(term, row, vocabulary)
+                ]
+                for term, row in zip(terms, scores)
+            }
+            with self._lock:
+                for key, value in matches.items():
+                    self._unknown[key] = value
+                    while len(self._unknown) > self.max_unknown:
+                        self._unknown.popitem(last=False)
+        else:
+            matches = {term.lower(): [term] for term in unknown}
+
+        return [
+            value if value is not None else matches[skill.strip().lower()]
+            for skill, value in zip(skills, expanded)
+        ]
+
+    def _known(self, skill: str) -> List[str]:
+        key = skill.lower()
+        result = [skill]
+        seen = {key}
+        # Override groups come first, then the nearest skills in the vocabulary
+        terms = sorted(self._groups.get(key, ())) + [name for name, _ in self._neighbours.get(key, ())]
+        for term in terms:
+            if term.lower() not in seen:
+                seen.add(term.lower())
+                result.append(term)
+        return result
+
+    def _nearest(self, skill: str, scores: np.ndarray, vocabulary: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+        vocabulary = vocabulary if vocabulary is not None else self._vocabulary
+        if self.max_synonyms <= 0:
+            return []
+        candidates = np.flatnonzero(scores >= self.threshold)
+        if len(candidates) > self.max_synonyms:
+            candidates = candidates[np.argpartition(-scores[candidates], self.max_synonyms - 1)[:self.max_synonyms]]
+        key = skill.lower()
+        neighbours = [
+            (vocabulary[i], float(scores[i])) for i in candidates
+            if vocabulary[i].lower() != key and (key, vocabulary[i].lower()) not in self._excluded
+        ]
+        return sorted(neighbours, key=lambda item: -item[1])
+
+    def _add_neighbour(self, skill: str, neighbour: str, score: float) -> None:
+        key = skill.lower()
+        if (key, neighbour.lower()) in self._excluded:
+            return
+        neighbours = self._neighbours.setdefault(key, [])
+        neighbours.append((neighbour, score))
+        neighbours.sort(key=lambda item: -item[1])
+        del neighbours[self.max_synonyms:]
+
+    @staticmethod
+    def _normalize(vectors: Any) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
@@ -0,0 +1,202 @@
+"""
+Trigram index module for the Employee Search RAG application.
+
+This module handles fast substring and typo-tolerant lookups of short texts
+such as employee and project names, using inverted indexes from character
+trigrams to the texts that contain them.
+"""
+
+import logging
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Return the character trigrams of a text.
+
+    Args:
+        text (str): Lowercase text.
+
+    Returns:
+        Set[str]: Distinct trigrams; empty for texts shorter than three characters.
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def padded_trigrams(term: str) -> Set[str]:
+    """
+    Return the trigrams of a term padded with two leading spaces and one trailing space.
+
+    Padding gives the start and end of a word their own trigrams, so short
+    terms and typos near the ends still share enough trigrams to match.
+
+    Args:
+        term (str): Lowercase term.
+
+    Returns:
+        Set[str]: Distinct padded trigrams.
+    """
+    return trigrams(f"  {term} ")
+
+class TrigramIndex:
+    """
+    Trigram inverted index over the texts of integer keys.
+
+    Each key (an employee id) has one or more texts (its name, or its project
+    names). Substring lookups intersect the posting sets of the needle's
+    trigrams and verify the few remaining candidates. Fuzzy lookups score
+    each whole text and each of its words by trigram Jaccard similarity, so
+    a misspelt surname matches the full name it is part of.
+
+    The index is not thread-safe; EmployeeSearchIndex guards it with its lock.
+    """
+
+    def __init__(self):
+        self._texts: Dict[int, List[str]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._term_keys: Dict[str, Set[int]] = {}
+        self._term_trigrams: Dict[str, int] = {}
+        self._term_postings: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, key: int, texts: Iterable[str]) -> None:
+        """
+        Index the texts of a key, replacing any texts it had before.
+
+        Args:
+            key (int): Key the texts belong to.
+            texts (Iterable[str]): Texts to index; matching is case-insensitive.
+        """
+        self.remove(key)
+        texts = [text.lower() for text in texts if text]
+        self._texts[key] = texts
+        for text in texts:
+            for gram in trigrams(text):
+                self._postings.setdefault(gram, set()).add(key)
+            for term in self._terms(text):
+                keys = self._term_keys.setdefault(term, set())
+                if not keys:
+                    grams = padded_trigrams(term)
+                    self._term_trigrams[term] = len(grams)
+                    for gram in grams:
+                        self._term_postings.setdefault(gram, set()).add(term)
+                keys.add(key)
+
+    def remove(self, key: int) -> None:
+        """
+        Remove a key and its texts from the index.
+
+        Args:
+            key (int): Key to remove.
+        """
+        texts = self._texts.pop(key, None)
+        if texts is None:
+            return
+        for text in texts:
+            for gram in trigrams(text):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(key)
+                    if not posting:
+                        del self._postings[gram]
+            for term in self._terms(text):
+                keys = self._term_keys.get(term)
+                if keys is None:
+                    continue
+                keys.discard(key)
+                if not keys:
+                    del self._term_keys[term]
+                    del self._term_trigrams[term]
+                    for gram in padded_trigrams(term):
+                        terms = self._term_postings.get(gram)
+                        if terms is not None:
+                            terms.discard(term)
+                            if not terms:
+                                del self._term_postings[gram]
+
+    def contains(self, needle: str) -> Set[int]:
+        """
+        Return the keys with a text containing ``needle`` (case-insensitive).
+
+        Args:
+            needle (str): Substring to look for.
+
+        Returns:
+            Set[int]: Matching keys.
+        """
+        needle = needle.lower()
+        grams = trigrams(needle)
+        if not grams:
+            # Needles under three characters have no trigram to look up
+            return {key for key, texts in self._texts.items() if any(needle in text for text in texts)}
+
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates = candidates & posting
+        # Sharing all trigrams does not imply containing them in order
+        return {key for key in candidates if any(needle in text for text in self._texts[key])}
+
+    def fuzzy(self, query: str, threshold: float) -> List[Tuple[int, float]]:
+        """
+        Return the keys with a text or word similar to ``query``, best first.
+
+        Args:
+            query (str): Text to look for, possibly misspelt.
+            threshold (float): Minimum trigram Jaccard similarity in [0, 1].
+
+        Returns:
+            List[Tuple[int, float]]: Keys with their best similarity, highest first.
+        """
+        query = " ".join(WORD_PATTERN.findall(query.lower()))
+        grams = padded_trigrams(query)
+        if not query or not grams:
+            return []
+
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._term_postings.get(gram, ()))
+
+        scores: Dict[int, float] = {}
+        for term, count in shared.items():
+            similarity = count / (len(grams) + self._term_trigrams[term] - count)
+            if similarity < threshold:
+                continue
+            for key in self._term_keys[term]:
+                if similarity > scores.get(key, 0.0):
+                    scores[key] = similarity
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def lookup(self, query: str, threshold: float) -> Dict[int, float]:
+        """
+        Combine substring and fuzzy matches into one score per key.
+
+        Substring matches score 1.0; other keys score their fuzzy similarity.
+
+        Args:
+            query (str): Text to look for.
+            threshold (float): Minimum fuzzy similarity.
+
+        Returns:
+            Dict[int, float]: Score per matching key.
+        """
+        scores = dict(self.fuzzy(query, threshold))
+        scores.update((key, 1.0) for key in self.contains(query))
+        return scores
+
+    @staticmethod
+    def _terms(text: str) -> Set[str]:
+        words = WORD_PATTERN.findall(text)
+        terms = set(words)
+        if len(words) > 1:
+            terms.add(" ".join(words))
+        return terms
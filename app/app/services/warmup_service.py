@@ -0,0 +1,105 @@
+"""
+Warm-up service module for the Employee Search RAG application.
+
+This module tracks which parts of the application are loaded and warm, and
+runs the dummy embedding and tiny generation that pull model weights into
+memory before real traffic arrives.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class Readiness:
+    """
+    Thread-safe readiness state of the application components.
+
+    The application is ready once the employee index is loaded and both the
+    embedding model and the LLM have been warmed up.
+    """
+
+    COMPONENTS = ("index", "embeddings", "llm")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready_at: Dict[str, Optional[float]] = {component: None for component in self.COMPONENTS}
+        self._errors: Dict[str, str] = {}
+        self.started = time.monotonic()
+
+    @property
+    def ready(self) -> bool:
+        """Whether every component is ready."""
+        with self._lock:
+            return all(ready_at is not None for ready_at in self._ready_at.values())
+
+    def is_ready(self, component: str) -> bool:
+        """Whether one component is ready."""
+        with self._lock:
+            return self._ready_at[component] is not None
+
+    def mark_ready(self, component: str) -> None:
+        """
+        Mark a component as ready and clear its last error.
+
+        Args:
+            component (str): One of COMPONENTS.
+        """
+        with self._lock:
+            self._ready_at[component] = time.monotonic()
+            self._errors.pop(component, None)
+        logger.info(f"{component} ready after {self._ready_at[component] - self.started:.1f}s")
+
+    def mark_failed(self, component: str, error: str) -> None:
+        """
+        Record why a component is not ready yet.
+
+        Args:
+            component (str): One of COMPONENTS.
+            error (str): Error description.
+        """
+        with self._lock:
+            self._errors[component] = error
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Return the readiness of every component.
+
+        Returns:
+            Dict[str, Any]: Overall readiness, per-component readiness and errors.
+        """
+        with self._lock:
+            return {
+                "ready": all(ready_at is not None for ready_at in self._ready_at.values()),
+                "components": {
+                    component: ready_at is not None for component, ready_at in self._ready_at.items()
+                },
+                "errors": dict(self._errors),
+                "uptime": round(time.monotonic() - self.started, 1),
+            }
+
+def warm_up_embeddings(embeddings: Any) -> None:
+    """
+    Run a dummy query embedding so the model weights are loaded.
+
+    Args:
+        embeddings (Any): Embedding model.
+    """
+    start = time.perf_counter()
+    embeddings.embed_query("warm-up")
+    logger.info(f"Embedding model warmed up in {time.perf_counter() - start:.2f}s")
+
+def warm_up_llm(llm: Any) -> None:
+    """
+    Generate a single token so Ollama loads the model into memory.
+
+    Args:
+        llm (Any): Ollama LLM instance.
+    """
+    start = time.perf_counter()
+    llm.invoke("Hi", num_predict=1)
+    logger.info(f"LLM {settings.LLM_MODEL} warmed up in {time.perf_counter() - start:.2f}s")
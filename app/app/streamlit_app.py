@@ -3,29 +3,138 @@ Streamlit application for the Employee Search RAG system.
 
 This module provides a user-friendly web interface for interacting with the
 employee search system, including both chat and structured search capabilities.
+
+All users of the Streamlit server share one pooled HTTP session to the API,
+and search result pages are cached for UI_SEARCH_CACHE_TTL seconds, so
+reruns and repeated searches do not reach the API.
 """
 
 import streamlit as st
 import requests
 import json
-from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import pandas as pd
+from pydantic_settings import BaseSettings
 
 from core.config import settings
 
+class ClientSettings(BaseSettings):
+    """Streamlit client settings; the API does not read them."""
+
+    UI_HTTP_POOL_SIZE: int = 32  # pooled keep-alive connections to the API, shared by all UI users
+    UI_CONNECT_TIMEOUT: float = 2.0  # seconds to connect to the API
+    UI_READ_TIMEOUT: float = 300.0  # seconds to wait for API output, such as the next streamed token
+    UI_SEARCH_CACHE_TTL: float = 60.0  # seconds a search result page is reused
+    UI_SEARCH_PAGE_SIZE: int = 50  # employees per page of search results
+
+    class Config:
+        env_file = ".env"
+        case_sensitive = True
+        # The .env file also holds the API settings
+        extra = "ignore"
+
+client_settings = ClientSettings()
+
 # Constants
 API_BASE_URL = f"http://{settings.API_HOST}:{settings.API_PORT}"
+REQUEST_TIMEOUT = (client_settings.UI_CONNECT_TIMEOUT, client_settings.UI_READ_TIMEOUT)
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Return the HTTP session shared by all users, keeping connections to the API alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=client_settings.UI_HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def normalize_filters(
+    name: str,
+    skills: str,
+    min_experience: int,
+    availability: str
+) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Turn the search form into query parameters that compare equal for equivalent searches.
+
+    Skills are split on commas, stripped, deduplicated case-insensitively and
+    sorted; empty filters are dropped.
+
+    Args:
+        name (str): Name filter.
+        skills (str): Comma-separated skills.
+        min_experience (int): Minimum years of experience; 0 means no filter.
+        availability (str): Availability status, or "" for any.
+
+    Returns:
+        Tuple[Tuple[str, Any], ...]: Sorted ``(parameter, value)`` pairs, usable as a cache key.
+    """
+    params: Dict[str, Any] = {}
+    if name.strip():
+        params["name"] = name.strip()
+    skill_list: Dict[str, str] = {}
+    for skill in skills.split(","):
+        if skill.strip():
+            skill_list.setdefault(skill.strip().lower(), skill.strip())
+    if skill_list:
+        params["skills"] = ",".join(skill_list[key] for key in sorted(skill_list))
+    if min_experience:
+        params["min_experience"] = int(min_experience)
+    if availability:
+        params["availability"] = availability
+    return tuple(sorted(params.items()))
+
+@st.cache_data(ttl=client_settings.UI_SEARCH_CACHE_TTL, show_spinner=False)
+def fetch_search_page(filters: Tuple[Tuple[str, Any], ...], cursor: Optional[str], limit: int) -> Dict[str, Any]:
+    """
+    Fetch one page of search results.
+
+    Args:
+        filters (Tuple[Tuple[str, Any], ...]): Normalized filters from ``normalize_filters``.
+        cursor (str, optional): ``next_cursor`` of the previous page, None for the first page.
+        limit (int): Employees per page.
+
+    Returns:
+        Dict[str, Any]: SearchResponse JSON with ``total``, ``employees`` and ``next_cursor``.
+
+    Raises:
+        requests.HTTPError: If the API request fails.
+    """
+    params: Dict[str, Any] = {**dict(filters), "limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    response = get_http_session().get(f"{API_BASE_URL}/employees/search", params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
 
 def initialize_session_state():
     """Initialize session state variables."""
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = []
+    if "search_filters" not in st.session_state:
+        # Filters of the last submitted search, and the cursor of each page visited
+        st.session_state.search_filters = None
+        st.session_state.search_cursors = [None]
 
 def display_chat_message(message: str, is_user: bool = True):
     """Display a chat message in the chat interface."""
     with st.chat_message("user" if is_user else "assistant"):
         st.write(message)
 
+def stream_chat_tokens(response: requests.Response) -> Iterator[str]:
+    """Yield answer tokens from a ``/chat/stream`` Server-Sent Events response."""
+    event = None
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data = json.loads(line[len("data:"):])
+            if event == "token":
+                yield data["token"]
+            elif event == "error":
+                raise RuntimeError(data["detail"])
+
 def chat_interface():
     """Create the chat interface for natural language queries."""
     st.header("💬 Chat with Employee Search")
@@ -41,70 +150,88 @@ def chat_interface():
         st.session_state.chat_history.append({"content": prompt, "is_user": True})
         
         try:
-            # Call API
-            response = requests.post(
-                f"{API_BASE_URL}/chat",
-                json={"query": prompt}
-            )
-            response.raise_for_status()
-            
-            # Display assistant response
-            assistant_response = response.json()["response"]
-            display_chat_message(assistant_response, False)
+            # Call API and render tokens as they arrive
+            with get_http_session().post(
+                f"{API_BASE_URL}/chat/stream",
+                json={"query": prompt},
+                stream=True,
+                timeout=REQUEST_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                with st.chat_message("assistant"):
+                    assistant_response = st.write_stream(stream_chat_tokens(response))
+
             st.session_state.chat_history.append({"content": assistant_response, "is_user": False})
             
         except Exception as e:
             st.error(f"Error: {str(e)}")
 
+def next_page(cursor: str):
+    """Move to the page starting at ``cursor``."""
+    st.session_state.search_cursors.append(cursor)
+
+def previous_page():
+    """Move back one page."""
+    st.session_state.search_cursors.pop()
+
 def search_interface():
     """Create the structured search interface."""
     st.header("🔍 Employee Search")
     
-    # Create columns for filters
-    col1, col2 = st.columns(2)
+    # A form only reruns the search when submitted, not on every keystroke
+    with st.form("search_form"):
+        # Create columns for filters
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            name = st.text_input("Name")
+            skills = st.text_input("Skills (comma-separated)")
+            min_experience = st.number_input("Minimum Experience (years)", min_value=0, value=0)
+        
+        with col2:
+            availability = st.selectbox(
+                "Availability",
+                ["", "available", "unavailable"]
+            )
+        
+        submitted = st.form_submit_button("Search")
     
-    with col1:
-        name = st.text_input("Name")
-        skills = st.text_input("Skills (comma-separated)")
-        min_experience = st.number_input("Minimum Experience (years)", min_value=0, value=0)
+    if submitted:
+        st.session_state.search_filters = normalize_filters(name, skills, min_experience, availability)
+        st.session_state.search_cursors = [None]
     
-    with col2:
-        availability = st.selectbox(
-            "Availability",
-            ["", "available", "unavailable", "busy"]
-        )
+    if st.session_state.search_filters is None:
+        return
     
-    if st.button("Search"):
-        try:
-            # Prepare query parameters
-            params = {}
-            if name:
-                params["name"] = name
-            if skills:
-                params["skills"] = [skills]
-            if min_experience:
-                params["min_experience"] = min_experience
-            if availability:
-                params["availability"] = availability
+    try:
+        # Pages already seen within the TTL are served from the cache
+        cursors = st.session_state.search_cursors
+        with st.spinner("Searching..."):
+            results = fetch_search_page(st.session_state.search_filters, cursors[-1], client_settings.UI_SEARCH_PAGE_SIZE)
+        
+        # Display results
+        if results["total"] > 0:
+            first = (len(cursors) - 1) * client_settings.UI_SEARCH_PAGE_SIZE + 1
+            st.caption(f"Showing {first}–{first + len(results['employees']) - 1} of {results['total']} employees")
+            # Convert to DataFrame for better display
+            df = pd.DataFrame(results["employees"])
+            st.dataframe(df)
             
-            # Call API
-            response = requests.get(
-                f"{API_BASE_URL}/employees/search",
-                params=params
-            )
-            response.raise_for_status()
+            col1, col2 = st.columns(2)
+            with col1:
+                st.button("Previous", disabled=len(cursors) == 1, on_click=previous_page)
+            with col2:
+                st.button(
+                    "Next",
+                    disabled=results["next_cursor"] is None,
+                    on_click=next_page,
+                    args=(results["next_cursor"],)
+                )
+        else:
+            st.info("No employees found matching your criteria.")
             
-            # Display results
-            results = response.json()
-            if results["total"] > 0:
-                # Convert to DataFrame for better display
-                df = pd.DataFrame(results["employees"])
-                st.dataframe(df)
-            else:
-                st.info("No employees found matching your criteria.")
-                
-        except Exception as e:
-            st.error(f"Error: {str(e)}")
+    except Exception as e:
+        st.error(f"Error: {str(e)}")
 
 def main():
     """Main function to run the Streamlit app."""
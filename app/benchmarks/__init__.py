@@ -0,0 +1,5 @@
+"""
+Benchmarks for the Employee Search RAG application.
+
+Run them from the application directory, e.g. ``python -m benchmarks.ann_benchmark``.
+"""
@@ -0,0 +1,107 @@
+"""
+Embedding benchmark module for the Employee Search RAG application.
+
+This module compares the embedding backends on the documents of a synthetic
+dataset: model load time, single-query latency, document throughput during
+index builds and the cosine similarity of each backend's vectors to the
+PyTorch vectors.
+
+Example:
+    python -m benchmarks.embedding_benchmark --employees 500 --backends torch onnx onnx-int8 --output embed.json
+"""
+
+import argparse
+import logging
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.embedding_service import EMBEDDING_BACKENDS, create_backend_embeddings
+from app.services.retriever_service import build_employee_documents
+from benchmarks.microbenchmarks import QUERIES, time_calls
+from benchmarks.results import write_results
+from benchmarks.synthetic_data import generate_employees
+
+logger = logging.getLogger(__name__)
+
+def run(backends: List[str], n_employees: int, iterations: int, threads: int, seed: int) -> Dict[str, Any]:
+    """
+    Benchmark each backend on the same documents and queries.
+
+    Args:
+        backends (List[str]): Embedding backends to compare.
+        n_employees (int): Number of synthetic employees whose documents are embedded.
+        iterations (int): Single-query embeddings per backend.
+        threads (int): ONNX Runtime intra-op threads; 0 lets ONNX Runtime decide.
+        seed (int): Random seed for the synthetic data.
+
+    Returns:
+        Dict[str, Any]: Results per backend.
+    """
+    texts = [
+        doc.page_content
+        for emp in generate_employees(n_employees, seed)
+        for doc in build_employee_documents(emp)
+    ]
+    results: Dict[str, Any] = {"documents": len(texts)}
+    reference = None
+
+    for backend in backends:
+        start = time.perf_counter()
+        embeddings = create_backend_embeddings(backend, threads)
+        load_seconds = time.perf_counter() - start
+
+        embeddings.embed_query(QUERIES[0])
+        query = time_calls(lambda i: embeddings.embed_query(QUERIES[i % len(QUERIES)]), iterations)
+
+        start = time.perf_counter()
+        vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+        build_seconds = time.perf_counter() - start
+
+        backend_results: Dict[str, Any] = {
+            "load_seconds": round(load_seconds, 3),
+            "embed_query": query,
+            "embed_documents_seconds": round(build_seconds, 3),
+            "documents_per_second": round(len(texts) / build_seconds, 1) if build_seconds else None,
+        }
+        if backend == "torch":
+            reference = vectors
+        elif reference is not None:
+            cosines = (vectors * reference).sum(axis=1)
+            backend_results["parity_min_cosine"] = round(float(cosines.min()), 6)
+            backend_results["parity_mean_cosine"] = round(float(cosines.mean()), 6)
+        results[backend] = backend_results
+
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare embedding backends on query latency, build throughput and parity")
+    parser.add_argument("--backends", nargs="+", choices=EMBEDDING_BACKENDS, default=list(EMBEDDING_BACKENDS))
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=settings.EMBEDDING_THREADS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # The torch backend runs first so the others can be compared with its vectors
+    backends = sorted(set(args.backends), key=EMBEDDING_BACKENDS.index)
+    results = run(backends, args.employees, args.iterations, args.threads, args.seed)
+    write_results("embedding_benchmark", vars(args), results, args.output)
+
+    print(f"documents: {results['documents']}")
+    for backend in backends:
+        values = results[backend]
+        parity = values.get("parity_min_cosine")
+        print(
+            f"{backend:<10} load {values['load_seconds']:>7.2f} s  "
+            f"query p50 {values['embed_query']['p50_ms']:>8.3f} ms  p95 {values['embed_query']['p95_ms']:>8.3f} ms  "
+            f"build {values['documents_per_second']:>8} docs/s"
+            + (f"  min cosine {parity:.4f}" if parity is not None else "")
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Fake Ollama server module for the Employee Search RAG application.
+
+This module serves the subset of the Ollama HTTP API the application uses
+(``/api/tags``, ``/api/generate``, ``/api/chat``) with canned text and a
+configurable time to first token and per-token latency, so end-to-end
+benchmarks measure the application rather than a GPU. Point the application
+at it with ``OLLAMA_BASE_URL``.
+
+Example:
+    python -m benchmarks.fake_ollama --port 11435 --token-ms 20 --tokens 64
+    OLLAMA_BASE_URL=http://127.0.0.1:11435 uvicorn app.api.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+DEFAULT_ANSWER = (
+    "Based on the provided context, the best match is Alice Johnson, who has five years of "
+    "Python experience, worked on the E-commerce Platform and Healthcare Dashboard projects, "
+    "and is currently available. "
+)
+
+def create_app(first_token_ms: float = 200.0, token_ms: float = 20.0, tokens: int = 64, model: str = "mistral:7b") -> FastAPI:
+    """
+    Create the fake Ollama application.
+
+    Args:
+        first_token_ms (float): Delay before the first token, standing in for prompt evaluation.
+        token_ms (float): Delay between generated tokens.
+        tokens (int): Tokens generated per request unless ``num_predict`` asks for fewer.
+        model (str): Model name reported by ``/api/tags``.
+
+    Returns:
+        FastAPI: Application implementing the fake API.
+    """
+    app = FastAPI(title="Fake Ollama")
+    words = DEFAULT_ANSWER.split(" ")
+
+    def now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    async def generate(body: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        limit = body.get("options", {}).get("num_predict") or tokens
+        count = tokens if limit < 0 else min(tokens, limit)
+        prompt = body.get("prompt") or json.dumps(body.get("messages", []))
+        start = time.perf_counter_ns()
+
+        await asyncio.sleep(first_token_ms / 1000)
+        prompt_done = time.perf_counter_ns()
+        for i in range(count):
+            if i:
+                await asyncio.sleep(token_ms / 1000)
+            yield {"text": words[i % len(words)] + " ", "done": False}
+
+        end = time.perf_counter_ns()
+        yield {
+            "text": "",
+            "done": True,
+            "done_reason": "stop" if count == tokens else "length",
+            "total_duration": end - start,
+            "load_duration": 0,
+            # Rough whitespace token count of the prompt
+            "prompt_eval_count": len(prompt.split()),
+            "prompt_eval_duration": prompt_done - start,
+            "eval_count": count,
+            "eval_duration": end - prompt_done,
+            # Stand-in token ids so clients can continue the generation
+            "context": list(body.get("context") or []) + list(range(len(prompt.split()) + count)),
+        }
+
+    def generate_message(chunk: Dict[str, Any], chat: bool) -> Dict[str, Any]:
+        message = {"model": model, "created_at": now(), "done": chunk["done"]}
+        if chat:
+            message["message"] = {"role": "assistant", "content": chunk["text"]}
+        else:
+            message["response"] = chunk["text"]
+        excluded = ("text", "done", "context") if chat else ("text", "done")
+        message.update({key: value for key, value in chunk.items() if key not in excluded})
+        return message
+
+    async def respond(request: Request, chat: bool):
+        body = await request.json()
+        if body.get("stream", True):
+            async def lines() -> AsyncIterator[str]:
+                async for chunk in generate(body):
+                    yield json.dumps(generate_message(chunk, chat)) + "\n"
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+        text = []
+        async for chunk in generate(body):
+            text.append(chunk["text"])
+        final = generate_message({**chunk, "text": "".join(text)}, chat)
+        return JSONResponse(final)
+
+    @app.get("/api/tags")
+    async def tags():
+        return {"models": [{"name": model, "model": model, "modified_at": now(), "size": 0}]}
+
+    @app.post("/api/generate")
+    async def api_generate(request: Request):
+        return await respond(request, chat=False)
+
+    @app.post("/api/chat")
+    async def api_chat(request: Request):
+        return await respond(request, chat=True)
+
+    return app
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve a fake Ollama API with configurable latency")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--first-token-ms", type=float, default=200.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--tokens", type=int, default=64)
+    parser.add_argument("--model", default="mistral:7b")
+    args = parser.parse_args()
+
+    app = create_app(args.first_token_ms, args.token_ms, args.tokens, args.model)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
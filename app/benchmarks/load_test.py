@@ -0,0 +1,155 @@
+"""
+HTTP load test module for the Employee Search RAG application.
+
+This module drives a running API with a fixed number of concurrent clients
+and reports throughput, status codes and latency percentiles for ``/chat``
+and ``/employees/search``. Run the API against the fake Ollama server to
+measure the application itself.
+
+Example:
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --concurrency 16 --requests 500
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+from benchmarks.microbenchmarks import QUERIES
+from benchmarks.results import summarize_latencies, write_results
+from benchmarks.synthetic_data import SKILLS
+
+logger = logging.getLogger(__name__)
+
+def chat_request(rng: random.Random) -> Dict[str, Any]:
+    """Build a /chat request with a query drawn from QUERIES."""
+    return {"method": "POST", "url": "/chat", "json": {"query": rng.choice(QUERIES)}}
+
+def search_request(rng: random.Random) -> Dict[str, Any]:
+    """Build an /employees/search request with random filters."""
+    params = {"skills": ",".join(rng.sample(SKILLS[:12], rng.randint(1, 2)))}
+    if rng.random() < 0.5:
+        params["min_experience"] = rng.choice([2, 5, 10])
+    if rng.random() < 0.5:
+        params["availability"] = rng.choice(["available", "busy"])
+    return {"method": "GET", "url": "/employees/search", "params": params}
+
+SCENARIOS: Dict[str, Callable[[random.Random], Dict[str, Any]]] = {
+    "chat": chat_request,
+    "search": search_request,
+}
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    make_request: Callable[[random.Random], Dict[str, Any]],
+    total: int,
+    concurrency: int,
+    seed: int
+) -> Dict[str, Any]:
+    """
+    Send ``total`` requests with ``concurrency`` clients in a closed loop.
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the API base URL.
+        make_request (Callable): Builds the keyword arguments of one request.
+        total (int): Number of requests.
+        concurrency (int): Number of concurrent clients.
+        seed (int): Random seed for request parameters.
+
+    Returns:
+        Dict[str, Any]: Throughput, status counts and latency summaries.
+    """
+    rng = random.Random(seed)
+    requests = [make_request(rng) for _ in range(total)]
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    next_request = iter(requests)
+
+    async def worker() -> None:
+        for kwargs in next_request:
+            start = time.perf_counter()
+            try:
+                response = await client.request(**kwargs)
+                statuses[str(response.status_code)] += 1
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    errors = total - statuses.get("200", 0)
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "duration_seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2),
+        "errors": errors,
+        "status_codes": dict(statuses),
+        "latency": summarize_latencies(latencies),
+    }
+
+async def run(url: str, scenarios: List[str], total: int, concurrency: int, warmup: int, timeout: float, seed: int) -> Dict[str, Any]:
+    """
+    Run the selected scenarios one after another against a running API.
+
+    Args:
+        url (str): API base URL.
+        scenarios (List[str]): Scenario names from SCENARIOS.
+        total (int): Requests per scenario.
+        concurrency (int): Concurrent clients.
+        warmup (int): Untimed requests sent before each scenario.
+        timeout (float): Per-request timeout in seconds.
+        seed (int): Random seed.
+
+    Returns:
+        Dict[str, Any]: Results per scenario.
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        ready = await client.get("/readyz")
+        if ready.status_code != 200:
+            logger.warning(f"API is not ready yet: {ready.text}")
+
+        results = {}
+        for name in scenarios:
+            if warmup:
+                await run_scenario(client, SCENARIOS[name], warmup, concurrency, seed + 1)
+            logger.info(f"Running {name}: {total} requests, concurrency {concurrency}")
+            results[name] = await run_scenario(client, SCENARIOS[name], total, concurrency, seed)
+        return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test /chat and /employees/search")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed requests per scenario")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    results = asyncio.run(run(
+        args.url, args.scenarios, args.requests, args.concurrency, args.warmup, args.timeout, args.seed
+    ))
+    write_results("load_test", vars(args), results, args.output)
+
+    for name, result in results.items():
+        latency = result["latency"]
+        print(
+            f"{name:<8} {result['throughput_rps']:>8.1f} req/s  errors {result['errors']:>4}  "
+            f"p50 {latency.get('p50_ms', 0):>9.1f} ms  p95 {latency.get('p95_ms', 0):>9.1f} ms  "
+            f"p99 {latency.get('p99_ms', 0):>9.1f} ms"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Microbenchmark module for the Employee Search RAG application.
+
+This module times the in-process building blocks on a synthetic dataset:
+building the vector store and retriever, vector queries with and without
+pre-filters, skill synonym expansion, and structured employee search
+filtering, both on the in-memory search index and on the memory-mapped
+employee snapshot used by workers.
+
+With ``--embeddings hash`` documents are embedded with a deterministic hash
+embedding, so index build and query costs are measured without the model;
+``--embeddings model`` uses the configured embedding model.
+
+Example:
+    python -m benchmarks.microbenchmarks --employees 10000 --output micro.json
+"""
+
+import argparse
+import hashlib
+import logging
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.services.retriever_service import EmployeeVectorStore, get_embeddings, get_retriever
+from app.services.search_service import EmployeeSearchIndex
+from app.services.snapshot_service import EmployeeSnapshot, SnapshotSearchIndex, write_snapshot
+from app.services.synonym_service import SkillSynonyms, load_synonym_overrides
+from benchmarks.results import summarize_latencies, write_results
+from benchmarks.synthetic_data import SKILLS, generate_employees
+
+logger = logging.getLogger(__name__)
+
+QUERIES = [
+    "Who has Python and AWS experience?",
+    "Find available React developers",
+    "Machine learning engineers who worked on healthcare projects",
+    "Which employees know Kubernetes and Terraform?",
+    "Senior Java developers with at least 8 years of experience",
+    "Someone for a banking payment gateway",
+]
+
+class HashEmbeddings(Embeddings):
+    """
+    Deterministic unit vectors derived from a hash of the text.
+
+    Has the embedding model's dimension and cost profile of a lookup, so it
+    isolates indexing and search from model inference.
+    """
+
+    def __init__(self, dim: int = 768):
+        self.dim = dim
+
+    def _embed(self, text: str) -> List[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(self.dim, dtype=np.float32)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+def time_calls(fn: Callable[[int], Any], iterations: int) -> Dict[str, float]:
+    """
+    Call ``fn(i)`` repeatedly and summarize the latencies.
+
+    Args:
+        fn (Callable[[int], Any]): Function under test, given the iteration number.
+        iterations (int): Number of calls.
+
+    Returns:
+        Dict[str, float]: Latency summary.
+    """
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(i)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return summarize_latencies(latencies)
+
+def run(n_employees: int, iterations: int, embeddings: Embeddings, seed: int) -> Dict[str, Any]:
+    """
+    Run all microbenchmarks on one synthetic dataset.
+
+    Args:
+        n_employees (int): Number of synthetic employees.
+        iterations (int): Calls per timed operation.
+        embeddings (Embeddings): Embedding model for documents and queries.
+        seed (int): Random seed for data and query parameters.
+
+    Returns:
+        Dict[str, Any]: Build timings and latency summaries per operation.
+    """
+    employees = list(generate_employees(n_employees, seed))
+    rng = random.Random(seed)
+    results: Dict[str, Any] = {}
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    search_index = EmployeeSearchIndex(employees)
+    results["search_index_build_seconds"] = round(time.perf_counter() - start, 3)
+    results["search_index_heap_mb"] = round(tracemalloc.get_traced_memory()[0] / 2**20, 1)
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    vector_store = EmployeeVectorStore.from_employees(employees, embeddings)
+    retriever = get_retriever(vector_store, search_index=search_index)
+    results["retriever_build_seconds"] = round(time.perf_counter() - start, 3)
+    results["documents"] = vector_store.index.ntotal
+
+    query_vectors = [embeddings.embed_query(query) for query in QUERIES]
+    results["embed_query"] = time_calls(lambda i: embeddings.embed_query(QUERIES[i % len(QUERIES)]), iterations)
+
+    results["vector_query"] = time_calls(
+        lambda i: vector_store.search_with_relevance(query_vectors[i % len(QUERIES)], retriever.fetch_k),
+        iterations
+    )
+
+    filtered_ids = {emp["id"] for emp in search_index.search(skills=["Python"], availability="available")}
+    results["vector_query_prefiltered"] = time_calls(
+        lambda i: vector_store.search_with_relevance(query_vectors[i % len(QUERIES)], retriever.fetch_k, filtered_ids),
+        iterations
+    )
+    results["prefiltered_employees"] = len(filtered_ids)
+
+    results["lexical_query"] = time_calls(
+        lambda i: vector_store.lexical_search(QUERIES[i % len(QUERIES)], retriever.fetch_k),
+        iterations
+    )
+
+    results["retriever_search"] = time_calls(
+        lambda i: retriever.search(QUERIES[i % len(QUERIES)], query_vectors[i % len(QUERIES)]),
+        iterations
+    )
+
+    filters = [
+        {
+            "skills": rng.sample(SKILLS[:12], rng.randint(1, 2)),
+            "min_experience": rng.choice([None, 3, 5, 10]),
+            "availability": rng.choice([None, "available", "busy"]),
+        }
+        for _ in range(iterations)
+    ]
+    results["search_employees"] = time_calls(lambda i: search_index.search(**filters[i]), iterations)
+    results["search_employees_by_name"] = time_calls(lambda i: search_index.search(name="son"), iterations)
+    results["search_employees_page"] = time_calls(
+        lambda i: search_index.serialize(search_index.search_page(**filters[i], sort="-experience", limit=100)[1]),
+        iterations
+    )
+
+    start = time.perf_counter()
+    synonyms = SkillSynonyms(search_index.skill_vocabulary(), embeddings, overrides=load_synonym_overrides())
+    results["skill_synonyms_build_seconds"] = round(time.perf_counter() - start, 3)
+    expanded_filters = [
+        {**search, "skills": synonyms.expand_many(search["skills"])} for search in filters
+    ]
+    results["skill_expansion"] = time_calls(lambda i: synonyms.expand_many(filters[i]["skills"]), iterations)
+    results["search_employees_expanded"] = time_calls(
+        lambda i: search_index.search_ids(**expanded_filters[i]), iterations
+    )
+
+    # Heap allocated per process when serving from the shared snapshot; mapped pages are not counted
+    with tempfile.TemporaryDirectory() as path:
+        start = time.perf_counter()
+        write_snapshot(employees, path)
+        results["snapshot_write_seconds"] = round(time.perf_counter() - start, 3)
+
+        tracemalloc.start()
+        snapshot_index = SnapshotSearchIndex(EmployeeSnapshot.open(path))
+        results["snapshot_index_heap_mb"] = round(tracemalloc.get_traced_memory()[0] / 2**20, 1)
+        tracemalloc.stop()
+
+        results["snapshot_search_employees"] = time_calls(lambda i: snapshot_index.search_ids(**filters[i]), iterations)
+        results["snapshot_search_employees_by_name"] = time_calls(
+            lambda i: snapshot_index.search_ids(name="son"), iterations
+        )
+        results["snapshot_search_employees_page"] = time_calls(
+            lambda i: snapshot_index.serialize(
+                snapshot_index.search_page(**filters[i], sort="-experience", limit=100)[1]
+            ),
+            iterations
+        )
+
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time index build, vector queries and employee search")
+    parser.add_argument("--employees", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--embeddings", choices=["hash", "model"], default="hash")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    embeddings = HashEmbeddings() if args.embeddings == "hash" else get_embeddings()
+    results = run(args.employees, args.iterations, embeddings, args.seed)
+    write_results("microbenchmarks", vars(args), results, args.output)
+
+    for name, value in results.items():
+        if isinstance(value, dict):
+            print(f"{name:<28} p50 {value['p50_ms']:>9.3f} ms  p95 {value['p95_ms']:>9.3f} ms  p99 {value['p99_ms']:>9.3f} ms")
+        else:
+            print(f"{name:<28} {value}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Benchmark results module for the Employee Search RAG application.
+
+This module gives every benchmark the same machine-readable output: latency
+summaries, run metadata (commit, machine, relevant settings) and a JSON file
+layout that ``compare`` can diff between two commits.
+
+Example:
+    python -m benchmarks.results baseline.json current.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+# Settings that change benchmark results and are recorded with every run
+RECORDED_SETTINGS = (
+    "EMBEDDING_MODEL",
+    "EMBEDDING_BACKEND",
+    "EMBEDDING_THREADS",
+    "VECTOR_INDEX_TYPE",
+    "HYBRID_SEARCH_ENABLED",
+    "GROUP_RESULTS_BY_EMPLOYEE",
+    "MAX_RESULTS",
+    "LLM_MODEL",
+    "LLM_MAX_CONCURRENCY",
+    "ANSWER_CACHE_ENABLED",
+)
+
+# Metrics where a lower value is better; everything else is higher-is-better
+LOWER_IS_BETTER = ("_ms", "_seconds", "_bytes", "errors")
+
+def summarize_latencies(latencies_ms: Iterable[float]) -> Dict[str, float]:
+    """
+    Summarize latencies with the percentiles used across all benchmarks.
+
+    Args:
+        latencies_ms (Iterable[float]): Latencies in milliseconds.
+
+    Returns:
+        Dict[str, float]: Count, mean, p50, p95, p99 and max in milliseconds.
+    """
+    values = np.asarray(list(latencies_ms), dtype=np.float64)
+    if not len(values):
+        return {"count": 0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "count": int(len(values)),
+        "mean_ms": round(float(values.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(values.max()), 3),
+    }
+
+def git_commit() -> Tuple[Optional[str], Optional[bool]]:
+    """
+    Return the current git commit and whether the tree has local changes.
+
+    Returns:
+        Tuple[Optional[str], Optional[bool]]: Commit hash and dirty flag, or
+        (None, None) outside a git checkout.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True
+        ).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+def run_metadata() -> Dict[str, Any]:
+    """
+    Describe the environment a benchmark ran in.
+
+    Returns:
+        Dict[str, Any]: Commit, timestamp, interpreter, machine and settings.
+    """
+    commit, dirty = git_commit()
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {name: getattr(settings, name) for name in RECORDED_SETTINGS},
+    }
+
+def write_results(benchmark: str, parameters: Dict[str, Any], results: Dict[str, Any], output: Optional[str]) -> Dict[str, Any]:
+    """
+    Wrap benchmark results with metadata and optionally write them as JSON.
+
+    Args:
+        benchmark (str): Benchmark name.
+        parameters (Dict[str, Any]): Parameters the benchmark ran with.
+        results (Dict[str, Any]): Measured results.
+        output (str, optional): File to write; nothing is written if None.
+
+    Returns:
+        Dict[str, Any]: The full report.
+    """
+    report = {
+        "benchmark": benchmark,
+        "metadata": run_metadata(),
+        "parameters": parameters,
+        "results": results,
+    }
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+def flatten_metrics(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """
+    Flatten nested results to ``a.b.c`` keys with numeric values.
+
+    Args:
+        results (Dict[str, Any]): Nested results.
+        prefix (str): Key prefix.
+
+    Returns:
+        Dict[str, float]: Numeric leaves by dotted path.
+    """
+    flat: Dict[str, float] = {}
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_metrics(value, f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = float(value)
+    return flat
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    Compare the metrics of two reports of the same benchmark.
+
+    Args:
+        baseline (Dict[str, Any]): Report from the reference commit.
+        current (Dict[str, Any]): Report from the commit under test.
+        tolerance (float): Relative change treated as noise, e.g. 0.1 for 10%.
+
+    Returns:
+        List[Dict[str, Any]]: One row per shared metric with the relative change
+        and whether it is a regression.
+    """
+    before = flatten_metrics(baseline["results"])
+    after = flatten_metrics(current["results"])
+
+    rows = []
+    for metric in sorted(before.keys() & after.keys()):
+        old, new = before[metric], after[metric]
+        change = (new - old) / old if old else 0.0
+        worse = change > tolerance if metric.endswith(LOWER_IS_BETTER) else change < -tolerance
+        rows.append({"metric": metric, "baseline": old, "current": new, "change": change, "regression": worse})
+    return rows
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative change treated as noise")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    rows = compare(baseline, current, args.tolerance)
+    print(f"{baseline['metadata'].get('commit', '')[:10]} -> {current['metadata'].get('commit', '')[:10]}")
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(f"{row['metric']:<60}{row['baseline']:>14.3f}{row['current']:>14.3f}{row['change']:>+9.1%}  {flag}")
+
+    sys.exit(1 if any(row["regression"] for row in rows) else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Synthetic data module for the Employee Search RAG application.
+
+This module generates reproducible employee datasets of any size that
+validate against ``schemas.Employee``. Records are written as they are
+generated, so a million employees never sit in memory at once.
+
+Example:
+    python -m benchmarks.synthetic_data --employees 100000 --output data/employees_100k.jsonl
+"""
+
+import argparse
+import json
+import random
+from typing import Any, Dict, Iterator
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Carol", "David", "Emma", "Farhan", "Grace", "Hiro", "Ines", "Jamal",
+    "Keiko", "Liam", "Maya", "Nikolai", "Olivia", "Pedro", "Quinn", "Rahul", "Sofia", "Tomas",
+    "Uma", "Victor", "Wei", "Ximena", "Yusuf", "Zara", "Aarav", "Bianca", "Chen", "Dmitri",
+]
+LAST_NAMES = [
+    "Johnson", "Smith", "Garcia", "Chen", "Patel", "Kowalski", "Nakamura", "Okafor", "Rossi", "Silva",
+    "Müller", "Nguyen", "Kim", "Haddad", "Andersen", "Dubois", "Novak", "Ivanova", "Mensah", "Lopez",
+]
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "React", "Angular", "Vue.js", "Node.js", "Go", "Rust",
+    "C++", "C#", ".NET", "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "PostgreSQL",
+    "MongoDB", "Redis", "Kafka", "Spark", "TensorFlow", "PyTorch", "Machine Learning", "Deep Learning",
+    "NLP", "Computer Vision", "Data Engineering", "DevOps", "Swift", "Kotlin", "Flutter", "GraphQL",
+]
+PROJECT_DOMAINS = [
+    "E-commerce", "Healthcare", "Banking", "Insurance", "Logistics", "Retail", "Education", "Telecom",
+    "Energy", "Gaming", "Travel", "Media", "Government", "Manufacturing", "Real Estate",
+]
+PROJECT_KINDS = [
+    "Platform", "Dashboard", "Mobile App", "Data Pipeline", "Recommendation Engine", "Chatbot",
+    "Fraud Detection", "Analytics Portal", "Payment Gateway", "Search Service", "Migration",
+]
+AVAILABILITY = ["available", "busy", "unavailable"]
+AVAILABILITY_WEIGHTS = [0.5, 0.35, 0.15]
+
+def generate_employees(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Generate employee records deterministically.
+
+    Skill popularity is skewed (a few skills are very common, most are rare)
+    so structured filters and BM25 see realistic posting list sizes.
+
+    Args:
+        count (int): Number of employees.
+        seed (int): Random seed; the same seed always yields the same records.
+
+    Yields:
+        Dict[str, Any]: Employee records with ids 1..count.
+    """
+    rng = random.Random(seed)
+    skill_weights = [1 / (rank + 1) for rank in range(len(SKILLS))]
+
+    for employee_id in range(1, count + 1):
+        skills = set()
+        for _ in range(rng.randint(2, 6)):
+            skills.add(rng.choices(SKILLS, weights=skill_weights)[0])
+        projects = {
+            f"{rng.choice(PROJECT_DOMAINS)} {rng.choice(PROJECT_KINDS)}"
+            for _ in range(rng.randint(1, 4))
+        }
+        yield {
+            "id": employee_id,
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "skills": sorted(skills),
+            "experience_years": min(40, int(rng.expovariate(1 / 6))),
+            "projects": sorted(projects),
+            "availability": rng.choices(AVAILABILITY, weights=AVAILABILITY_WEIGHTS)[0],
+        }
+
+def write_employees(path: str, count: int, seed: int = 0) -> None:
+    """
+    Write a synthetic dataset as JSON Lines or as ``{"employees": [...]}`` JSON.
+
+    The format follows the file extension, like DATA_PATH.
+
+    Args:
+        path (str): Output file path.
+        count (int): Number of employees.
+        seed (int): Random seed.
+    """
+    with open(path, "w") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            for emp in generate_employees(count, seed):
+                f.write(json.dumps(emp, ensure_ascii=False) + "\n")
+            return
+
+        f.write('{"employees": [\n')
+        for i, emp in enumerate(generate_employees(count, seed)):
+            f.write((",\n" if i else "") + json.dumps(emp, ensure_ascii=False))
+        f.write("\n]}\n")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic employee dataset")
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="Output file (.json or .jsonl)")
+    args = parser.parse_args()
+
+    write_employees(args.output, args.employees, args.seed)
+    print(f"Wrote {args.employees} employees to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Tests for the BM25 indexes."""
+
+import pytest
+
+from app.services.bm25_service import BM25Index, MappedBM25Index, tokenize, write_bm25_index
+
+DOCUMENTS = [
+    (10, 1, "Alice Python developer, Django and FastAPI"),
+    (11, 1, "Alice led the payments project in Python"),
+    (20, 2, "Bob Java developer, Spring and Kafka"),
+    (30, 3, "Carol C++ and C# developer, Python scripting"),
+    (40, 4, "Dave Node.js developer"),
+]
+
+def doc_id(label: int) -> str:
+    return f"doc-{label}"
+
+@pytest.fixture
+def indexes(tmp_path):
+    built = BM25Index()
+    for label, employee_id, text in DOCUMENTS:
+        built.add(doc_id(label), text, employee_id)
+    assert write_bm25_index(DOCUMENTS, str(tmp_path)) == len(DOCUMENTS)
+    return built, MappedBM25Index.open(str(tmp_path), doc_id)
+
+def test_tokenize_keeps_skill_punctuation():
+    assert tokenize("C++, C# and Node.js.") == ["c++", "c#", "and", "node.js"]
+
+@pytest.mark.parametrize("query", ["python", "python developer", "c++", "node.js kafka", "rust"])
+def test_mapped_index_scores_match_built_index(indexes, query):
+    built, mapped = indexes
+    expected = dict(built.search(query, k=10))
+    found = dict(mapped.search(query, k=10))
+
+    assert found.keys() == expected.keys()
+    for key, score in expected.items():
+        assert found[key] == pytest.approx(score)
+
+def test_mapped_index_filters_employees(indexes):
+    built, mapped = indexes
+    found = mapped.search("python developer", k=10, employee_ids={1, 3})
+
+    assert {key for key, _ in found} == {"doc-10", "doc-11", "doc-30"}
+    assert found == pytest.approx(built.search("python developer", k=10, employee_ids={1, 3}))
+
+def test_mapped_index_keeps_best_k(indexes):
+    built, mapped = indexes
+    assert [key for key, _ in mapped.search("python", k=2)] == [key for key, _ in built.search("python", k=2)]
+
+def test_removed_documents_are_not_found():
+    index = BM25Index()
+    for label, employee_id, text in DOCUMENTS:
+        index.add(doc_id(label), text, employee_id)
+    index.remove("doc-20")
+
+    assert index.search("kafka", k=5) == []
+    assert len(index) == len(DOCUMENTS) - 1
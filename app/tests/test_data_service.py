@@ -0,0 +1,30 @@
+"""Tests for loading employee data."""
+
+import json
+import logging
+
+from app.services.data_service import iter_employee_chunks, validate_employee_chunk
+
+def employee(employee_id: int, name: str = "Alice Johnson") -> dict:
+    return {
+        "id": employee_id, "name": name, "skills": ["Python"], "experience_years": 3,
+        "projects": [], "availability": "available"
+    }
+
+def test_invalid_records_are_skipped():
+    valid = validate_employee_chunk([employee(1), {"id": 2, "name": "Bob"}])
+    assert [emp["id"] for emp in valid] == [1]
+
+def test_duplicate_ids_keep_the_first_record(caplog):
+    with caplog.at_level(logging.WARNING):
+        valid = validate_employee_chunk([employee(1), employee(2), employee(1, "Someone Else")])
+
+    assert [(emp["id"], emp["name"]) for emp in valid] == [(1, "Alice Johnson"), (2, "Alice Johnson")]
+    assert "duplicate id 1" in caplog.text
+
+def test_duplicate_ids_are_found_across_chunks(tmp_path):
+    path = tmp_path / "employees.jsonl"
+    path.write_text("\n".join(json.dumps(employee(employee_id)) for employee_id in (1, 2, 3, 2, 4)))
+
+    chunks = list(iter_employee_chunks(str(path), chunk_size=2))
+    assert [[emp["id"] for emp in chunk] for chunk in chunks] == [[1, 2], [3], [4]]
@@ -0,0 +1,87 @@
+"""Tests for the persistent embedding cache."""
+
+import numpy as np
+
+from app.services.embedding_cache import CachedEmbeddings, EmbeddingCache, text_key
+
+def vectors(*values: float) -> np.ndarray:
+    return np.array([[value, -value] for value in values], dtype=np.float32)
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "model")
+    cache.put_many(["a", "b"], vectors(1, 2))
+
+    found = cache.get_many(["a", "b", "c"])
+    assert set(found) == {"a", "b"}
+    assert found["b"].tolist() == [2, -2]
+
+def test_reopened_cache_reads_persisted_rows(tmp_path):
+    EmbeddingCache(str(tmp_path), "model").put_many(["a", "b"], vectors(1, 2))
+
+    cache = EmbeddingCache(str(tmp_path), "model")
+    assert len(cache) == 2
+    assert cache.get_many(["a"])["a"].tolist() == [1, -1]
+
+def test_duplicate_keys_are_stored_once(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "model")
+    cache.put_many(["a", "a"], vectors(1, 1))
+    cache.put_many(["a", "b"], vectors(5, 2))
+
+    reopened = EmbeddingCache(str(tmp_path), "model")
+    assert len(reopened) == 2
+    assert reopened.get_many(["a", "b"])["b"].tolist() == [2, -2]
+
+def test_appends_from_another_process_keep_rows_aligned(tmp_path):
+    # Two caches on one directory stand in for two workers
+    first = EmbeddingCache(str(tmp_path), "model")
+    second = EmbeddingCache(str(tmp_path), "model")
+    first.put_many(["a", "b"], vectors(1, 2))
+    second.put_many(["a", "c"], vectors(1, 3))
+    first.put_many(["d"], vectors(4))
+
+    for cache in (first, second, EmbeddingCache(str(tmp_path), "model")):
+        found = cache.get_many(["c", "d"])
+        if "c" in found:
+            assert found["c"].tolist() == [3, -3]
+        if "d" in found:
+            assert found["d"].tolist() == [4, -4]
+    reopened = EmbeddingCache(str(tmp_path), "model")
+    assert len(reopened) == 4
+    assert {key: vector[0] for key, vector in reopened.get_many(["a", "b", "c", "d"]).items()} == {
+        "a": 1, "b": 2, "c": 3, "d": 4
+    }
+
+def test_interrupted_append_is_dropped(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "model")
+    cache.put_many(["a"], vectors(1))
+    # Vectors of an append that crashed before its keys were written, and a torn key
+    with open(tmp_path / "model.f32", "ab") as f:
+        f.write(vectors(9).tobytes())
+    with open(tmp_path / "model.keys", "a") as f:
+        f.write("tor")
+
+    reopened = EmbeddingCache(str(tmp_path), "model")
+    reopened.put_many(["b"], vectors(2))
+    found = EmbeddingCache(str(tmp_path), "model").get_many(["a", "b"])
+    assert found["a"].tolist() == [1, -1]
+    assert found["b"].tolist() == [2, -2]
+
+class CountingEmbeddings:
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text)), 0.0] for text in texts]
+
+    def embed_query(self, text):
+        return [float(len(text)), 0.0]
+
+def test_cached_embeddings_only_embed_new_texts(tmp_path):
+    model = CountingEmbeddings()
+    embeddings = CachedEmbeddings(model, EmbeddingCache(str(tmp_path), "model"))
+
+    assert embeddings.embed_documents(["ab", "abc"]) == [[2, 0], [3, 0]]
+    assert embeddings.embed_documents(["abc", "abcd", "abcd"]) == [[3, 0], [4, 0], [4, 0]]
+    assert model.embedded == ["ab", "abc", "abcd"]
+    assert text_key("ab") != text_key("abc")
@@ -0,0 +1,120 @@
+"""Tests for the employee write endpoints and the write journal."""
+
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import app.api.main as main
+from app.core.config import settings
+from app.services import data_service, journal_service, retriever_service
+from app.services.journal_service import journal_length, read_journal
+from app.services.reload_service import IndexReloader
+from app.services.warmup_service import Readiness
+
+class NormalizedFakeEmbedding(DeterministicFakeEmbedding):
+    def embed_documents(self, texts):
+        vectors = np.array(super().embed_documents(texts))
+        return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).tolist()
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+def employee(name, skills, availability="available"):
+    return {"name": name, "skills": skills, "experience_years": 4, "projects": [], "availability": availability}
+
+EMPLOYEES = [
+    {"id": 1, **employee("Alice Johnson", ["Python"])},
+    {"id": 2, **employee("Bob Smith", ["React"])},
+]
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # The data file and the persisted index live in tmp_path
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "employees.json").write_text(json.dumps({"employees": EMPLOYEES}))
+    resolve = lambda file_path=settings.DATA_PATH: str(tmp_path / file_path)
+    for module in (data_service, journal_service, retriever_service):
+        monkeypatch.setattr(module, "resolve_data_path", resolve)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(retriever_service, "get_embeddings", lambda: NormalizedFakeEmbedding(size=16))
+    monkeypatch.setattr(settings, "SKILL_SYNONYMS_ENABLED", False)
+    monkeypatch.setattr(settings, "JOURNAL_COMPACT_WRITES", 100)
+
+    reloader = IndexReloader(main.build_state, main.data_fingerprint, main.watched_paths, main.write_lock, interval=0)
+    monkeypatch.setattr(main, "reloader", reloader)
+    monkeypatch.setattr(main, "readiness", Readiness())
+    reloader.load()
+    main.readiness.mark_ready("index")
+    return TestClient(main.app)
+
+def data_file(tmp_path):
+    return json.loads((tmp_path / "data" / "employees.json").read_text())["employees"]
+
+def search_names(client, **params):
+    return [emp["name"] for emp in client.get("/employees/search", params=params).json()["employees"]]
+
+def test_writes_are_journaled_without_rewriting_the_data(client, tmp_path):
+    assert client.post("/employees/3", json=employee("Carol White", ["Go"])).status_code == 201
+    assert client.put("/employees/1", json=employee("Alice Johnson", ["Rust"])).status_code == 200
+    assert client.delete("/employees/2").status_code == 204
+
+    assert data_file(tmp_path) == EMPLOYEES
+    assert [entry["op"] for entry in read_journal()[0]] == ["upsert", "upsert", "delete"]
+    assert search_names(client, skills="rust") == ["Alice Johnson"]
+    assert search_names(client) == ["Alice Johnson", "Carol White"]
+    assert main.reloader.state.describe()["documents"] == 4
+
+def test_write_errors(client):
+    assert client.post("/employees/1", json=employee("Someone", ["Go"])).status_code == 409
+    assert client.put("/employees/9", json=employee("Someone", ["Go"])).status_code == 404
+    assert client.delete("/employees/9").status_code == 404
+    assert journal_length() == 0
+
+def test_journal_is_replayed_on_reload(client):
+    client.post("/employees/3", json=employee("Carol White", ["Go"]))
+    client.delete("/employees/1")
+
+    # Replayed on top of the unchanged data file and persisted index
+    assert main.reloader.reload(force=True)
+    assert search_names(client) == ["Bob Smith", "Carol White"]
+    assert main.reloader.state.fingerprint == main.data_fingerprint()
+
+def test_compaction_folds_the_journal_into_the_data(client, tmp_path):
+    client.post("/employees/3", json=employee("Carol White", ["Go"]))
+    client.delete("/employees/1")
+    main.compaction_lock.acquire()
+    main.compact_journal(main.reloader.state)
+
+    assert [emp["id"] for emp in data_file(tmp_path)] == [2, 3]
+    assert journal_length() == 0
+    assert not main.reloader.reload(force=False)
+    assert main.reloader.reload(force=True)
+    assert search_names(client) == ["Bob Smith", "Carol White"]
+
+def test_compaction_runs_in_the_background(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "JOURNAL_COMPACT_WRITES", 2)
+    client.post("/employees/3", json=employee("Carol White", ["Go"]))
+    client.post("/employees/4", json=employee("Dan Brown", ["Go"]))
+
+    # Held by the compaction thread until it is done
+    with main.compaction_lock:
+        assert [emp["id"] for emp in data_file(tmp_path)] == [1, 2, 3, 4]
+        assert journal_length() == 0
+
+def test_writes_during_a_reload_are_kept(client, monkeypatch):
+    build = main.reloader.build
+
+    def build_with_write(*args):
+        state = build(*args)
+        # The reload does not hold the write lock while building
+        assert client.put("/employees/2", json=employee("Bob Smith", ["Go"])).status_code == 200
+        return state
+
+    monkeypatch.setattr(main.reloader, "build", build_with_write)
+    assert main.reloader.reload(force=True)
+
+    assert search_names(client, skills="go") == ["Bob Smith"]
+    assert main.reloader.state.fingerprint == main.data_fingerprint()
@@ -0,0 +1,118 @@
+"""Tests for the query parser and structured routing."""
+
+import pytest
+
+from app.core.config import settings
+from app.services.query_parser import (
+    extract_availability, extract_max_experience, extract_min_experience, extract_skills, is_follow_up, parse_query
+)
+from app.services.router_service import answer_structured, route_query
+from app.services.search_service import EmployeeSearchIndex
+
+VOCABULARY = ["Python", "React", "AWS", "C++", "Node.js"]
+
+EMPLOYEES = [
+    {"id": 1, "name": "Alice Johnson", "skills": ["Python", "AWS"], "experience_years": 6,
+     "projects": ["Billing"], "availability": "available"},
+    {"id": 2, "name": "Bob Smith", "skills": ["React"], "experience_years": 3,
+     "projects": [], "availability": "unavailable"},
+    {"id": 3, "name": "Carol White", "skills": ["Python", "React"], "experience_years": 9,
+     "projects": [], "availability": "unavailable"},
+]
+
+@pytest.fixture
+def search_index():
+    return EmployeeSearchIndex(EMPLOYEES)
+
+@pytest.mark.parametrize("query, expected", [
+    ("Who is available?", "available"),
+    ("Who is free right now?", "available"),
+    ("Who is not available?", "unavailable"),
+    ("Who is busy?", "unavailable"),
+    ("Which engineers are occupied?", "unavailable"),
+    ("find React devs not busy", "available"),
+    ("who is not occupied and knows Python", "available"),
+    ("Who isn't currently busy?", "available"),
+    ("Who is not unavailable?", "available"),
+    ("Anyone not free?", "unavailable"),
+    ("Who is available and not on the bench?", None),
+    ("Who knows Python?", None),
+])
+def test_extract_availability(query, expected):
+    assert extract_availability(query) == expected
+
+@pytest.mark.parametrize("query, minimum, maximum", [
+    ("5+ years of Python", 5, None),
+    ("at least 4 years", 4, None),
+    ("more than 4 years", 5, None),
+    ("no more than 4 years", None, 4),
+    ("less than 3 years", None, 2),
+    ("between 3 and 6 years", 3, 6),
+    ("3-6 years", 3, 6),
+])
+def test_extract_experience(query, minimum, maximum):
+    assert extract_min_experience(query) == minimum
+    assert extract_max_experience(query) == maximum
+
+def test_extract_skills_uses_vocabulary_spelling():
+    assert sorted(extract_skills("who knows python, c++ and node.js?", VOCABULARY)) == ["C++", "Node.js", "Python"]
+    assert extract_skills("who knows Java?", VOCABULARY) == []
+
+def test_follow_up_questions_are_recognized():
+    assert is_follow_up("Which of those know AWS?")
+    assert not is_follow_up("Who knows AWS?")
+
+def test_filter_question_is_fully_explained():
+    parsed = parse_query("List available engineers with Python and 5+ years", VOCABULARY)
+
+    assert parsed["filters"] == {"availability": "available", "min_experience": 5, "skills": ["Python"]}
+    assert parsed["confidence"] == 1.0
+
+@pytest.mark.parametrize("query, filters", [
+    ("find React devs not busy", {"availability": "available", "skills": ["React"]}),
+    ("who is not occupied and knows Python", {"availability": "available", "skills": ["Python"]}),
+])
+def test_negated_availability_is_explained(query, filters):
+    parsed = parse_query(query, VOCABULARY)
+
+    assert parsed["filters"] == filters
+    assert parsed["confidence"] == 1.0
+
+@pytest.mark.parametrize("query", [
+    "Who is available and not on the bench?",
+    "Who is the best Python developer?",
+    "Which of those know AWS?",
+    "Who knows Python or COBOL?",
+    "Who knows Python and worked on Billing?",
+    "Tell me about the weather",
+])
+def test_open_questions_have_no_confidence(query):
+    assert parse_query(query, VOCABULARY)["confidence"] == 0.0
+
+def test_routed_question_is_answered_from_search(search_index):
+    parsed, filters = route_query("Who knows React and is busy?", search_index, threshold=0.5)
+
+    assert parsed is not None
+    assert filters == {"availability": "unavailable", "skills": ["React"]}
+    answer, employee_ids = answer_structured(search_index, parsed)
+    assert employee_ids == [3, 2]
+    assert answer.startswith("I found 2 employees who are unavailable, with React")
+
+def test_explicit_filters_take_precedence(search_index):
+    parsed, filters = route_query("Who knows Python?", search_index, {"min_experience": 8}, threshold=0.5)
+
+    assert filters == {"skills": ["Python"], "min_experience": 8}
+    assert answer_structured(search_index, parsed)[1] == [3]
+
+def test_unknown_availability_falls_through_to_chain(search_index):
+    search_index.upsert({**EMPLOYEES[0], "availability": "unavailable"})
+
+    parsed, filters = route_query("Who is available?", search_index, threshold=0.5)
+
+    assert parsed is None
+    assert filters == {"availability": "available"}
+
+def test_routing_can_be_disabled(search_index, monkeypatch):
+    monkeypatch.setattr(settings, "STRUCTURED_ROUTING_ENABLED", False)
+
+    assert route_query("Who knows Python?", search_index, threshold=0.5)[0] is None
@@ -0,0 +1,131 @@
+"""Tests for hot reloads of the serving state."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from app.services.reload_service import IndexReloader, ServingState
+
+class Component:
+    """Stands in for an index; weakly referenceable like the real ones."""
+
+    def __init__(self, employees):
+        self.employees = list(employees)
+        self.index_to_docstore_id = {}
+
+    def __len__(self):
+        return len(self.employees)
+
+class Source:
+    """Data the stub build reads, with a fingerprint that changes with it."""
+
+    def __init__(self):
+        self.employees = ["alice"]
+        self.during_build = None
+
+    def fingerprint(self):
+        return tuple(self.employees)
+
+    def build(self, version, fingerprint, previous):
+        employees = list(self.employees)
+        if self.during_build is not None:
+            self.during_build()
+        return ServingState(version, fingerprint, Component(employees), Component(employees), None, None)
+
+@pytest.fixture
+def source():
+    return Source()
+
+@pytest.fixture
+def reloader(source):
+    swapped = []
+    reloader = IndexReloader(
+        source.build, source.fingerprint, lambda: [], threading.Lock(), interval=0, drain_timeout=5,
+        on_swap=lambda state: swapped.append(state.version)
+    )
+    reloader.swapped = swapped
+    reloader.load()
+    return reloader
+
+def test_unchanged_data_is_not_rebuilt(reloader, source):
+    assert not reloader.reload()
+
+    source.employees.append("bob")
+    assert reloader.reload()
+    assert reloader.state.version == 2
+    assert reloader.state.search_index.employees == ["alice", "bob"]
+    assert reloader.swapped == [1, 2]
+    assert reloader.state.describe()["employees"] == 2
+
+def test_builds_run_without_the_write_lock(reloader, source):
+    def write():
+        # A writer takes the lock, applies its change and records it
+        assert reloader.lock.acquire(timeout=1)
+        try:
+            assert reloader.building
+            reloader.state.search_index.employees.append("carol")
+            reloader.record(lambda state: state.search_index.employees.append("carol"))
+        finally:
+            reloader.lock.release()
+
+    source.during_build = lambda: threading.Thread(target=write).start() or time.sleep(0.2)
+    assert reloader.reload(force=True)
+
+    # The write made during the build is replayed onto the new state
+    assert reloader.state.search_index.employees == ["alice", "carol"]
+    assert not reloader.building
+
+def test_changes_are_only_recorded_during_builds(reloader):
+    reloader.record(lambda state: pytest.fail("replayed a write made before the build"))
+    assert reloader.reload(force=True)
+
+def test_failed_builds_keep_serving_the_old_state(reloader, source):
+    served = reloader.state
+
+    def fail():
+        raise ValueError("broken data")
+
+    source.during_build = fail
+    with pytest.raises(ValueError):
+        reloader.reload(force=True)
+    assert reloader.state is served
+    assert not reloader.building
+
+    source.during_build = None
+    with reloader.lock:
+        reloader.record(lambda state: None)
+    assert reloader.reload(force=True)
+
+def test_failed_replays_keep_serving_the_old_state(reloader, source):
+    served = reloader.state
+
+    def write():
+        with reloader.lock:
+            reloader.record(lambda state: 1 / 0)
+
+    source.during_build = write
+    with pytest.raises(ZeroDivisionError):
+        reloader.reload(force=True)
+    assert reloader.state is served
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return condition()
+
+def test_replaced_state_is_retired_once_released(reloader, caplog):
+    held = reloader.state
+    with caplog.at_level(logging.INFO, logger="app.services.reload_service"):
+        assert reloader.reload(force=True)
+
+        # An in-flight request still holds version 1
+        time.sleep(0.6)
+        assert 1 in reloader._draining
+        assert held.version == 1
+
+        del held
+        assert wait_for(lambda: 1 not in reloader._draining)
+    assert "Released employee data version 1" in caplog.text
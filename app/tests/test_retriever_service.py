@@ -0,0 +1,75 @@
+"""Tests for the employee vector store."""
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from app.core.config import settings
+from app.services.index_factory import index_config
+from app.services.retriever_service import EmployeeVectorStore, build_employee_documents
+
+class NormalizedFakeEmbedding(DeterministicFakeEmbedding):
+    def embed_documents(self, texts):
+        vectors = np.array(super().embed_documents(texts))
+        return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).tolist()
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+def employee(employee_id, name, skills):
+    return {
+        "id": employee_id, "name": name, "skills": skills, "experience_years": 5,
+        "projects": [], "availability": "available"
+    }
+
+EMPLOYEES = [employee(i, f"Employee {i}", ["Python", f"Skill {i}"]) for i in range(1, 21)]
+
+@pytest.fixture
+def store():
+    return EmployeeVectorStore.from_employees(EMPLOYEES, NormalizedFakeEmbedding(size=16), index_config(index_type="hnsw"))
+
+def search(store, text, k=100, employee_ids=None):
+    vector = store.embeddings.embed_query(text)
+    return [doc.metadata["id"] for doc, _ in store.search_with_relevance(vector, k, employee_ids)]
+
+def test_hnsw_writes_skip_stale_vectors_without_rebuilding(store, monkeypatch):
+    monkeypatch.setattr(settings, "HNSW_REBUILD_STALE_RATIO", 1.0)
+    index = store.index
+    documents = index.ntotal
+
+    store.delete_employee(3)
+    store.upsert_employee(employee(4, "Renamed Person", ["Rust"]))
+
+    assert store.index is index
+    assert index.ntotal > documents
+    found = search(store, "Renamed Person")
+    assert 3 not in found
+    assert found.count(4) == 2
+    assert search(store, "Employee 4", employee_ids={3, 4}) == [4, 4]
+
+    batch = store.search_with_relevance_batch([store.embeddings.embed_query("Employee 3")], 100)
+    assert len(batch[0]) == len(store.index_to_docstore_id)
+
+def test_hnsw_graph_is_rebuilt_once_stale(store, monkeypatch):
+    monkeypatch.setattr(settings, "HNSW_REBUILD_STALE_RATIO", 0.1)
+
+    store.delete_employee(1)
+    assert store._stale_offsets
+    for employee_id in (2, 3):
+        store.delete_employee(employee_id)
+
+    assert not store._stale_offsets
+    assert store.index.ntotal == len(store.index_to_docstore_id)
+    assert not {1, 2, 3} & set(search(store, "Employee 2"))
+
+def test_compact_keeps_replaced_vectors(store, monkeypatch):
+    monkeypatch.setattr(settings, "HNSW_REBUILD_STALE_RATIO", 1.0)
+    renamed = employee(5, "Renamed Person", ["Rust"])
+    store.upsert_employee(renamed)
+    profile = build_employee_documents(renamed)[0].page_content
+    assert search(store, profile, k=1) == [5]
+
+    store.compact()
+
+    assert store.index.ntotal == len(store.index_to_docstore_id)
+    assert search(store, profile, k=1) == [5]
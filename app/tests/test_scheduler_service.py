@@ -0,0 +1,66 @@
+"""Tests for the LLM scheduler."""
+
+import asyncio
+
+import pytest
+
+from app.services.scheduler_service import LLMScheduler, SchedulerBusyError
+
+def test_queue_full_is_rejected():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, queue_depth=0, queue_timeout=1, retry_after=1)
+        release = await scheduler.acquire()
+        with pytest.raises(SchedulerBusyError) as error:
+            await scheduler.acquire()
+        release()
+        return error.value.status_code
+
+    assert asyncio.run(scenario()) == 429
+
+def test_timed_out_waits_do_not_leak_slots():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, queue_depth=10, queue_timeout=0.01, retry_after=1)
+        release = await scheduler.acquire()
+        for _ in range(5):
+            with pytest.raises(SchedulerBusyError):
+                await scheduler.acquire()
+        release()
+        await asyncio.sleep(0)
+
+        release = await asyncio.wait_for(scheduler.acquire(), timeout=1)
+        assert scheduler.running == 1 and scheduler.waiting == 0
+        release()
+        return scheduler._semaphore._value
+
+    assert asyncio.run(scenario()) == 1
+
+def test_slot_granted_as_the_wait_times_out_is_returned():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, queue_depth=10, queue_timeout=0.05, retry_after=1)
+        release = await scheduler.acquire()
+        loop = asyncio.get_running_loop()
+        # Free the slot at the moment the queued request gives up
+        loop.call_later(0.05, release)
+        try:
+            (await scheduler.acquire())()
+        except SchedulerBusyError:
+            pass
+        await asyncio.sleep(0.01)
+        return scheduler._semaphore._value, scheduler.running
+
+    assert asyncio.run(scenario()) == (1, 0)
+
+def test_cancelled_wait_does_not_leak_slot():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, queue_depth=10, queue_timeout=5, retry_after=1)
+        release = await scheduler.acquire()
+        waiting = asyncio.ensure_future(scheduler.acquire())
+        await asyncio.sleep(0.01)
+        release()
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        await asyncio.sleep(0.01)
+        return scheduler._semaphore._value, scheduler.waiting
+
+    assert asyncio.run(scenario()) == (1, 0)
@@ -0,0 +1,115 @@
+"""Tests for the employee search index."""
+
+import json
+import random
+
+import pytest
+
+from app.services.search_service import EmployeeSearchIndex, decode_cursor, encode_cursor, parse_sort
+
+def employee(employee_id, name, skills, experience_years, availability="available", projects=()):
+    return {
+        "id": employee_id, "name": name, "skills": list(skills), "experience_years": experience_years,
+        "projects": list(projects), "availability": availability
+    }
+
+EMPLOYEES = [
+    employee(10, "Dana Scully", ["Python", "AWS"], 8, projects=["X Files"]),
+    employee(11, "Fox Mulder", ["Python"], 9, "unavailable"),
+    employee(12, "Walter Skinner", ["Java"], 20),
+    employee(13, "John Doggett", ["Python", "React"], 8, projects=["X Files"]),
+    employee(14, "Monica Reyes", ["React"], 5, "unavailable"),
+]
+
+@pytest.fixture
+def index():
+    return EmployeeSearchIndex(EMPLOYEES)
+
+def all_pages(index, limit, **search):
+    ids, cursor = [], None
+    while True:
+        total, page, cursor = index.search_page(limit=limit, cursor=cursor, **search)
+        ids.extend(page)
+        if cursor is None:
+            return total, ids
+
+def test_filters_combine(index):
+    assert [emp["id"] for emp in index.search(skills=["python"], min_experience=9)] == [11]
+    assert [emp["id"] for emp in index.search(availability="UNAVAILABLE")] == [11, 14]
+    assert [emp["id"] for emp in index.search(skills=[["java", "react"]])] == [12, 13, 14]
+    assert [emp["id"] for emp in index.search(project="x files", name="dana")] == [10]
+
+# Ties are in load order, reversed for descending sorts
+@pytest.mark.parametrize("sort, expected", [
+    (None, [10, 11, 12, 13, 14]),
+    ("name", [10, 11, 13, 14, 12]),
+    ("-experience", [12, 11, 13, 10, 14]),
+    ("experience", [14, 10, 13, 11, 12]),
+])
+def test_sort_orders_break_ties_by_load_position(index, sort, expected):
+    assert index.search_page(sort=sort)[1] == expected
+
+@pytest.mark.parametrize("limit", [1, 2, 4, 5])
+@pytest.mark.parametrize("sort", [None, "name", "-name", "experience", "-experience"])
+def test_pages_concatenate_to_the_full_result(index, sort, limit):
+    assert all_pages(index, limit, sort=sort) == (5, index.search_page(sort=sort)[1])
+    assert all_pages(index, limit, skills=["python"], sort=sort) == (3, index.search_page(skills=["python"], sort=sort)[1])
+
+def test_last_page_has_no_cursor(index):
+    total, ids, cursor = index.search_page(limit=5)
+    assert (total, cursor) == (5, None)
+    assert index.search_page(limit=2)[2] is not None
+
+def test_cursor_is_stable_under_writes(index):
+    _, first, cursor = index.search_page(sort="-experience", limit=2)
+    assert first == [12, 11]
+
+    # Employees added before or removed after the cursor do not shift the next page
+    index.upsert(employee(15, "Alex Krycek", ["Python"], 30))
+    index.delete(10)
+    _, second, _ = index.search_page(sort="-experience", limit=2, cursor=cursor)
+    assert second == [13, 14]
+
+def test_cursor_must_match_the_sort_order(index):
+    cursor = index.search_page(sort="name", limit=1)[2]
+    with pytest.raises(ValueError):
+        index.search_page(sort="experience", limit=1, cursor=cursor)
+    with pytest.raises(ValueError):
+        index.search_page(limit=1, cursor="not a cursor")
+    with pytest.raises(ValueError):
+        parse_sort("salary")
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("-name", ("zoë", 3, 17))
+    assert decode_cursor(cursor, "-name") == ("zoë", 3, 17)
+
+def test_fuzzy_name_search_sorts_by_relevance(index):
+    total, ids, _ = index.search_page(name="mulderr", fuzzy=True)
+    assert (total, ids[0]) == (1, 11)
+
+def test_projected_serialization(index):
+    employees = json.loads(index.serialize([13, 10], ["id", "name"]))
+    assert employees == [{"id": 13, "name": "John Doggett"}, {"id": 10, "name": "Dana Scully"}]
+    assert json.loads(index.serialize([12]))[0] == EMPLOYEES[2]
+
+def test_filtered_pages_match_a_full_sort():
+    rng = random.Random(7)
+    skills = ["Python", "React", "AWS", "Go"]
+    employees = [
+        employee(i, f"Name {rng.randint(0, 20)}", rng.sample(skills, rng.randint(1, 2)), rng.randint(0, 10),
+                 rng.choice(["available", "unavailable"]))
+        for i in range(200)
+    ]
+    index = EmployeeSearchIndex(employees)
+
+    # Dense filters walk the presorted keys and sparse ones select with a heap
+    for search in [{"availability": "available"}, {"skills": ["python", "go"]}, {"min_experience": 10}]:
+        matches = index.search(**search)
+        for sort, key, reverse in [
+            ("name", lambda emp: emp["name"], False),
+            ("-experience", lambda emp: emp["experience_years"], True),
+        ]:
+            # Ties are in load order, which is id order here, reversed for descending sorts
+            expected = sorted(matches, key=lambda emp: (key(emp), emp["id"]), reverse=reverse)
+            for limit in (1, 7, 50):
+                assert all_pages(index, limit, sort=sort, **search) == (len(matches), [emp["id"] for emp in expected])
@@ -0,0 +1,96 @@
+"""Tests for the skill synonym table."""
+
+import logging
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.services.embedding_cache import CachedEmbeddings
+from app.services.synonym_service import SkillSynonyms, load_synonym_overrides
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds texts by their first keyword, so synonyms are chosen by the test."""
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = keywords
+        self.calls: List[List[str]] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            vector = np.full(len(self.keywords) + 1, 0.01)
+            for i, keyword in enumerate(self.keywords):
+                if keyword in text.lower():
+                    vector[i] = 1.0
+                    break
+            else:
+                vector[-1] = 1.0
+            vectors.append(vector.tolist())
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+class RecordingCache:
+    """Embedding cache that records writes instead of persisting them."""
+
+    def __init__(self):
+        self.keys: List[str] = []
+
+    def get_many(self, keys):
+        return {}
+
+    def put_many(self, keys, vectors):
+        self.keys.extend(keys)
+
+NO_OVERRIDES = {"groups": [], "exclude": []}
+
+def test_nearest_skills_are_synonyms():
+    synonyms = SkillSynonyms(
+        ["React", "React Native", "Python"], KeywordEmbeddings(["react", "python"]), overrides=NO_OVERRIDES
+    )
+    assert synonyms.expand("react") == ["react", "React Native"]
+    assert synonyms.expand("Python") == ["Python"]
+
+def test_overrides_add_groups_and_exclude_pairs():
+    overrides = {"groups": [["ML", "Machine Learning"]], "exclude": [["Java", "JavaScript"]]}
+    synonyms = SkillSynonyms(
+        ["Machine Learning", "Java", "JavaScript"], KeywordEmbeddings(["machine", "java"]), overrides=overrides
+    )
+    assert synonyms.expand("ML") == ["ML", "Machine Learning"]
+    assert synonyms.expand("Java") == ["Java"]
+
+def test_extend_adds_new_skills_as_neighbours():
+    synonyms = SkillSynonyms(["React"], KeywordEmbeddings(["react"]), overrides=NO_OVERRIDES)
+    synonyms.extend(["React Native"])
+    assert len(synonyms) == 2
+    assert synonyms.expand("React") == ["React", "React Native"]
+
+def test_unknown_terms_stay_out_of_the_embedding_cache():
+    embeddings = KeywordEmbeddings(["react"])
+    cache = RecordingCache()
+    synonyms = SkillSynonyms(
+        ["React"], CachedEmbeddings(embeddings, cache), overrides=NO_OVERRIDES, max_unknown=2
+    )
+
+    for term in ["reactjs", "other-1", "other-2", "other-3"]:
+        synonyms.expand(term)
+
+    assert cache.keys == []
+    assert synonyms.expand("reactjs") == ["reactjs", "React"]
+    assert len(synonyms._unknown) == 2
+
+def test_overrides_resolve_relative_to_the_application_root(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    overrides = load_synonym_overrides("data/skill_synonyms.json")
+
+    assert overrides["groups"]
+
+def test_missing_overrides_are_reported(caplog):
+    with caplog.at_level(logging.WARNING):
+        overrides = load_synonym_overrides("data/no_such_file.json")
+
+    assert overrides == {"groups": [], "exclude": []}
+    assert "no_such_file.json" in caplog.text
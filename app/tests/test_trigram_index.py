@@ -0,0 +1,69 @@
+"""Tests for the trigram name index."""
+
+import pytest
+
+from app.services.trigram_index import TrigramIndex, padded_trigrams, trigrams
+
+@pytest.fixture
+def index():
+    index = TrigramIndex()
+    index.add(1, ["Alice Johnson"])
+    index.add(2, ["Bob Johnston"])
+    index.add(3, ["Carol Li"])
+    index.add(4, ["Payments Platform", "Search Revamp"])
+    return index
+
+def test_trigrams():
+    assert trigrams("abcd") == {"abc", "bcd"}
+    assert trigrams("ab") == set()
+    assert padded_trigrams("ab") == {"  a", " ab", "ab "}
+
+def test_contains_is_case_insensitive_substring(index):
+    assert index.contains("JOHNS") == {1, 2}
+    assert index.contains("johnst") == {2}
+    assert index.contains("revamp") == {4}
+    assert index.contains("nosuchname") == set()
+
+def test_contains_verifies_trigram_order(index):
+    # "abcab" has both trigrams of "cabc" without containing it
+    index.add(5, ["abcab"])
+    assert index.contains("cabc") == set()
+    assert index.contains("bca") == {5}
+
+def test_short_needles_scan_texts(index):
+    assert index.contains("li") == {3, 1}
+    assert index.contains("") == {1, 2, 3, 4}
+
+def test_fuzzy_matches_misspelt_words(index):
+    matches = index.fuzzy("Jonson", threshold=0.3)
+
+    assert [key for key, _ in matches] == [1]
+    assert all(0.3 <= score < 1.0 for _, score in matches)
+    assert index.fuzzy("Jonson", threshold=0.9) == []
+
+def test_fuzzy_matches_whole_text(index):
+    assert index.fuzzy("alice johnson", threshold=0.9) == [(1, 1.0)]
+
+def test_lookup_scores_substrings_as_exact(index):
+    scores = index.lookup("johnso", threshold=0.3)
+
+    assert scores[1] == 1.0
+    assert 0.3 <= scores[2] < 1.0
+
+def test_add_replaces_and_remove_forgets(index):
+    index.add(1, ["Alicia Keys"])
+    assert index.contains("johnson") == set()
+    assert index.contains("keys") == {1}
+
+    index.remove(1)
+    index.remove(99)
+    assert index.contains("keys") == set()
+    assert index.fuzzy("alicia", threshold=0.3) == []
+    assert len(index) == 3
+
+def test_removing_one_key_keeps_shared_terms(index):
+    index.add(5, ["Carol Smith"])
+    index.remove(3)
+
+    assert index.contains("carol") == {5}
+    assert [key for key, _ in index.fuzzy("karol", threshold=0.3)] == [5]